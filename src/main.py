@@ -1,67 +1,125 @@
 import sys
-import os
 import time
 
-# Se importan los módulos correspondientes a los algoritmos implementados
-from src.problema2.kruskal import kruskal
-from src.problema2.prim import prim
-from src.problema3.bipartite import is_bipartite, print_bipartite_result
+# Los algoritmos y los lectores de archivos se importan dentro de cada función,
+# de modo que cada subcomando carga solo los módulos que usa (ver `COMMANDS`)
 
 def load_graph_adjacency_list(filename):
     """
     Carga un grafo desde un archivo en formato de lista de adyacencias.
     
+    El archivo se lee en streaming y las aristas se guardan directamente
+    en arreglos tipados (una sola copia por arista, u < v), listos para Kruskal.
+    Si el archivo está en formato binario, se mapea en memoria sin copias;
+    si contiene una matriz o un grafo CSR, se extraen sus aristas.
+    
     Args:
         filename: Ruta al archivo.
     
     Returns:
-        Tupla (grafo, número de vértices)
+        Tupla (EdgeList, número de vértices)
     """
+    from src.utils.binary_format import KIND_EDGES, is_binary_graph_file, load_binary_graph
+    from src.utils.edge_list import read_adjacency_list
+    from src.utils.graph import Graph
+    
+    if is_binary_graph_file(filename):
+        graph = load_binary_graph(filename)
+        if graph.kind == KIND_EDGES:
+            return graph.edges(), graph.n
+        return Graph.from_binary(graph).edges(), graph.n
+    
     with open(filename, 'r') as f:
-        lines = f.readlines()
-        
-        n = int(lines[0].strip())
-        
-        graph = {}
-        for i in range(1, n+1):
-            if i-1 < len(lines):
-                line = lines[i-1].strip()
-                if ":" in line:
-                    vertex, edges = line.split(":", 1)
-                    vertex = int(vertex.strip())
-                    graph[vertex] = []
-                    
-                    if edges.strip():
-                        for edge in edges.strip().split(","):
-                            edge = edge.strip()
-                            if "-" in edge:
-                                neighbor, weight = edge.split("-", 1)
-                                graph[vertex].append((int(neighbor.strip()), int(weight.strip())))
-    
-    return graph, n
+        return read_adjacency_list(f)
+
+def load_graph_csr(filename):
+    """
+    Carga un grafo en formato de lista de adyacencias como arreglos CSR.
+    
+    Args:
+        filename: Ruta al archivo.
+    
+    Returns:
+        Tupla ((offsets, targets, weights), número de vértices)
+    """
+    from src.utils.binary_format import KIND_CSR, is_binary_graph_file, load_binary_graph
+    
+    if is_binary_graph_file(filename):
+        graph = load_binary_graph(filename)
+        if graph.kind == KIND_CSR:
+            return graph.csr(), graph.n
+    
+    edges, n = load_graph_adjacency_list(filename)
+    return edges.to_csr(n), n
+
+def is_adjacency_list_file(filename):
+    """
+    Indica si un archivo está en formato de lista de adyacencias ("v: vecino-peso").
+    
+    Los archivos binarios que no contienen una matriz densa también se
+    consideran listas de adyacencias.
+    """
+    from src.utils.binary_format import KIND_DENSE, is_binary_graph_file, load_binary_graph
+    
+    if is_binary_graph_file(filename):
+        return load_binary_graph(filename).kind != KIND_DENSE
+    
+    with open(filename, 'r') as f:
+        f.readline()
+        return ":" in f.readline()
 
 def load_graph_adjacency_matrix(filename):
     """
     Carga un grafo desde un archivo en formato de matriz de adyacencias.
     
+    Con NumPy, los n x n pesos se convierten en una sola llamada, sin crear
+    un objeto de Python por cada número (ver `read_adjacency_matrix`).
+    
     Args:
         filename: Ruta al archivo.
     
     Returns:
         Tupla (matriz de adyacencias, número de vértices)
     """
-    with open(filename, 'r') as f:
-        lines = f.readlines()
-        
-        n = int(lines[0].strip())
-        
-        matrix = []
-        for i in range(1, n+1):
-            if i-1 < len(lines):
-                row = list(map(int, lines[i].strip().split()))
-                matrix.append(row)
-    
-    return matrix, n
+    from src.utils.binary_format import is_binary_graph_file, load_binary_graph
+    from src.utils.text_format import read_adjacency_matrix
+    
+    if is_binary_graph_file(filename):
+        graph = load_binary_graph(filename)
+        return graph.matrix(), graph.n
+    
+    with open(filename, 'rb') as f:
+        return read_adjacency_matrix(f)
+
+def load_bipartite_case(filename):
+    """
+    Carga un caso de bipartición como arreglos CSR junto con su resultado esperado.
+    
+    Las líneas de verificación (IS_BIPARTITE, PARTITION_A, PARTITION_B) se
+    interpretan en la misma lectura que las filas de vecinos.
+    
+    Args:
+        filename: Ruta al archivo.
+    
+    Returns:
+        Tupla ((offsets, targets), número de vértices, resultado esperado).
+        El resultado esperado es (es_bipartito, particiones o None), o None si
+        el archivo no lo incluye (por ejemplo, en formato binario).
+    """
+    from src.utils.binary_format import KIND_CSR, is_binary_graph_file, load_binary_graph
+    from src.utils.graph import Graph
+    from src.utils.text_format import read_neighbor_lists
+    
+    if is_binary_graph_file(filename):
+        graph = load_binary_graph(filename)
+        # Las listas de aristas y las matrices se convierten a CSR
+        if graph.kind != KIND_CSR:
+            graph = Graph.from_binary(graph)
+        offsets, targets, _ = graph.csr()
+        return (offsets, targets), graph.n, None
+    
+    with open(filename, 'rb') as f:
+        return read_neighbor_lists(f)
 
 def load_bipartite_graph(filename):
     """
@@ -71,130 +129,427 @@ def load_bipartite_graph(filename):
         filename: Ruta al archivo.
     
     Returns:
-        Tupla (grafo, número de vértices)
+        Tupla (vista {vertice: vecinos} del grafo, número de vértices)
     """
-    with open(filename, 'r') as f:
-        lines = f.readlines()
-        
-        n = int(lines[0].strip())
-        
-        graph = {}
-        for i in range(1, n+1):
-            if i < len(lines):
-                neighbors = list(map(int, lines[i].strip().split()))
-                graph[i-1] = neighbors
+    from src.utils.binary_format import CSRAdjacency
+    
+    (offsets, targets), n, _ = load_bipartite_case(filename)
+    return CSRAdjacency(offsets, targets), n
+
+def load_bipartite_csr(filename):
+    """
+    Carga un grafo para verificación de bipartición como arreglos CSR.
+    
+    Args:
+        filename: Ruta al archivo.
+    
+    Returns:
+        Tupla ((offsets, targets), número de vértices)
+    """
+    csr, n, _ = load_bipartite_case(filename)
+    return csr, n
+
+def load_graph(filename, graph_format="kruskal"):
+    """
+    Carga un archivo de casos de prueba como un Graph compartido.
+    
+    El Graph resultante puede pasarse a `kruskal`, `boruvka`, `prim` e
+    `is_bipartite` sin volver a leer ni convertir el archivo.
+    
+    Args:
+        filename: Ruta al archivo (de texto o binario).
+        graph_format: Formato del archivo de texto: "kruskal" (lista de
+                      adyacencias), "prim" (matriz) o "bipartito" (listas de vecinos).
     
-    return graph, n
+    Returns:
+        Graph con el grafo del archivo.
+    """
+    from src.utils.binary_format import is_binary_graph_file, load_binary_graph
+    from src.utils.graph import Graph
+    
+    if is_binary_graph_file(filename):
+        return Graph.from_binary(load_binary_graph(filename))
+    
+    if graph_format == "kruskal":
+        edges, n = load_graph_adjacency_list(filename)
+        return Graph.from_edges(edges, n)
+    if graph_format == "prim":
+        matrix, _ = load_graph_adjacency_matrix(filename)
+        return Graph.from_matrix(matrix)
+    if graph_format == "bipartito":
+        (offsets, targets), _ = load_bipartite_csr(filename)
+        return Graph(offsets, targets)
+    raise ValueError(f"Formato desconocido: {graph_format}")
+
+def convert_to_binary(graph_format, source, target):
+    """
+    Convierte un archivo de texto de casos de prueba al formato binario.
+    
+    Args:
+        graph_format: "kruskal" (lista de adyacencias), "prim" (matriz)
+                      o "bipartito" (listas de vecinos).
+        source: Ruta del archivo de texto.
+        target: Ruta del archivo binario de salida.
+    """
+    from src.utils.binary_format import write_csr, write_dense, write_edges
+    
+    if graph_format == "kruskal":
+        edges, n = load_graph_adjacency_list(source)
+        write_edges(target, edges, n)
+    elif graph_format == "prim":
+        matrix, n = load_graph_adjacency_matrix(source)
+        write_dense(target, matrix)
+    elif graph_format == "bipartito":
+        (offsets, targets), n = load_bipartite_csr(source)
+        write_csr(target, offsets, targets)
+    else:
+        raise ValueError(f"Formato desconocido: {graph_format}")
+
+def _cached_entry(cache, test_file, algorithm):
+    """
+    Consulta la caché de resultados antes de leer el archivo.
+    
+    Returns:
+        Tupla (clave, entrada); ambas son None si no hay caché, y la entrada
+        es None si el resultado aún no está guardado.
+    """
+    if cache is None:
+        return None, None
+    key = cache.key(test_file, algorithm)
+    return key, cache.get(key)
 
-def run_kruskal_test(test_file):
+def _print_mst_entry(entry):
+    # Se imprime el resumen de un MST a partir de su entrada de caché
+    print(f"MST encontrado con {len(entry['edges'])} aristas")
+    print(f"Peso total del MST: {entry['weight']}")
+    if entry["components"] > 1:
+        print(f"El grafo no es conexo: se obtuvo un bosque de expansión mínima con {entry['components']} componentes")
+
+def run_kruskal_test(test_file, cache=None):
     """
     Ejecuta el algoritmo de Kruskal en un archivo de prueba.
     
     Args:
         test_file: Ruta al archivo de prueba.
+        cache: ResultCache opcional; si contiene el resultado, no se lee el grafo.
     """
+    from src.problema2.kruskal import kruskal
+    from src.utils import instrumentation
+    from src.utils.result_cache import mst_entry
+    
     print(f"\nEjecutando Kruskal en {test_file}...")
     
-    graph, n = load_graph_adjacency_list(test_file)
+    key, entry = _cached_entry(cache, test_file, "kruskal")
+    if entry is not None:
+        _print_mst_entry(entry)
+        print("Resultado obtenido de la caché")
+        return
+    
+    with instrumentation.phase("main.parse"):
+        edges, n = load_graph_adjacency_list(test_file)
     
     start_time = time.time()
-    mst = kruskal(graph, n)
+    mst = kruskal(edges, n)
     end_time = time.time()
     
-    total_weight = sum(weight for _, _, weight in mst)
+    entry = mst_entry(mst, n)
+    if cache is not None:
+        cache.put(key, entry)
     
-    print(f"MST encontrado con {len(mst)} aristas")
-    print(f"Peso total del MST: {total_weight}")
+    _print_mst_entry(entry)
     print(f"Tiempo de ejecución: {end_time - start_time:.6f} segundos")
 
-def run_prim_test(test_file):
+def run_boruvka_test(test_file, workers=None, cache=None):
+    """
+    Ejecuta el algoritmo de Borůvka en un archivo de prueba.
+    
+    Args:
+        test_file: Ruta al archivo de prueba (lista de adyacencias).
+        workers: Número de procesos; por defecto, el número de núcleos.
+        cache: ResultCache opcional; si contiene el resultado, no se lee el grafo.
+    """
+    from src.problema2.boruvka import boruvka
+    from src.utils import instrumentation
+    from src.utils.result_cache import mst_entry
+    
+    print(f"\nEjecutando Borůvka en {test_file}...")
+    
+    key, entry = _cached_entry(cache, test_file, "boruvka")
+    if entry is not None:
+        _print_mst_entry(entry)
+        print("Resultado obtenido de la caché")
+        return
+    
+    with instrumentation.phase("main.parse"):
+        edges, n = load_graph_adjacency_list(test_file)
+    
+    start_time = time.time()
+    mst = boruvka(edges, n, workers)
+    end_time = time.time()
+    
+    entry = mst_entry(mst, n)
+    if cache is not None:
+        cache.put(key, entry)
+    
+    _print_mst_entry(entry)
+    print(f"Tiempo de ejecución: {end_time - start_time:.6f} segundos")
+
+def run_prim_test(test_file, cache=None):
     """
     Ejecuta el algoritmo de Prim en un archivo de prueba.
     
     Args:
         test_file: Ruta al archivo de prueba.
+        cache: ResultCache opcional; si contiene el resultado, no se lee el grafo.
     """
+    from src.problema2.prim import prim_auto, prim_dense
+    from src.utils import instrumentation
+    from src.utils.result_cache import mst_entry
+    
     print(f"\nEjecutando Prim en {test_file}...")
     
-    matrix, n = load_graph_adjacency_matrix(test_file)
+    key, entry = _cached_entry(cache, test_file, "prim")
+    if entry is not None:
+        _print_mst_entry(entry)
+        print("Resultado obtenido de la caché")
+        return
     
-    start_time = time.time()
-    mst = prim(matrix)
-    end_time = time.time()
+    # Los archivos en lista de adyacencias se procesan sin construir la matriz
+    if is_adjacency_list_file(test_file):
+        with instrumentation.phase("main.parse"):
+            csr, n = load_graph_csr(test_file)
+        start_time = time.time()
+        mst = prim_auto(*csr)
+        end_time = time.time()
+    else:
+        with instrumentation.phase("main.parse"):
+            matrix, n = load_graph_adjacency_matrix(test_file)
+        start_time = time.time()
+        mst = prim_dense(matrix)
+        end_time = time.time()
     
-    total_weight = sum(weight for _, _, weight in mst)
+    entry = mst_entry(mst, n)
+    if cache is not None:
+        cache.put(key, entry)
     
-    print(f"MST encontrado con {len(mst)} aristas")
-    print(f"Peso total del MST: {total_weight}")
+    _print_mst_entry(entry)
     print(f"Tiempo de ejecución: {end_time - start_time:.6f} segundos")
 
-def run_bipartite_test(test_file):
+def run_bipartite_test(test_file, cache=None, workers=1):
     """
     Ejecuta la verificación de grafo bipartito en un archivo de prueba.
     
     Args:
         test_file: Ruta al archivo de prueba.
+        cache: ResultCache opcional; si contiene el resultado, no se lee el grafo.
+        workers: Número de procesos; con más de uno (o None, todos los núcleos)
+                 las componentes conexas se colorean en paralelo.
     """
+    from src.problema3.bipartite import is_bipartite_csr, print_bipartite_result
+    from src.problema3.parallel_bipartite import is_bipartite_parallel
+    from src.utils import instrumentation
+    from src.utils.graph import Graph
+    from src.utils.result_cache import bipartite_entry
+    
     print(f"\nVerificando bipartición en {test_file}...")
     
-    graph, n = load_bipartite_graph(test_file)
+    key, entry = _cached_entry(cache, test_file, "bipartite")
+    if entry is not None:
+        partitions = entry["partitions"]
+        print_bipartite_result(entry["is_bipartite"], partitions and (set(partitions[0]), set(partitions[1])))
+        print("Resultado obtenido de la caché")
+        return
+    
+    with instrumentation.phase("main.parse"):
+        (offsets, targets), n, expected = load_bipartite_case(test_file)
     
     start_time = time.time()
-    result, partitions = is_bipartite(graph, n)
+    if workers == 1:
+        result, partitions = is_bipartite_csr(offsets, targets, as_sets=True)
+    else:
+        result, partitions = is_bipartite_parallel(Graph(offsets, targets), n, workers)
     end_time = time.time()
     
+    if cache is not None:
+        cache.put(key, bipartite_entry(result, partitions))
+    
     print_bipartite_result(result, partitions)
+    if expected is not None:
+        print("Coincide con el resultado esperado" if expected[0] == result
+              else "No coincide con el resultado esperado")
     print(f"Tiempo de ejecución: {end_time - start_time:.6f} segundos")
 
-def main():
+def _algorithm_arguments(parser):
+    # Argumentos comunes de los subcomandos que ejecutan un algoritmo sobre un archivo
+    parser.add_argument("archivo", help="Archivo de prueba (de texto o binario)")
+    parser.add_argument("--cache", action="store_true", help="Reutilizar los resultados guardados en la caché en disco")
+    parser.add_argument("--instrumentar", metavar="METRICAS", default=None,
+                        help="Exportar tiempos por fase y contadores al archivo JSON indicado")
+
+def _parallel_arguments(parser):
+    _algorithm_arguments(parser)
+    parser.add_argument("procesos", nargs="?", type=int, default=None,
+                        help="Número de procesos (0 para usar todos los núcleos)")
+
+def _generator_arguments(parser):
+    parser.add_argument("numero_casos", nargs="?", type=int, default=100, help="Número de casos a generar")
+    parser.add_argument("--procesos", type=int, default=1, help="Número de procesos (0 para usar todos los núcleos)")
+    parser.add_argument("--semilla", type=int, default=None, help="Semilla para reproducir la suite")
+    parser.add_argument("--binario", action="store_true", help="Guardar también cada caso en formato binario")
+
+def _conversion_arguments(parser):
+    parser.add_argument("formato", choices=("kruskal", "prim", "bipartito"), help="Formato del archivo de texto")
+    parser.add_argument("entrada", help="Archivo de texto")
+    parser.add_argument("salida", help="Archivo binario de salida")
+
+def _batch_arguments(parser):
+    parser.add_argument("rutas", nargs="+", help="Directorios, patrones glob o archivos")
+    parser.add_argument("--algoritmos", help="Algoritmos separados por comas (por defecto, según el directorio)")
+    parser.add_argument("--procesos", type=int, default=None, help="Número de procesos (0 para usar todos los núcleos)")
+    parser.add_argument("--ordenado", action="store_true", help="Emitir los resultados en el orden de los archivos")
+
+def _run_algorithm(args, run, **options):
     """
-    Función principal que permite ejecutar los algoritmos implementados.
+    Ejecuta una función run_*_test con las opciones --cache e --instrumentar.
+    
+    Args:
+        args: Argumentos del subcomando.
+        run: Función que recibe el archivo, la caché y `options`.
     """
-    if len(sys.argv) < 2:
-        print("Uso: python main.py <opción> [archivo]")
-        print("Opciones:")
-        print("  1: Ejecutar Kruskal")
-        print("  2: Ejecutar Prim")
-        print("  3: Verificar grafo bipartito")
-        print("  4: Generar casos de prueba")
-        return
+    cache = None
+    if args.cache:
+        from src.utils.result_cache import ResultCache
+        cache = ResultCache()
     
-    option = sys.argv[1]
-    
-    if option == "1":
-        if len(sys.argv) < 3:
-            print("Se requiere un archivo para ejecutar Kruskal.")
-            return
-        run_kruskal_test(sys.argv[2])
-    
-    elif option == "2":
-        if len(sys.argv) < 3:
-            print("Se requiere un archivo para ejecutar Prim.")
-            return
-        run_prim_test(sys.argv[2])
-    
-    elif option == "3":
-        if len(sys.argv) < 3:
-            print("Se requiere un archivo para verificar bipartición.")
-            return
-        run_bipartite_test(sys.argv[2])
-    
-    elif option == "4":
-        from src.utils.test_generator import save_test_cases
-        n_cases = 100
-        if len(sys.argv) > 2:
-            try:
-                n_cases = int(sys.argv[2])
-            except ValueError:
-                print("El número de casos debe ser un entero.")
-                return
-        
-        print(f"Generando {n_cases} casos de prueba...")
-        save_test_cases("tests", n_cases)
-        print("Casos de prueba generados correctamente.")
+    if args.instrumentar is None:
+        run(args.archivo, cache=cache, **options)
+        return 0
     
-    else:
-        print("Opción no válida.")
+    # Se registran fases y contadores y se exportan en JSON
+    from src.utils import instrumentation
+    instrumentation.enable()
+    try:
+        run(args.archivo, cache=cache, **options)
+    finally:
+        instrumentation.disable().to_json(args.instrumentar)
+    print(f"Métricas guardadas en {args.instrumentar}")
+    return 0
+
+def _command_kruskal(args):
+    return _run_algorithm(args, run_kruskal_test)
+
+def _command_prim(args):
+    return _run_algorithm(args, run_prim_test)
+
+def _command_bipartite(args):
+    # Sin el argumento de procesos, la verificación es secuencial
+    workers = 1 if args.procesos is None else args.procesos or None
+    return _run_algorithm(args, run_bipartite_test, workers=workers)
+
+def _command_generate(args):
+    from src.utils.test_generator import save_test_cases
+    
+    print(f"Generando {args.numero_casos} casos de prueba...")
+    save_test_cases("tests", args.numero_casos, args.procesos or None, args.semilla, args.binario)
+    print("Casos de prueba generados correctamente.")
+    return 0
+
+def _command_boruvka(args):
+    return _run_algorithm(args, run_boruvka_test, workers=args.procesos or None)
+
+def _command_convert(args):
+    try:
+        convert_to_binary(args.formato, args.entrada, args.salida)
+    except ValueError as error:
+        print(error)
+        return 1
+    print(f"Archivo binario generado en {args.salida}")
+    return 0
+
+def _command_batch(args):
+    from src.utils.batch_runner import ALGORITHMS, collect_files, run_batch
+    
+    algorithms = args.algoritmos.split(",") if args.algoritmos else None
+    if algorithms and any(a not in ALGORITHMS for a in algorithms):
+        print(f"Los algoritmos deben estar entre: {', '.join(ALGORITHMS)}")
+        return 1
+    if not collect_files(args.rutas):
+        print(f"No se encontraron archivos en: {', '.join(args.rutas)}")
+        return 1
+    # Se retorna 1 si alguna tarea del lote terminó con error
+    errors = run_batch(args.rutas, algorithms, args.procesos or None, args.ordenado)
+    return 1 if errors else 0
+
+def _command_scaling(argv):
+    from src.utils import benchmark
+    return benchmark.main(argv)
+
+def _command_server(argv):
+    from src.utils import server
+    return server.main(argv)
+
+def _command_startup(argv):
+    from src.utils import startup_benchmark
+    return startup_benchmark.main(argv)
+
+# Subcomandos: nombre -> (alias numérico, descripción, función que define sus
+# argumentos, función que lo ejecuta). Cada función importa sus módulos al
+# ejecutarse, así que el arranque solo paga por el subcomando elegido. Los
+# subcomandos sin función de argumentos reciben la lista de argumentos sin
+# interpretar y la procesan con la línea de comandos de su propio módulo.
+COMMANDS = {
+    "kruskal": ("1", "Ejecutar Kruskal", _algorithm_arguments, _command_kruskal),
+    "prim": ("2", "Ejecutar Prim", _algorithm_arguments, _command_prim),
+    "bipartito": ("3", "Verificar grafo bipartito", _parallel_arguments, _command_bipartite),
+    "generar": ("4", "Generar casos de prueba", _generator_arguments, _command_generate),
+    "boruvka": ("5", "Ejecutar Borůvka", _parallel_arguments, _command_boruvka),
+    "convertir": ("6", "Convertir a binario", _conversion_arguments, _command_convert),
+    "lote": ("7", "Ejecutar en lote", _batch_arguments, _command_batch),
+    "escalamiento": ("8", "Medir escalamiento", None, _command_scaling),
+    "servidor": ("9", "Iniciar servidor", None, _command_server),
+    "arranque": ("10", "Medir el tiempo de arranque", None, _command_startup),
+}
+
+def build_parser():
+    """
+    Construye el analizador de argumentos con un subcomando por entrada de `COMMANDS`.
+    
+    Cada subcomando se acepta por su nombre o por su alias numérico.
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog="main.py", description="Ejecuta los algoritmos implementados.")
+    subcommands = parser.add_subparsers(dest="alias", metavar="<subcomando>")
+    for name, (alias, description, add_arguments, _) in COMMANDS.items():
+        subparser = subcommands.add_parser(name, aliases=[alias], help=description,
+                                           description=description, add_help=add_arguments is not None)
+        if add_arguments is not None:
+            add_arguments(subparser)
+        subparser.set_defaults(command=name)
+    return parser
+
+def main(argv=None):
+    """
+    Función principal que permite ejecutar los algoritmos implementados.
+    
+    Args:
+        argv: Argumentos de línea de comandos; por defecto, los de sys.argv.
+    
+    Returns:
+        Código de salida del subcomando.
+    """
+    parser = build_parser()
+    args, remaining = parser.parse_known_args(argv)
+    if args.alias is None:
+        parser.print_help()
+        return 0
+    
+    _, _, add_arguments, run = COMMANDS[args.command]
+    if add_arguments is None:
+        return run(remaining)
+    if remaining:
+        parser.error(f"argumentos no reconocidos: {' '.join(remaining)}")
+    return run(args)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main())
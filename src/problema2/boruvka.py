@@ -0,0 +1,290 @@
+import os
+from array import array
+
+from src.problema2.kruskal import UnionFind
+from src.utils import instrumentation
+from src.utils.edge_list import integer_typecode
+from src.utils.graph import as_edge_list
+
+# NumPy es opcional: vectoriza la búsqueda de la arista más barata por componente
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Por debajo de este número de aristas no compensa repartir el trabajo entre procesos
+PARALLEL_MIN_EDGES = 200000
+
+# Estado de cada proceso trabajador: vistas sobre las columnas compartidas
+_state = {}
+
+def _attach(names, typecodes):
+    """
+    Inicializa un proceso trabajador conectándolo a la memoria compartida.
+
+    Args:
+        names: Nombres de los bloques compartidos (u, v, pesos, etiquetas).
+        typecodes: Código de tipo de cada bloque.
+    """
+    from multiprocessing import shared_memory
+
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    _state["blocks"] = blocks
+    _state["columns"] = [block.buf.cast(code) for block, code in zip(blocks, typecodes)]
+
+def _cheapest_edges(start, stop):
+    """
+    Busca, para cada componente, la arista de salida más barata en un tramo.
+
+    Las aristas se comparan por (peso, índice original), el mismo orden
+    estable que usa `kruskal`, sin necesidad de ordenarlas antes. Solo se
+    consideran los índices en [start, stop).
+
+    Returns:
+        Tupla (componentes, pesos, índices) con la mejor arista de cada
+        componente que tiene al menos una arista de salida en el tramo
+        (arreglos de NumPy si está disponible, listas en otro caso).
+    """
+    us, vs, ws, labels = _state["columns"]
+
+    if np is not None:
+        # Versión vectorizada: cada arista cuenta para la componente de ambos extremos
+        labels = np.asarray(labels)
+        lu = labels[np.asarray(us[start:stop])]
+        lv = labels[np.asarray(vs[start:stop])]
+        crossing = np.nonzero(lu != lv)[0]
+        if len(crossing) == 0:
+            return [], [], []
+        weights = np.asarray(ws[start:stop])[crossing]
+        return _lexicographic_min(np.concatenate((lu[crossing], lv[crossing])),
+                                  np.concatenate((weights, weights)),
+                                  np.concatenate((crossing, crossing)) + start, len(labels))
+
+    best = {}
+    for i in range(start, stop):
+        cu = labels[us[i]]
+        cv = labels[vs[i]]
+        if cu == cv:
+            continue
+        # Se recorre en orden de índice, así que ante un empate de peso gana la primera arista vista
+        w = ws[i]
+        if cu not in best or w < best[cu][0]:
+            best[cu] = (w, i)
+        if cv not in best or w < best[cv][0]:
+            best[cv] = (w, i)
+    components = list(best)
+    return components, [best[c][0] for c in components], [best[c][1] for c in components]
+
+def _lexicographic_min(components, weights, indices, size):
+    """
+    Elige, para cada componente, la entrada de menor (peso, índice) con NumPy.
+
+    Args:
+        components, weights, indices: Arreglos paralelos de candidatos.
+        size: Número de componentes posibles (las etiquetas están en [0, size)).
+
+    Returns:
+        Tupla de arreglos (componentes, pesos, índices), uno por componente con candidatos.
+    """
+    # Primero el menor peso por componente y, entre los candidatos que lo
+    # alcanzan, el menor índice
+    best_weight = np.full(size, weights.max(), dtype=weights.dtype)
+    np.minimum.at(best_weight, components, weights)
+    tied = weights == best_weight[components]
+    missing = int(indices.max()) + 1
+    best_index = np.full(size, missing, dtype=np.int64)
+    np.minimum.at(best_index, components[tied], indices[tied])
+    found = np.nonzero(best_index < missing)[0]
+    return found, best_weight[found], best_index[found]
+
+def _combine(results, size):
+    """
+    Combina los resultados de `_cheapest_edges` de todos los tramos de una ronda.
+
+    Returns:
+        Índices (sin repetir) de la mejor arista de cada componente; vacío si
+        ninguna componente tiene aristas de salida.
+    """
+    results = [result for result in results if len(result[0])]
+    if not results:
+        return []
+    if len(results) == 1:
+        return set(results[0][2].tolist() if np is not None else results[0][2])
+    if np is not None:
+        components, weights, indices = (np.concatenate(column) for column in zip(*results))
+        return set(_lexicographic_min(components, weights, indices, size)[2].tolist())
+
+    best = {}
+    for components, weights, indices in results:
+        for c, w, i in zip(components, weights, indices):
+            j = best.get(c)
+            if j is None or (w, i) < j:
+                best[c] = (w, i)
+    return {i for _, i in best.values()}
+
+def boruvka(graph, n, workers=None):
+    """
+    Ejecuta el algoritmo de Borůvka en un grafo no dirigido.
+
+    En cada ronda se busca la arista de salida más barata de cada componente
+    y se contraen las componentes con Union-Find. La búsqueda se reparte entre
+    un grupo de procesos que leen las columnas de aristas desde memoria
+    compartida, sin copiarlas.
+
+    Los empates se resuelven por (peso, índice de arista), el mismo orden que
+    usa `kruskal`, de modo que el resultado es la misma lista de aristas.
+
+    Args:
+        graph: Diccionario {vertice: [(vecino, peso), ...], ...}, EdgeList o Graph.
+        n: Número de vértices.
+        workers: Número de procesos; por defecto, el número de núcleos.
+                 Con 1 (o con grafos pequeños) se ejecuta en el proceso actual.
+
+    Returns:
+        Una lista de aristas en el MST en el formato (u, v, peso).
+    """
+    # Se extraen las aristas del grafo, evitando duplicados
+    edges = as_edge_list(graph)
+    m = len(edges)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if m < PARALLEL_MIN_EDGES:
+        workers = 1
+
+    # Las aristas se recorren en su orden original; los empates de peso se
+    # resuelven por índice dentro de cada búsqueda, sin ordenar las aristas
+    columns = [edges.u, edges.v, _weight_column(edges.w), array('i', range(n))]
+
+    with instrumentation.phase("boruvka.rounds"):
+        if workers == 1:
+            # Se reutiliza el mismo código de búsqueda sobre las columnas locales
+            _state["columns"] = columns
+            try:
+                chosen = _boruvka_rounds(n, columns, lambda chunks: [_cheapest_edges(*c) for c in chunks], [(0, m)])
+            finally:
+                _state.clear()
+        else:
+            chosen = _boruvka_shared(n, columns, workers)
+
+    # Se retornan las aristas en el orden en que Kruskal las aceptaría
+    if np is not None and chosen:
+        chosen = np.asarray(chosen)
+        chosen = chosen[np.lexsort((chosen, np.asarray(columns[2])[chosen]))].tolist()
+    else:
+        chosen.sort(key=lambda i: (columns[2][i], i))
+    return [(edges.u[i], edges.v[i], edges.w[i]) for i in chosen]
+
+def _weight_column(weights):
+    # Se obtiene la columna de pesos como arreglo tipado, para compartirla y vectorizarla
+    if integer_typecode(weights):
+        return weights
+    try:
+        return array('q', weights)
+    except (TypeError, OverflowError):
+        return array('d', weights)
+
+def _typecode(column):
+    # Código de tipo de un arreglo o de una vista de memoria
+    return column.typecode if isinstance(column, array) else column.format
+
+def _boruvka_shared(n, columns, workers):
+    """
+    Ejecuta las rondas de Borůvka con un grupo de procesos sobre memoria compartida.
+
+    Returns:
+        Lista de índices de las aristas del MST.
+    """
+    from multiprocessing import Pool, shared_memory
+
+    m = len(columns[0])
+
+    # Se copian las columnas a bloques de memoria compartida una sola vez
+    typecodes = [_typecode(column) for column in columns]
+    blocks = []
+    shared = []
+    try:
+        for column in columns:
+            block = shared_memory.SharedMemory(create=True, size=len(column) * column.itemsize)
+            blocks.append(block)
+            block.buf[:len(column) * column.itemsize] = column.tobytes()
+        shared = [block.buf.cast(code)[:len(column)] for block, code, column in zip(blocks, typecodes, columns)]
+
+        # Se divide el rango de aristas en tramos contiguos, uno por proceso
+        step = -(-m // workers)
+        chunks = [(start, min(start + step, m)) for start in range(0, m, step)]
+
+        with Pool(workers, initializer=_attach, initargs=([block.name for block in blocks], typecodes)) as pool:
+            return _boruvka_rounds(n, shared, lambda chunks: pool.starmap(_cheapest_edges, chunks), chunks)
+    finally:
+        for view in shared:
+            view.release()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+def _boruvka_rounds(n, columns, scan, chunks):
+    """
+    Ejecuta las rondas de Borůvka hasta que ninguna componente tenga aristas de salida.
+
+    Args:
+        n: Número de vértices.
+        columns: Columnas (u, v, pesos, etiquetas) con las aristas y la
+                 componente de cada vértice; la última se actualiza en cada ronda.
+        scan: Función que recibe los tramos y retorna los resultados de `_cheapest_edges`.
+        chunks: Tramos de índices de aristas en que se divide la búsqueda.
+
+    Returns:
+        Lista de índices de las aristas del MST.
+    """
+    us, vs, _, labels = columns
+    uf = UnionFind(n)
+    chosen = []
+
+    while True:
+        # Se combinan los resultados parciales quedándose con el menor (peso, índice)
+        best = _combine(scan(chunks), n)
+        if not best:
+            break
+
+        # Se contraen las componentes a través de sus aristas más baratas. Con
+        # un orden total estricto forman un bosque, así que el orden de las
+        # uniones no importa
+        for i in best:
+            if uf.union(us[i], vs[i]):
+                chosen.append(i)
+
+        # Se actualiza la etiqueta de componente de cada vértice
+        if np is not None:
+            # Saltos de punteros vectorizados sobre el arreglo de padres
+            roots = np.array(uf.parent, dtype=np.int64)
+            while True:
+                jumped = roots[roots]
+                if np.array_equal(jumped, roots):
+                    break
+                roots = jumped
+            np.asarray(labels)[:] = roots
+        else:
+            for v in range(n):
+                labels[v] = uf.find(v)
+
+    return chosen
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    # Se define un grafo de ejemplo
+    graph = {
+        0: [(1, 4), (2, 3)],
+        1: [(0, 4), (2, 1), (3, 2)],
+        2: [(0, 3), (1, 1), (3, 4)],
+        3: [(1, 2), (2, 4)]
+    }
+    n = 4
+
+    # Se ejecuta el algoritmo de Borůvka
+    mst_edges = boruvka(graph, n)
+    print("Árbol de expansión mínima (Borůvka):", mst_edges)
+
+    # Se calcula el peso total del MST
+    total_weight = sum(weight for _, _, weight in mst_edges)
+    print(f"Peso total del MST: {total_weight}")
@@ -0,0 +1,220 @@
+from array import array
+from operator import itemgetter
+
+from src.problema2.kruskal import UnionFind, kruskal
+
+# NumPy es opcional: permite construir la tabla y responder consultas en lote vectorizadas
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Resultado de una consulta sin aristas: un vértice consigo mismo no recorre
+# ninguna arista, y entre componentes distintas no hay camino
+SAME_VERTEX = float("-inf")
+DISCONNECTED = float("inf")
+
+class BottleneckIndex:
+    """
+    Índice de consultas de cuello de botella (camino minimax) entre pares de vértices.
+
+    El cuello de botella entre u y v es el menor peso máximo posible de un
+    camino entre ambos, y es la arista más pesada del camino entre u y v en
+    el MST. El índice representa implícitamente el árbol de reconstrucción
+    de Kruskal: al unir dos conjuntos con una arista de peso w se concatenan
+    sus listas de vértices y se anota w en el punto de unión. En el orden
+    resultante cada componente es un intervalo, y el cuello de botella entre
+    u y v es la mayor anotación entre sus posiciones, que una tabla dispersa
+    de máximos responde en O(1). La construcción cuesta O(n log n) en tiempo
+    y memoria (4 bytes por vértice y nivel).
+    """
+    __slots__ = ("n", "weights", "position", "labels", "table", "_weight_column")
+
+    def __init__(self, n, mst_edges=()):
+        """
+        Args:
+            n: Número de vértices.
+            mst_edges: Aristas (u, v, peso) de un árbol o bosque de expansión mínima,
+                       como las retorna `kruskal`; si no están ordenadas por peso, se ordenan.
+
+        Raises:
+            ValueError: si las aristas forman un ciclo.
+        """
+        edges = list(mst_edges)
+        if any(edges[i][2] > edges[i + 1][2] for i in range(len(edges) - 1)):
+            edges.sort(key=itemgetter(2))
+        self.n = n
+        # Peso de cada unión, en orden; la tabla guarda índices en esta lista
+        self.weights = [weight for _, _, weight in edges]
+
+        # Lista enlazada de los vértices de cada conjunto (primero, último y siguiente)
+        # y unión que sigue a cada vértice en su lista
+        uf = UnionFind(n)
+        head = array('i', range(n))
+        tail = array('i', range(n))
+        following = array('i', [-1]) * n
+        merge = array('i', [-1]) * n
+        for rank, (u, v, _) in enumerate(edges):
+            root_u, root_v = uf.find(u), uf.find(v)
+            if root_u == root_v:
+                raise ValueError("Las aristas no forman un bosque")
+            following[tail[root_u]] = head[root_v]
+            merge[tail[root_u]] = rank
+            uf.union(root_u, root_v)
+            root = uf.find(root_u)
+            head[root], tail[root] = head[root_u], tail[root_v]
+
+        # Se recorren las listas; las componentes se numeran según su menor vértice
+        self.position = array('i', bytes(4 * n))
+        self.labels = array('i', [-1]) * n
+        gaps = array('i')
+        count = 0
+        for start in range(n):
+            if self.labels[start] != -1:
+                continue
+            v = head[uf.find(start)]
+            while v != -1:
+                self.position[v] = len(gaps)
+                self.labels[v] = count
+                gaps.append(merge[v])
+                v = following[v]
+            count += 1
+
+        self.table = _sparse_table(gaps)
+        self._weight_column = np.asarray(self.weights, dtype=np.float64) if np is not None else None
+
+    @property
+    def component_count(self):
+        # Número de componentes del bosque (los vértices aislados cuentan como una)
+        return max(self.labels) + 1 if self.n else 0
+
+    def bottleneck(self, u, v):
+        """
+        Calcula el cuello de botella entre dos vértices en O(1).
+
+        Returns:
+            El peso de la arista más pesada del camino entre u y v en el MST;
+            SAME_VERTEX (-inf) si u == v, o DISCONNECTED (inf) si no hay camino.
+
+        Raises:
+            ValueError: si algún vértice está fuera de rango.
+        """
+        if not (0 <= u < self.n and 0 <= v < self.n):
+            raise ValueError(f"Vértice fuera de rango: ({u}, {v})")
+        if u == v:
+            return SAME_VERTEX
+        if self.labels[u] != self.labels[v]:
+            return DISCONNECTED
+
+        low, high = sorted((self.position[u], self.position[v]))
+        level = (high - low).bit_length() - 1
+        row = self.table[level]
+        return self.weights[max(row[low], row[high - (1 << level)])]
+
+    def bottleneck_many(self, us, vs):
+        """
+        Calcula el cuello de botella de muchos pares (us[k], vs[k]) a la vez.
+
+        Con NumPy, todas las consultas se responden con operaciones
+        vectorizadas: dos lecturas de la tabla y un máximo por par.
+
+        Args:
+            us: Secuencia o arreglo con el primer vértice de cada par.
+            vs: Secuencia o arreglo con el segundo vértice de cada par.
+
+        Returns:
+            ndarray float64 con el resultado de `bottleneck` para cada par si
+            NumPy está disponible, o una lista en otro caso.
+
+        Raises:
+            ValueError: si las secuencias tienen longitudes distintas o algún
+                        vértice está fuera de rango.
+        """
+        if np is None:
+            if len(us) != len(vs):
+                raise ValueError("Las secuencias de vértices tienen longitudes distintas")
+            return [self.bottleneck(u, v) for u, v in zip(us, vs)]
+
+        us = np.asarray(us, dtype=np.int64).ravel()
+        vs = np.asarray(vs, dtype=np.int64).ravel()
+        if len(us) != len(vs):
+            raise ValueError("Las secuencias de vértices tienen longitudes distintas")
+        if len(us) and (min(us.min(), vs.min()) < 0 or max(us.max(), vs.max()) >= self.n):
+            raise ValueError("Vértice fuera de rango en las consultas")
+
+        position = np.frombuffer(self.position, dtype=np.int32)
+        labels = np.frombuffer(self.labels, dtype=np.int32)
+        pu, pv = position[us], position[vs]
+        low = np.minimum(pu, pv)
+        length = np.abs(pu - pv)
+        connected = labels[us] == labels[vs]
+
+        result = np.full(len(us), DISCONNECTED)
+        result[connected & (length == 0)] = SAME_VERTEX
+        pending = np.flatnonzero(connected & (length > 0))
+        low, length = low[pending], length[pending]
+
+        # Nivel de la tabla: mayor potencia de dos que cabe en el intervalo
+        level = np.frexp(length)[1] - 1
+        ranks = np.maximum(self.table[level, low], self.table[level, low + length - np.left_shift(1, level)])
+        result[pending] = self._weight_column[ranks]
+        return result
+
+def _sparse_table(gaps):
+    """
+    Construye la tabla dispersa de máximos sobre las anotaciones de unión.
+
+    El nivel k guarda en la posición i el máximo de gaps[i:i + 2^k]. Se
+    necesitan niveles hasta la mayor potencia de dos que no supera n - 1, la
+    longitud del intervalo más largo que puede consultarse.
+
+    Returns:
+        ndarray (niveles x n) de int32 si NumPy está disponible, o una lista
+        de array('i') de longitud decreciente.
+    """
+    n = len(gaps)
+    levels = max(1, (n - 1).bit_length())
+    if np is None:
+        table = [gaps]
+        for k in range(1, levels):
+            previous, half = table[-1], 1 << (k - 1)
+            table.append(array('i', map(max, previous[:n - (1 << k) + 1], previous[half:])))
+        return table
+
+    table = np.full((levels, n), -1, dtype=np.int32)
+    table[0] = np.frombuffer(gaps, dtype=np.int32)
+    for k in range(1, levels):
+        size, half = n - (1 << k) + 1, 1 << (k - 1)
+        np.maximum(table[k - 1, :size], table[k - 1, half:half + size], out=table[k, :size])
+    return table
+
+def bottleneck_index(graph, n):
+    """
+    Construye el índice de cuellos de botella de un grafo con `kruskal`.
+
+    Args:
+        graph: Diccionario {vertice: [(vecino, peso), ...], ...}, EdgeList o Graph.
+        n: Número de vértices.
+
+    Returns:
+        BottleneckIndex del bosque de expansión mínima del grafo.
+    """
+    return BottleneckIndex(n, kruskal(graph, n))
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    graph = {
+        0: [(1, 4), (2, 3)],
+        1: [(0, 4), (2, 1), (3, 2)],
+        2: [(0, 3), (1, 1), (3, 4)],
+        3: [(1, 2), (2, 4)],
+        4: [(5, 7)],
+        5: [(4, 7)]
+    }
+    # Equivale a BottleneckIndex(6, kruskal(graph, 6))
+    index = bottleneck_index(graph, 6)
+
+    # El mejor camino de 0 a 3 es 0-2-1-3, cuya arista más pesada pesa 3
+    print("Cuello de botella entre 0 y 3:", index.bottleneck(0, 3))
+    print("Cuello de botella entre 0 y 5 (sin camino):", index.bottleneck(0, 5))
+    print("En lote:", index.bottleneck_many([0, 1, 4, 2], [3, 3, 5, 2]))
@@ -0,0 +1,337 @@
+NO_EDGE = float("-inf")
+
+class LinkCutTree:
+    """
+    Árbol link-cut con consulta del máximo sobre caminos.
+
+    Cada nodo tiene un valor; `path_max(u, v)` retorna el nodo de mayor valor
+    en el camino entre u y v. Todas las operaciones cuestan O(log n)
+    amortizado y se implementan sin recursión.
+    """
+    def __init__(self):
+        self.left = []
+        self.right = []
+        self.par = []
+        self.rev = []
+        self.val = []
+        # Nodo de mayor valor en el subárbol splay de cada nodo
+        self.best = []
+
+    def add_node(self, value):
+        # Se crea un nodo aislado y se retorna su índice
+        x = len(self.val)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.par.append(-1)
+        self.rev.append(False)
+        self.val.append(value)
+        self.best.append(x)
+        return x
+
+    def reset_node(self, x, value):
+        # Se reutiliza un nodo aislado con un nuevo valor
+        self.left[x] = self.right[x] = self.par[x] = -1
+        self.rev[x] = False
+        self.val[x] = value
+        self.best[x] = x
+
+    def _is_root(self, x):
+        # x es raíz de su árbol splay si su padre no lo tiene como hijo
+        p = self.par[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def _push(self, x):
+        # Se propaga la inversión pendiente a los hijos
+        if self.rev[x]:
+            left, right = self.left[x], self.right[x]
+            self.left[x], self.right[x] = right, left
+            if left != -1:
+                self.rev[left] = not self.rev[left]
+            if right != -1:
+                self.rev[right] = not self.rev[right]
+            self.rev[x] = False
+
+    def _update(self, x):
+        # Se recalcula el nodo de mayor valor del subárbol
+        val = self.val
+        best = x
+        left, right = self.left[x], self.right[x]
+        if left != -1 and val[self.best[left]] > val[best]:
+            best = self.best[left]
+        if right != -1 and val[self.best[right]] > val[best]:
+            best = self.best[right]
+        self.best[x] = best
+
+    def _rotate(self, x):
+        p = self.par[x]
+        g = self.par[p]
+        left, right = self.left, self.right
+        # Se enlaza x con su abuelo (si p no era raíz del árbol splay)
+        if g != -1:
+            if left[g] == p:
+                left[g] = x
+            elif right[g] == p:
+                right[g] = x
+        self.par[x] = g
+        # Se mueve el hijo correspondiente de x hacia p
+        if left[p] == x:
+            child = right[x]
+            left[p] = child
+            right[x] = p
+        else:
+            child = left[x]
+            right[p] = child
+            left[x] = p
+        if child != -1:
+            self.par[child] = p
+        self.par[p] = x
+        self._update(p)
+        self._update(x)
+
+    def _splay(self, x):
+        # Se propagan las inversiones desde la raíz del árbol splay hasta x
+        stack = [x]
+        y = x
+        while not self._is_root(y):
+            y = self.par[y]
+            stack.append(y)
+        for y in reversed(stack):
+            self._push(y)
+
+        while not self._is_root(x):
+            p = self.par[x]
+            if not self._is_root(p):
+                g = self.par[p]
+                # Zig-zig si x y p son hijos del mismo lado; zig-zag en otro caso
+                if (self.left[g] == p) == (self.left[p] == x):
+                    self._rotate(p)
+                else:
+                    self._rotate(x)
+            self._rotate(x)
+
+    def _access(self, x):
+        # Se hace que el camino de la raíz a x sea el camino preferido
+        last = -1
+        y = x
+        while y != -1:
+            self._splay(y)
+            self.right[y] = last
+            self._update(y)
+            last = y
+            y = self.par[y]
+        self._splay(x)
+
+    def make_root(self, x):
+        # x pasa a ser la raíz de su árbol representado
+        self._access(x)
+        self.rev[x] = not self.rev[x]
+
+    def find_root(self, x):
+        # Se busca la raíz del árbol representado que contiene a x
+        self._access(x)
+        self._push(x)
+        while self.left[x] != -1:
+            x = self.left[x]
+            self._push(x)
+        self._splay(x)
+        return x
+
+    def connected(self, x, y):
+        return x == y or self.find_root(x) == self.find_root(y)
+
+    def link(self, x, y):
+        # Se une el árbol de x (como hijo) al nodo y; deben estar desconectados
+        self.make_root(x)
+        self.par[x] = y
+
+    def cut(self, x, y):
+        # Se elimina la arista (x, y) del árbol representado
+        self.make_root(x)
+        self._access(y)
+        # Ahora x es el hijo izquierdo de y en el árbol splay
+        self.left[y] = -1
+        self.par[x] = -1
+        self._update(y)
+
+    def path_max(self, x, y):
+        # Nodo de mayor valor en el camino entre x e y (deben estar conectados)
+        self.make_root(x)
+        self._access(y)
+        return self.best[y]
+
+    def set_value(self, x, value):
+        # Se cambia el valor de x actualizando los máximos de su árbol splay
+        self._access(x)
+        self.val[x] = value
+        self._update(x)
+
+class DynamicMST:
+    """
+    Árbol (o bosque) de expansión mínima bajo inserción de aristas y
+    disminución de pesos.
+
+    Cada arista del árbol se representa con un nodo propio dentro de un
+    árbol link-cut cuyos vértices tienen valor -infinito, de modo que el
+    máximo del camino entre u y v es la arista más pesada de ese camino.
+    Al insertar (u, v, w), si u y v ya están conectados y la arista más
+    pesada del camino pesa más que w, se reemplaza por la nueva. Cada
+    operación cuesta O(log n) amortizado y el peso total se consulta en O(1).
+    """
+    def __init__(self, n, mst_edges=()):
+        """
+        Args:
+            n: Número de vértices.
+            mst_edges: Aristas (u, v, peso) de un MST, por ejemplo la salida de `kruskal`.
+        """
+        self.n = n
+        self.tree = LinkCutTree()
+        for _ in range(n):
+            self.tree.add_node(NO_EDGE)
+
+        # Extremos de la arista que representa cada nodo (índice - n)
+        self._ends = []
+        # Nodo asociado a cada arista del árbol, con clave (min(u, v), max(u, v))
+        self._node_of = {}
+        # Nodos de arista liberados que pueden reutilizarse
+        self._free = []
+        self._total = 0
+
+        for u, v, weight in mst_edges:
+            self._link_edge(u, v, weight)
+
+    @property
+    def total_weight(self):
+        # Peso total del árbol actual
+        return self._total
+
+    def __len__(self):
+        # Número de aristas del árbol actual
+        return len(self._node_of)
+
+    def edges(self):
+        """
+        Retorna las aristas del árbol actual en el formato (u, v, peso).
+        """
+        return [(u, v, self.tree.val[node]) for (u, v), node in self._node_of.items()]
+
+    def _link_edge(self, u, v, weight):
+        # Se agrega la arista (u, v) al árbol mediante un nodo intermedio
+        if self._free:
+            node = self._free.pop()
+            self.tree.reset_node(node, weight)
+            self._ends[node - self.n] = (u, v)
+        else:
+            node = self.tree.add_node(weight)
+            self._ends.append((u, v))
+        self.tree.link(u, node)
+        self.tree.link(node, v)
+        self._node_of[(min(u, v), max(u, v))] = node
+        self._total += weight
+
+    def _cut_edge(self, node):
+        # Se elimina del árbol la arista representada por el nodo
+        u, v = self._ends[node - self.n]
+        self.tree.cut(u, node)
+        self.tree.cut(node, v)
+        del self._node_of[(min(u, v), max(u, v))]
+        self._total -= self.tree.val[node]
+        self._free.append(node)
+
+    def insert_edge(self, u, v, weight):
+        """
+        Inserta la arista (u, v) con el peso dado.
+
+        Returns:
+            True si el árbol cambió (la arista entró al MST).
+        """
+        if u == v:
+            return False
+
+        # Si la arista ya está en el árbol, insertarla con menor peso es una disminución
+        node = self._node_of.get((min(u, v), max(u, v)))
+        if node is not None:
+            if weight < self.tree.val[node]:
+                self._set_weight(node, weight)
+                return True
+            return False
+
+        # Si u y v están en componentes distintas, la arista une ambos árboles
+        if not self.tree.connected(u, v):
+            self._link_edge(u, v, weight)
+            return True
+
+        # En otro caso reemplaza a la arista más pesada del ciclo que forma
+        heaviest = self.tree.path_max(u, v)
+        if self.tree.val[heaviest] > weight:
+            self._cut_edge(heaviest)
+            self._link_edge(u, v, weight)
+            return True
+        return False
+
+    def decrease_weight(self, u, v, weight):
+        """
+        Disminuye el peso de la arista (u, v).
+
+        Si la arista está en el árbol, solo se actualiza su peso; si no lo
+        está, puede entrar al árbol igual que una arista nueva. Las aristas
+        fuera del árbol no se almacenan, por lo que disminuir el peso de una
+        arista que no está en el árbol equivale a insertarla con el nuevo peso.
+
+        Returns:
+            True si el árbol cambió.
+
+        Raises:
+            ValueError: si la arista está en el árbol y el nuevo peso es mayor.
+        """
+        node = self._node_of.get((min(u, v), max(u, v)))
+        if node is not None:
+            if weight > self.tree.val[node]:
+                raise ValueError("El nuevo peso debe ser menor o igual al actual")
+            if weight == self.tree.val[node]:
+                return False
+            self._set_weight(node, weight)
+            return True
+        return self.insert_edge(u, v, weight)
+
+    def _set_weight(self, node, weight):
+        # Se actualiza el peso de una arista del árbol y el peso total
+        self._total += weight - self.tree.val[node]
+        self.tree.set_value(node, weight)
+
+    def max_edge_on_path(self, u, v):
+        """
+        Retorna la arista más pesada del camino entre u y v en el árbol.
+
+        Returns:
+            Tupla (u, v, peso), o None si u y v no están conectados o son iguales.
+        """
+        if u == v or not self.tree.connected(u, v):
+            return None
+        node = self.tree.path_max(u, v)
+        a, b = self._ends[node - self.n]
+        return (a, b, self.tree.val[node])
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    from src.problema2.kruskal import kruskal
+
+    # Se define un grafo de ejemplo
+    graph = {
+        0: [(1, 4), (2, 3)],
+        1: [(0, 4), (2, 1), (3, 2)],
+        2: [(0, 3), (1, 1), (3, 4)],
+        3: [(1, 2), (2, 4)]
+    }
+    n = 4
+
+    # Se inicializa la estructura con el MST calculado por Kruskal
+    dynamic = DynamicMST(n, kruskal(graph, n))
+    print("Peso total inicial:", dynamic.total_weight)
+
+    # Una arista (0, 3) de peso 1 reemplaza a la arista más pesada del ciclo
+    dynamic.insert_edge(0, 3, 1)
+    print("Tras insertar (0, 3, 1):", sorted(dynamic.edges()), "peso", dynamic.total_weight)
+
+    # Disminuir el peso de una arista del árbol solo cambia el peso total
+    dynamic.decrease_weight(1, 2, 0)
+    print("Tras disminuir (1, 2) a 0:", dynamic.total_weight)
@@ -1,16 +1,45 @@
+from array import array
+from heapq import heapify, heappop
+from itertools import compress
+
+from src.problema2.spanning_forest import group_by_component
+from src.utils import instrumentation
+from src.utils.edge_list import integer_typecode
+from src.utils.graph import as_edge_list
+
 class UnionFind:
-    """Estructura de datos Union-Find con compresión de caminos y unión por rango."""
+    """
+    Estructura de datos Union-Find con compresión de caminos y unión por rango.
+    
+    Los padres y rangos se guardan en arreglos tipados y la búsqueda es
+    iterativa (división a la mitad del camino), por lo que no depende del
+    límite de recursión de Python sin importar el orden de las uniones.
+    """
     def __init__(self, n):
         # Se inicializa cada vértice como su propio padre
-        self.parent = [i for i in range(n)]
+        self.parent = array('i', range(n))
         # Se inicializa el rango de cada conjunto en 0
-        self.rank = [0] * n
+        self.rank = array('B', bytes(n))
+        # Se lleva la cuenta del número de conjuntos disjuntos
+        self.count = n
+
+    @property
+    def component_count(self):
+        # Número de conjuntos disjuntos actuales
+        return self.count
 
     def find(self, i):
-        # Se busca la raíz de i con compresión de caminos
-        if self.parent[i] != i:
-            self.parent[i] = self.find(self.parent[i])
-        return self.parent[i]
+        # Se busca la raíz de i, haciendo que cada nodo visitado apunte a su abuelo
+        parent = self.parent
+        while parent[i] != i:
+            grandparent = parent[parent[i]]
+            parent[i] = grandparent
+            i = grandparent
+        return i
+
+    def connected(self, i, j):
+        # Dos vértices están conectados si comparten raíz
+        return self.find(i) == self.find(j)
 
     def union(self, i, j):
         # Se unen dos conjuntos utilizando la técnica de unión por rango
@@ -29,47 +58,277 @@ class UnionFind:
             # Si ambos árboles tienen el mismo rango, se incrementa el rango del resultado
             if self.rank[root_i] == self.rank[root_j]:
                 self.rank[root_i] += 1
+        self.count -= 1
         return True
 
+    def union_many(self, us, vs, limit=None):
+        """
+        Une en lote los pares (us[k], vs[k]) en el orden dado.
+        
+        Args:
+            us: Secuencia con el primer extremo de cada par.
+            vs: Secuencia con el segundo extremo de cada par.
+            limit: Número máximo de uniones exitosas; al alcanzarlo se
+                   detiene el procesamiento y el resto de la máscara queda en 0.
+        
+        Returns:
+            bytearray donde la posición k vale 1 si el par k unió dos conjuntos.
+        """
+        mask = bytearray(len(us))
+        if limit is None:
+            limit = len(mask)
+        if limit <= 0:
+            return mask
+        
+        # Se usan referencias locales para evitar búsquedas de atributos por par
+        parent = self.parent
+        rank = self.rank
+        merged = 0
+        
+        for k, (a, b) in enumerate(zip(us, vs)):
+            # Se buscan ambas raíces con división a la mitad del camino
+            while parent[a] != a:
+                grandparent = parent[parent[a]]
+                parent[a] = grandparent
+                a = grandparent
+            while parent[b] != b:
+                grandparent = parent[parent[b]]
+                parent[b] = grandparent
+                b = grandparent
+            
+            if a == b:
+                continue
+            
+            # Se une el árbol de menor rango al de mayor rango
+            if rank[a] < rank[b]:
+                parent[a] = b
+            else:
+                parent[b] = a
+                if rank[a] == rank[b]:
+                    rank[a] += 1
+            
+            mask[k] = 1
+            merged += 1
+            if merged == limit:
+                break
+        
+        self.count -= merged
+        return mask
+
+    def component_labels(self):
+        """
+        Asigna a cada elemento la etiqueta de su conjunto.
+        
+        Returns:
+            array('i') con etiquetas 0..k-1, numeradas según el primer
+            elemento de cada conjunto.
+        """
+        n = len(self.parent)
+        labels = array('i', [-1]) * n
+        root_label = array('i', [-1]) * n
+        next_label = 0
+        for i in range(n):
+            root = self.find(i)
+            if root_label[root] == -1:
+                root_label[root] = next_label
+                next_label += 1
+            labels[i] = root_label[root]
+        return labels
+
+class CountingUnionFind(UnionFind):
+    """
+    Union-Find que además cuenta búsquedas, pasos de búsqueda y uniones.
+
+    Se usa en lugar de `UnionFind` solo cuando la instrumentación está
+    activa, de modo que la versión normal no paga el costo de los contadores.
+    Las uniones son las mismas que en `UnionFind`, por lo que el resultado
+    de los algoritmos no cambia.
+    """
+    def __init__(self, n, recorder):
+        super().__init__(n)
+        self.recorder = recorder
+        self.finds = 0
+        self.find_steps = 0
+        self.max_find_steps = 0
+        self.unions = 0
+        self.pairs = 0
+
+    def find(self, i):
+        # Búsqueda con división a la mitad del camino, contando los pasos
+        parent = self.parent
+        steps = 0
+        while parent[i] != i:
+            grandparent = parent[parent[i]]
+            parent[i] = grandparent
+            i = grandparent
+            steps += 1
+        self.finds += 1
+        self.find_steps += steps
+        if steps > self.max_find_steps:
+            self.max_find_steps = steps
+        return i
+
+    def union(self, i, j):
+        merged = super().union(i, j)
+        self.unions += merged
+        return merged
+
+    def union_many(self, us, vs, limit=None):
+        # Se unen los pares uno por uno para contar cada búsqueda
+        mask = bytearray(len(us))
+        if limit is None:
+            limit = len(mask)
+        merged = 0
+        for k, (a, b) in enumerate(zip(us, vs)):
+            if merged >= limit:
+                break
+            self.pairs += 1
+            if self.union(a, b):
+                mask[k] = 1
+                merged += 1
+        return mask
+
+    def report(self):
+        # Se agregan los contadores al registro de instrumentación
+        recorder = self.recorder
+        recorder.count("unionfind.finds", self.finds)
+        recorder.count("unionfind.find_steps", self.find_steps)
+        recorder.maximum("unionfind.max_find_steps", self.max_find_steps)
+        recorder.count("unionfind.unions", self.unions)
+        recorder.count("unionfind.pairs_scanned", self.pairs)
+
+def _new_union_find(n, recorder):
+    # Union-Find con contadores si la instrumentación está activa
+    return UnionFind(n) if recorder is None else CountingUnionFind(n, recorder)
+
+def _kruskal_run(graph, n):
+    """
+    Ejecuta las fases comunes de `kruskal` y `kruskal_forest`.
+
+    Args:
+        graph: Diccionario {vertice: [(vecino, peso), ...], ...}, EdgeList o Graph.
+        n: Número de vértices.
+
+    Returns:
+        Tupla (aristas ordenadas, máscara de aristas aceptadas, Union-Find final).
+    """
+    recorder = instrumentation.active()
+
+    # Se extraen las aristas del grafo, evitando duplicados
+    with instrumentation.phase("kruskal.extract"):
+        edges = as_edge_list(graph)
+
+    # Se ordenan las aristas por peso en orden creciente (conteo/radix si
+    # los pesos son enteros acotados, comparación en otro caso)
+    with instrumentation.phase("kruskal.sort"):
+        ordered = edges.sorted_by_weight()
+
+    # Se inicializa la estructura Union-Find
+    uf = _new_union_find(n, recorder)
+
+    # Se procesan las aristas en orden de peso creciente; el lote se detiene
+    # en cuanto se tienen n-1 aristas, es decir, cuando el MST está completo
+    with instrumentation.phase("kruskal.union_find"):
+        accepted = uf.union_many(ordered.u, ordered.v, limit=n - 1)
+
+    if recorder is not None:
+        recorder.count("kruskal.edges", len(edges))
+        recorder.count("kruskal.edges_scanned", uf.pairs)
+        uf.report()
+
+    return ordered, accepted, uf
+
 def kruskal(graph, n):
     """
     Ejecuta el algoritmo de Kruskal en un grafo no dirigido.
-    
+
     Args:
         graph: Diccionario que representa el grafo en formato de lista de adyacencias.
                Formato: {vertice: [(vecino, peso), ...], ...}
+               También se acepta directamente un EdgeList con una copia de cada arista o un Graph.
+        n: Número de vértices.
+
+    Returns:
+        Una lista de aristas en el MST en el formato (u, v, peso).
+    """
+    ordered, accepted, _ = _kruskal_run(graph, n)
+
+    # Se construye la lista de aristas del MST a partir de la máscara
+    return list(compress(ordered, accepted))
+
+def kruskal_forest(graph, n):
+    """
+    Calcula el bosque de expansión mínima separado por componentes.
+
+    Las aristas son las mismas que retorna `kruskal`; las etiquetas de
+    componente se leen del Union-Find que ya construyó el algoritmo, sin
+    recorrer el grafo otra vez.
+
+    Args:
+        graph: Diccionario {vertice: [(vecino, peso), ...], ...}, EdgeList o Graph.
+        n: Número de vértices.
+
+    Returns:
+        SpanningForest con las aristas, el peso y los vértices de cada componente.
+    """
+    ordered, accepted, uf = _kruskal_run(graph, n)
+    return group_by_component(compress(ordered, accepted), uf.component_labels(), uf.component_count)
+
+def kruskal_lazy(graph, n):
+    """
+    Ejecuta Kruskal extrayendo las aristas de un montículo bajo demanda.
+    
+    En lugar de ordenar todas las aristas, se construye un montículo en O(m)
+    y se extraen aristas solo hasta completar el bosque de expansión. En grafos
+    densos el MST suele completarse tras un prefijo pequeño del orden, por lo
+    que se evita la mayor parte del trabajo de ordenamiento.
+    
+    Las aristas de igual peso se extraen en el mismo orden que en `kruskal`,
+    por lo que el resultado es idéntico.
+    
+    Args:
+        graph: Diccionario {vertice: [(vecino, peso), ...], ...}, EdgeList o Graph.
         n: Número de vértices.
         
     Returns:
         Una lista de aristas en el MST en el formato (u, v, peso).
     """
-    # Se extraen las aristas del grafo, evitando duplicados
-    edges = []
-    for u in graph:
-        for v, weight in graph[u]:
-            # Solo se agrega una vez cada arista para grafos no dirigidos
-            if u < v:
-                edges.append((u, v, weight))
+    recorder = instrumentation.active()
     
-    # Se ordenan las aristas por peso en orden creciente
-    edges.sort(key=lambda edge: edge[2])
+    # Se extraen las aristas del grafo, evitando duplicados
+    edges = as_edge_list(graph)
+    us, vs, ws = edges.u, edges.v, edges.w
+    m = len(ws)
     
-    # Se inicializa la estructura Union-Find
-    uf = UnionFind(n)
+    # Con pesos enteros se codifica (peso, índice) en un solo entero para
+    # que el montículo compare enteros en lugar de tuplas
+    integral = integer_typecode(ws) is not None
+    if integral:
+        heap = [w * m + i for i, w in enumerate(ws)]
+    else:
+        heap = list(zip(ws, range(m)))
+    heapify(heap)
     
-    # Se inicializa la lista que contendrá las aristas del MST
+    uf = _new_union_find(n, recorder)
     mst = []
     
-    # Se procesan las aristas en orden de peso creciente
-    for u, v, weight in edges:
+    # Se extraen aristas hasta completar n-1 uniones o agotar el montículo
+    while heap and len(mst) < n - 1:
+        if integral:
+            i = heappop(heap) % m
+        else:
+            i = heappop(heap)[1]
+        u, v = us[i], vs[i]
         # Si al unir los vértices no se forma un ciclo, se agrega la arista al MST
         if uf.union(u, v):
-            mst.append((u, v, weight))
-            
-            # Si ya se tienen n-1 aristas, se ha completado el MST
-            if len(mst) == n - 1:
-                break
-                
+            mst.append((u, v, ws[i]))
+    
+    if recorder is not None:
+        # Las aristas examinadas son las que ya salieron del montículo
+        recorder.count("kruskal.edges", m)
+        recorder.count("kruskal.edges_scanned", m - len(heap))
+        uf.report()
+    
     return mst
 
 # Ejemplo de uso:
@@ -89,4 +348,13 @@ if __name__ == "__main__":
     
     # Se calcula el peso total del MST
     total_weight = sum(weight for _, _, weight in mst_edges)
-    print(f"Peso total del MST: {total_weight}") 
\ No newline at end of file
+    print(f"Peso total del MST: {total_weight}")
+    
+    # Se ejecuta la variante con montículo y terminación temprana
+    print("Árbol de expansión mínima (Kruskal perezoso):", kruskal_lazy(graph, n))
+    
+    # En un grafo desconexo se obtiene un árbol por componente
+    graph[4] = [(5, 7)]
+    graph[5] = [(4, 7)]
+    forest = kruskal_forest(graph, 6)
+    print("Bosque de expansión mínima:", forest.edges, "pesos", forest.weights)
\ No newline at end of file
@@ -1,16 +1,45 @@
 import sys
+from array import array
+from time import perf_counter
+from heapq import heappush, heappop
+
+from src.problema2.spanning_forest import group_by_component
+from src.utils import instrumentation
+from src.utils.graph import Graph, csr_to_matrix
+
+# NumPy es opcional: solo se requiere para la versión vectorizada
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 def prim(adj_matrix):
     """
     Ejecuta el algoritmo de Prim en un grafo no dirigido representado por su matriz de adyacencias.
     
+    Si el grafo no es conexo, el recorrido se reinicia desde el menor vértice
+    aún no visitado, por lo que se obtiene el bosque de expansión mínima.
+    
     Args:
         adj_matrix: Lista de listas que representa la matriz de adyacencias con pesos.
-                   Un valor de 0 indica que no hay arista.
+                   Un valor de 0 indica que no hay arista. También se acepta
+                   un Graph, del que se usa su matriz densa.
     
     Returns:
         El MST como una lista de aristas en el formato (u, v, peso).
     """
+    return _prim_matrix(adj_matrix)[0]
+
+def _prim_matrix(adj_matrix):
+    """
+    Implementación de `prim` que además etiqueta la componente de cada vértice.
+    
+    Returns:
+        Tupla (aristas, etiquetas, número de componentes).
+    """
+    if isinstance(adj_matrix, Graph):
+        adj_matrix = adj_matrix.matrix()
+    
     # Se obtiene el número de vértices
     n = len(adj_matrix)
     
@@ -23,14 +52,30 @@ def prim(adj_matrix):
     # Se inicializa el arreglo de padres para reconstruir el MST
     parent = [-1] * n
     
+    # Componente de cada vértice, asignada al seleccionarlo
+    labels = array('i', [-1]) * n
+    count = 0
+    
+    # Próximo candidato a raíz cuando se agota una componente
+    root = 0
+    
     # Se establece la clave del primer vértice en 0 para comenzar desde él
-    key[0] = 0
+    if n > 0:
+        key[0] = 0
     
     # Se inicializa la lista que contendrá las aristas del MST
     mst = []
     
+    # Con la instrumentación activa se separa el tiempo de selección del de relajación
+    recorder = instrumentation.active()
+    select_time = relax_time = 0.0
+    updates = 0
+    
     # Se seleccionan n vértices
     for _ in range(n):
+        if recorder is not None:
+            start = perf_counter()
+        
         # Se selecciona el vértice u con valor mínimo de clave que aún no ha sido incluido
         min_val = sys.maxsize
         u = -1
@@ -39,12 +84,24 @@ def prim(adj_matrix):
                 min_val = key[v]
                 u = v
         
-        # Si no se encontró un vértice válido (grafo desconectado), se termina el algoritmo
+        # Si no se encontró un vértice alcanzable (grafo desconectado), se
+        # comienza una nueva componente desde el menor vértice no visitado
         if u == -1:
-            break
+            while selected[root]:
+                root += 1
+            u = root
             
-        # Se marca el vértice como seleccionado
+        # Se marca el vértice como seleccionado; una raíz abre una nueva componente
         selected[u] = True
+        if parent[u] == -1:
+            labels[u] = count
+            count += 1
+        else:
+            labels[u] = labels[parent[u]]
+        
+        if recorder is not None:
+            middle = perf_counter()
+            select_time += middle - start
         
         # Se actualizan las claves de los vértices adyacentes
         for v in range(n):
@@ -52,13 +109,293 @@ def prim(adj_matrix):
             if adj_matrix[u][v] != 0 and not selected[v] and adj_matrix[u][v] < key[v]:
                 key[v] = adj_matrix[u][v]
                 parent[v] = u
+                updates += 1
+        
+        if recorder is not None:
+            relax_time += perf_counter() - middle
     
     # Se reconstruye el MST a partir del arreglo de padres
     for v in range(1, n):
         if parent[v] != -1:
             mst.append((parent[v], v, adj_matrix[parent[v]][v]))
     
-    return mst
+    if recorder is not None:
+        _report_dense(recorder, n, select_time, relax_time, updates, count)
+    
+    return mst, labels, count
+
+def prim_numpy(adj_matrix):
+    """
+    Ejecuta el algoritmo de Prim vectorizado con NumPy sobre una matriz densa.
+    
+    Cada iteración realiza un único `argmin` sobre las claves de los vértices
+    no seleccionados y una actualización de claves con operaciones sobre la
+    fila completa, en lugar de dos recorridos de n pasos en el intérprete.
+    Produce exactamente las mismas aristas que `prim`, incluido el bosque
+    de expansión mínima si el grafo no es conexo.
+    
+    Args:
+        adj_matrix: Matriz de adyacencias (lista de listas, ndarray 2-D o Graph).
+                    Un valor de 0 indica que no hay arista.
+    
+    Returns:
+        El MST como una lista de aristas en el formato (u, v, peso).
+    """
+    if np is None:
+        raise ImportError("prim_numpy requiere NumPy instalado")
+    return _prim_numpy(adj_matrix)[0]
+
+def _prim_numpy(adj_matrix):
+    """
+    Implementación de `prim_numpy` que además etiqueta la componente de cada vértice.
+    
+    Returns:
+        Tupla (aristas, etiquetas, número de componentes).
+    """
+    if isinstance(adj_matrix, Graph):
+        adj_matrix = adj_matrix.matrix()
+    weights = np.asarray(adj_matrix)
+    if weights.dtype.kind not in "iuf":
+        weights = weights.astype(np.int64)
+    n = weights.shape[0]
+    if n == 0:
+        return [], array('i'), 0
+    
+    # Se usa el máximo representable como infinito para no cambiar de tipo
+    if weights.dtype.kind == "f":
+        inf = np.inf
+    else:
+        weights = weights.astype(np.int64, copy=False)
+        inf = np.iinfo(np.int64).max
+    
+    # Las claves de los vértices ya seleccionados se mantienen en infinito,
+    # de modo que el argmin solo considera vértices pendientes
+    key = np.full(n, inf, dtype=weights.dtype)
+    parent = np.full(n, -1, dtype=np.int64)
+    pending = np.ones(n, dtype=bool)
+    update = np.empty(n, dtype=bool)
+    key[0] = 0
+    
+    # Componente de cada vértice, asignada al seleccionarlo
+    labels = array('i', [-1]) * n
+    count = 0
+    
+    # Con la instrumentación activa se separa el tiempo de selección del de relajación
+    recorder = instrumentation.active()
+    select_time = relax_time = 0.0
+    updates = 0
+    
+    for _ in range(n):
+        if recorder is not None:
+            start = perf_counter()
+        
+        # Se selecciona el vértice pendiente con menor clave
+        u = int(np.argmin(key))
+        if key[u] == inf:
+            # Grafo desconectado: se comienza una nueva componente desde el
+            # menor vértice pendiente
+            u = int(np.argmax(pending))
+        pending[u] = False
+        key[u] = inf
+        
+        # Una raíz abre una nueva componente; el resto hereda la de su padre
+        p = int(parent[u])
+        if p == -1:
+            labels[u] = count
+            count += 1
+        else:
+            labels[u] = labels[p]
+        
+        if recorder is not None:
+            middle = perf_counter()
+            select_time += middle - start
+        
+        # Se actualizan las claves de los vecinos no seleccionados de u
+        row = weights[u]
+        np.less(row, key, out=update)
+        update &= row != 0
+        update &= pending
+        np.copyto(key, row, where=update)
+        np.copyto(parent, u, where=update)
+        
+        if recorder is not None:
+            updates += int(np.count_nonzero(update))
+            relax_time += perf_counter() - middle
+    
+    # Se reconstruye el MST a partir del arreglo de padres
+    vertices = np.nonzero(parent[1:] != -1)[0] + 1
+    parents = parent[vertices]
+    mst_weights = weights[parents, vertices]
+    if recorder is not None:
+        _report_dense(recorder, n, select_time, relax_time, updates, count)
+    return list(zip(parents.tolist(), vertices.tolist(), mst_weights.tolist())), labels, count
+
+def _report_dense(recorder, n, select_time, relax_time, updates, components):
+    # Se agregan al registro las mediciones de una ejecución matricial de Prim
+    recorder.add_time("prim.select", select_time)
+    recorder.add_time("prim.relax", relax_time)
+    recorder.count("prim.vertices", n)
+    recorder.count("prim.key_updates", updates)
+    recorder.count("prim.components", components)
+
+def prim_dense(adj_matrix):
+    """
+    Ejecuta Prim sobre una matriz densa con la mejor implementación disponible.
+    
+    Usa la versión vectorizada si NumPy está instalado y la versión pura en otro caso.
+    """
+    if np is not None:
+        return prim_numpy(adj_matrix)
+    return prim(adj_matrix)
+
+def prim_heap(offsets, targets, weights):
+    """
+    Ejecuta el algoritmo de Prim sobre un grafo disperso en formato CSR.
+    
+    Utiliza un montículo binario con eliminación perezosa: en lugar de
+    disminuir claves, se insertan nuevas entradas y se descartan las
+    obsoletas al extraerlas. Si el grafo no es conexo, se reinicia desde
+    cada vértice no visitado y se obtiene el bosque de expansión mínima.
+    
+    Args:
+        offsets: Arreglo de tamaño n+1; los vecinos de u están en
+                 targets[offsets[u]:offsets[u+1]].
+        targets: Arreglo con los vecinos de cada vértice.
+        weights: Arreglo con el peso de cada entrada de targets.
+    
+    Returns:
+        El MST como una lista de aristas en el formato (u, v, peso).
+    """
+    return _prim_heap(offsets, targets, weights)[0]
+
+def _prim_heap(offsets, targets, weights):
+    """
+    Implementación de `prim_heap` que además etiqueta la componente de cada vértice.
+    
+    Returns:
+        Tupla (aristas, etiquetas, número de componentes).
+    """
+    # Se obtiene el número de vértices
+    n = len(offsets) - 1
+    if n <= 0:
+        return [], array('i'), 0
+    
+    selected = bytearray(n)
+    key = [sys.maxsize] * n
+    parent = [-1] * n
+    labels = array('i', [-1]) * n
+    count = 0
+    
+    # Se cuentan las inserciones en el montículo; cada una es una actualización de clave
+    pushes = 0
+    
+    # Cada vértice no visitado (en orden creciente) inicia una nueva componente
+    for root in range(n):
+        if selected[root]:
+            continue
+        key[root] = 0
+        heap = [(0, root)]
+        
+        while heap:
+            # Se extrae el vértice con menor clave; las entradas obsoletas se descartan
+            k, u = heappop(heap)
+            if selected[u] or k > key[u]:
+                continue
+            selected[u] = 1
+            labels[u] = count
+            
+            # Se relajan las aristas incidentes a u
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                w = weights[i]
+                if not selected[v] and w < key[v]:
+                    key[v] = w
+                    parent[v] = u
+                    heappush(heap, (w, v))
+                    pushes += 1
+        count += 1
+    
+    recorder = instrumentation.active()
+    if recorder is not None:
+        # Cada vértice sale una vez como válido; el resto de las extracciones son obsoletas
+        recorder.count("prim.vertices", n)
+        recorder.count("prim.key_updates", pushes)
+        recorder.count("prim.heap_pushes", pushes + count)
+        recorder.count("prim.stale_pops", pushes + count - n)
+        recorder.count("prim.edges_scanned", offsets[n] - offsets[0])
+        recorder.count("prim.components", count)
+    
+    # Se reconstruye el MST a partir del arreglo de padres
+    return [(parent[v], v, key[v]) for v in range(1, n) if parent[v] != -1], labels, count
+
+# Densidad 2m/n² (entradas no nulas de la matriz simétrica) a partir de la cual
+# conviene la versión matricial O(n²); equivale a m/n² = 0.125
+DENSE_THRESHOLD = 0.25
+
+def prim_auto(offsets, targets, weights, dense_threshold=DENSE_THRESHOLD):
+    """
+    Ejecuta Prim eligiendo la implementación según la densidad del grafo.
+    
+    Si la fracción de entradas no nulas de la matriz simétrica (2m/n², ya que
+    cada arista ocupa dos entradas) supera el umbral, se construye la matriz
+    y se usa la versión O(n²); en otro caso se usa el montículo sobre CSR,
+    O(m log n), sin materializar la matriz. Si alguna arista pesa 0 se usa
+    siempre el montículo, ya que en la matriz un 0 indica que no hay arista.
+    
+    Args:
+        offsets, targets, weights: Grafo en formato CSR.
+        dense_threshold: Densidad a partir de la cual se usa la matriz.
+    
+    Returns:
+        El MST como una lista de aristas en el formato (u, v, peso).
+    """
+    return prim_graph(Graph(offsets, targets, weights), dense_threshold)
+
+def prim_graph(graph, dense_threshold=DENSE_THRESHOLD):
+    """
+    Ejecuta Prim sobre un Graph eligiendo la implementación según su densidad.
+    
+    Igual que `prim_auto`, pero la matriz densa (si se usa) queda guardada en
+    el Graph y se reutiliza en las siguientes llamadas.
+    
+    Args:
+        graph: Graph con el grafo.
+        dense_threshold: Densidad a partir de la cual se usa la matriz.
+    
+    Returns:
+        El MST como una lista de aristas en el formato (u, v, peso).
+    """
+    if _use_dense(graph, dense_threshold):
+        return prim_dense(graph.matrix())
+    return prim_heap(*graph.csr())
+
+def _use_dense(graph, dense_threshold):
+    # La matriz se usa con grafos densos sin aristas de peso 0, que la matriz
+    # no distingue de la ausencia de arista
+    return graph.n > 0 and graph.density >= dense_threshold and not graph.has_zero_weights
+
+def prim_forest(graph, dense_threshold=DENSE_THRESHOLD):
+    """
+    Calcula el bosque de expansión mínima con Prim, separado por componentes.
+    
+    El recorrido se reinicia desde cada vértice no visitado, y la componente
+    de cada vértice se asigna en el mismo recorrido, al seleccionarlo.
+    
+    Args:
+        graph: Matriz de adyacencias (lista de listas o ndarray) o Graph. Con
+               un Graph se elige la matriz o el montículo según la densidad.
+        dense_threshold: Densidad a partir de la cual se usa la matriz.
+    
+    Returns:
+        SpanningForest con las aristas, el peso y los vértices de cada componente.
+    """
+    if isinstance(graph, Graph) and not _use_dense(graph, dense_threshold):
+        result = _prim_heap(*graph.csr())
+    elif np is not None:
+        result = _prim_numpy(graph)
+    else:
+        result = _prim_matrix(graph)
+    return group_by_component(*result)
 
 # Ejemplo de uso:
 if __name__ == "__main__":
@@ -77,4 +414,24 @@ if __name__ == "__main__":
     
     # Se calcula el peso total del MST
     total_weight = sum(weight for _, _, weight in mst)
-    print(f"Peso total del MST: {total_weight}") 
\ No newline at end of file
+    print(f"Peso total del MST: {total_weight}")
+    
+    # Se ejecuta la versión con montículo sobre la representación CSR
+    offsets, targets, weights = [0], [], []
+    for row in adj_matrix:
+        for v, w in enumerate(row):
+            if w != 0:
+                targets.append(v)
+                weights.append(w)
+        offsets.append(len(targets))
+    print("Árbol de expansión mínima (Prim con montículo):", prim_heap(offsets, targets, weights))
+
+    # En un grafo desconexo el recorrido se reinicia y se obtiene un árbol por componente
+    forest = prim_forest([[0, 1, 0, 0], [1, 0, 0, 0], [0, 0, 0, 4], [0, 0, 4, 0]])
+    print("Bosque de expansión mínima (Prim):", forest.edges, "pesos", forest.weights)
+    
+    # Una arista de peso 0 no cabe en la matriz (0 indica que no hay arista),
+    # así que con ella se usa el montículo aunque el grafo sea denso
+    graph = Graph(array('i', [0, 2, 4, 6]), array('i', [1, 2, 0, 2, 0, 1]), array('i', [0, 5, 0, 5, 5, 5]))
+    mst = prim_graph(graph)
+    print("MST con una arista de peso 0:", mst, "peso", sum(weight for _, _, weight in mst))
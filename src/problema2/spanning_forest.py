@@ -0,0 +1,58 @@
+from collections import namedtuple
+
+class SpanningForest(namedtuple("SpanningForest", ["edges", "weights", "labels"])):
+    """
+    Bosque de expansión mínima separado por componentes conexas.
+
+    Atributos:
+        edges: Lista con las aristas (u, v, peso) del árbol de cada componente.
+        weights: Lista con el peso total del árbol de cada componente.
+        labels: array('i') con la componente de cada vértice. Las componentes
+                se numeran según su menor vértice, de modo que el vértice 0
+                pertenece a la componente 0.
+    """
+    __slots__ = ()
+
+    @property
+    def component_count(self):
+        # Número de componentes conexas (los vértices aislados cuentan como una)
+        return len(self.weights)
+
+    @property
+    def total_weight(self):
+        # Peso total del bosque
+        return sum(self.weights)
+
+    @property
+    def is_connected(self):
+        # El grafo es conexo si el bosque tiene una sola componente
+        return len(self.weights) <= 1
+
+def group_by_component(edges, labels, count):
+    """
+    Reparte las aristas de un bosque entre sus componentes.
+
+    Args:
+        edges: Aristas (u, v, peso) del bosque.
+        labels: Componente de cada vértice, calculada por el algoritmo.
+        count: Número de componentes.
+
+    Returns:
+        SpanningForest con las aristas y el peso total de cada componente.
+    """
+    components = [[] for _ in range(count)]
+    weights = [0] * count
+    for edge in edges:
+        component = labels[edge[0]]
+        components[component].append(edge)
+        weights[component] += edge[2]
+    return SpanningForest(components, weights, labels)
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    from array import array
+
+    # Bosque con dos componentes: {0, 1, 2} y {3, 4}
+    forest = group_by_component([(0, 1, 2), (1, 2, 3), (3, 4, 1)], array('i', [0, 0, 0, 1, 1]), 2)
+    print("Aristas por componente:", forest.edges)
+    print("Peso por componente:", forest.weights, "total:", forest.total_weight)
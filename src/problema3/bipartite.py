@@ -1,21 +1,43 @@
+from array import array
 from collections import deque
+from time import perf_counter
 
-def is_bipartite(graph, n):
+from src.utils import instrumentation
+from src.utils.graph import Graph
+
+def is_bipartite(graph, n, certificate=False):
     """
     Determina si un grafo dado (en forma de lista de adyacencias) es bipartito.
     
     Args:
         graph: Diccionario que representa el grafo en formato de lista de adyacencias.
                Formato: {vertice: [vecino1, vecino2, ...], ...}
+               También se acepta un Graph, que se recorre con `is_bipartite_csr`.
         n: Número de vértices.
+        certificate: Si es True y el grafo no es bipartito, se retorna un
+                     ciclo impar como evidencia en lugar de None.
         
     Returns:
         Tupla (es_bipartito: bool, particiones: (set, set) o None)
         Si el grafo es bipartito, retorna los dos conjuntos disjuntos de vértices.
+        Si no lo es y se pidió el certificado, retorna la lista de vértices de
+        un ciclo impar (cada vértice es adyacente al siguiente y el último al primero).
     """
+    if isinstance(graph, Graph):
+        return is_bipartite_csr(graph.offsets, graph.targets, as_sets=True, certificate=certificate)
+    
+    # Con la instrumentación activa se cuentan vértices, aristas y ocupación de la cola
+    recorder = instrumentation.active()
+    if recorder is not None:
+        started = perf_counter()
+        visited = scanned = high = 0
+    
     # Se inicializa un diccionario para almacenar el color asignado a cada vértice
     colors = {}
     
+    # Padres del árbol BFS, solo si se pidió el certificado
+    parent = {} if certificate else None
+    
     # Se inicializan las particiones como conjuntos vacíos
     partitions = (set(), set())
     
@@ -25,12 +47,18 @@ def is_bipartite(graph, n):
             # Se asigna el color 0 al vértice inicial
             colors[start] = 0
             partitions[0].add(start)
+            if parent is not None:
+                parent[start] = -1
             
             # Se inicializa una cola para el recorrido BFS
             queue = deque([start])
             
             # Se realiza un recorrido BFS
             while queue:
+                if recorder is not None:
+                    high = max(high, len(queue))
+                    visited += 1
+                    scanned += len(graph.get(queue[0], []))
                 u = queue.popleft()
                 
                 # Se visitan todos los vecinos del vértice actual
@@ -40,13 +68,182 @@ def is_bipartite(graph, n):
                         colors[v] = 1 - colors[u]
                         partitions[colors[v]].add(v)
                         queue.append(v)
+                        if parent is not None:
+                            parent[v] = u
                     elif colors[v] == colors[u]:
                         # Se encontró un conflicto: el grafo no es bipartito
+                        if recorder is not None:
+                            _report_bfs(recorder, started, visited, scanned, high, False)
+                        if parent is not None:
+                            return (False, odd_cycle(parent, u, v))
                         return (False, None)
     
     # Si no se encontraron conflictos, el grafo es bipartito
+    if recorder is not None:
+        _report_bfs(recorder, started, visited, scanned, high, True)
     return (True, partitions)
 
+def odd_cycle(parent, u, v):
+    """
+    Reconstruye un ciclo impar a partir de los padres del árbol BFS.
+    
+    Si u y v son adyacentes, tienen el mismo color y pertenecen al mismo
+    árbol BFS, los caminos de ambos hasta su ancestro común más cercano
+    junto con la arista (u, v) forman un ciclo de longitud impar.
+    
+    Args:
+        parent: Padre de cada vértice en el árbol BFS (-1 para la raíz).
+        u, v: Extremos de la arista en conflicto.
+    
+    Returns:
+        Lista de vértices del ciclo, comenzando en u y terminando en v.
+    """
+    # Se recorre el camino de u hasta la raíz recordando la posición de cada ancestro
+    path_u = []
+    position = {}
+    x = u
+    while x != -1:
+        position[x] = len(path_u)
+        path_u.append(x)
+        x = parent[x]
+    
+    # Se sube desde v hasta encontrar el primer ancestro común
+    path_v = []
+    x = v
+    while x not in position:
+        path_v.append(x)
+        x = parent[x]
+    
+    # Ciclo: u -> ... -> ancestro común -> ... -> v (y la arista v-u lo cierra)
+    path_v.reverse()
+    return path_u[:position[x] + 1] + path_v
+
+def is_bipartite_csr(offsets, targets, as_sets=False, certificate=False):
+    """
+    Determina si un grafo en formato CSR es bipartito.
+    
+    Los colores se guardan en un arreglo de enteros de 8 bits (-1 indica un
+    vértice sin color) y la cola del BFS es un arreglo preasignado de tamaño
+    n, por lo que no se crean diccionarios, conjuntos ni nodos de cola.
+    
+    Args:
+        offsets: Arreglo de tamaño n+1; los vecinos de u están en
+                 targets[offsets[u]:offsets[u+1]].
+        targets: Arreglo con los vecinos de cada vértice.
+        as_sets: Si es True, las particiones se retornan como dos conjuntos,
+                 igual que `is_bipartite`.
+        certificate: Si es True y el grafo no es bipartito, se retorna un
+                     ciclo impar (lista de vértices) en lugar de None.
+        
+    Returns:
+        Tupla (es_bipartito: bool, colores o particiones)
+        Si el grafo es bipartito, retorna el arreglo de colores (0 o 1 por
+        vértice) o, con as_sets=True, los dos conjuntos disjuntos de vértices.
+        Si no lo es, retorna None en lugar de los colores.
+    """
+    n = len(offsets) - 1
+    
+    # Se inicializan todos los vértices sin color
+    colors = array('b', [-1]) * n
+    
+    # Cola del BFS: cada vértice entra una sola vez, así que basta con n posiciones
+    queue = array('i', bytes(4 * n))
+    
+    # Padres del árbol BFS, solo si se pidió el certificado
+    parent = array('i', [-1]) * n if certificate else None
+    
+    # Con la instrumentación activa se cuentan vértices, aristas y ocupación de la cola
+    recorder = instrumentation.active()
+    if recorder is not None:
+        started = perf_counter()
+        visited = scanned = high = 0
+    
+    # Se procesa cada componente (en caso de que el grafo no sea conexo)
+    for start in range(n):
+        if colors[start] != -1:
+            continue
+        
+        # Se asigna el color 0 al vértice inicial
+        colors[start] = 0
+        queue[0] = start
+        head, tail = 0, 1
+        
+        # Se realiza un recorrido BFS
+        while head < tail:
+            u = queue[head]
+            if recorder is not None:
+                high = max(high, tail - head)
+                visited += 1
+                scanned += offsets[u + 1] - offsets[u]
+            head += 1
+            opposite = 1 - colors[u]
+            
+            # Se visitan todos los vecinos del vértice actual
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                color = colors[v]
+                if color == -1:
+                    # Se asigna el color opuesto al vecino no visitado
+                    colors[v] = opposite
+                    queue[tail] = v
+                    tail += 1
+                    if parent is not None:
+                        parent[v] = u
+                elif color != opposite:
+                    # Se encontró un conflicto: el grafo no es bipartito
+                    if recorder is not None:
+                        _report_bfs(recorder, started, visited, scanned, high, False)
+                    if parent is not None:
+                        return (False, odd_cycle(parent, u, v))
+                    return (False, None)
+    
+    # Si no se encontraron conflictos, el grafo es bipartito
+    if recorder is not None:
+        _report_bfs(recorder, started, visited, scanned, high, True)
+    if as_sets:
+        return (True, partitions_from_colors(colors))
+    return (True, colors)
+
+def _report_bfs(recorder, started, visited, scanned, high, bipartite):
+    # Se agregan al registro las mediciones de una verificación de bipartición
+    recorder.add_time("bipartite.bfs", perf_counter() - started)
+    recorder.count("bipartite.vertices_visited", visited)
+    recorder.count("bipartite.edges_scanned", scanned)
+    recorder.maximum("bipartite.queue_high_water", high)
+    recorder.count("bipartite.conflicts", int(not bipartite))
+
+def partitions_from_colors(colors):
+    """
+    Construye los dos conjuntos de vértices a partir de un arreglo de colores.
+    
+    Args:
+        colors: Secuencia con el color (0 o 1) de cada vértice.
+    
+    Returns:
+        Tupla (set, set) con los vértices de color 0 y de color 1.
+    """
+    partitions = (set(), set())
+    for v, color in enumerate(colors):
+        partitions[color].add(v)
+    return partitions
+
+def adjacency_to_csr(graph, n):
+    """
+    Convierte un diccionario de listas de vecinos a arreglos CSR.
+    
+    Args:
+        graph: Diccionario {vertice: [vecino1, vecino2, ...], ...}.
+        n: Número de vértices.
+    
+    Returns:
+        Tupla (offsets, targets)
+    """
+    offsets = array('i', [0])
+    targets = array('i')
+    for u in range(n):
+        targets.extend(graph.get(u, []))
+        offsets.append(len(targets))
+    return offsets, targets
+
 def print_bipartite_result(result, partitions):
     """
     Imprime el resultado de la verificación de bipartición.
@@ -85,4 +282,11 @@ if __name__ == "__main__":
     
     print("\nEjemplo 2 (ciclo impar):")
     result, parts = is_bipartite(non_bipartite_graph, 3)
+    print_bipartite_result(result, parts)
+    
+    result, cycle = is_bipartite(non_bipartite_graph, 3, certificate=True)
+    print(f"Ciclo impar encontrado: {cycle}")
+    
+    print("\nEjemplo 3 (ciclo par, representación CSR):")
+    result, parts = is_bipartite_csr(*adjacency_to_csr(bipartite_graph, 4), as_sets=True)
     print_bipartite_result(result, parts) 
\ No newline at end of file
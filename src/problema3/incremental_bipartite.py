@@ -0,0 +1,165 @@
+from array import array
+
+from src.problema3.bipartite import partitions_from_colors
+
+class IncrementalBipartite:
+    """
+    Verificación incremental de bipartición bajo inserción de aristas.
+
+    Se mantiene un Union-Find en el que cada vértice guarda, además de su
+    padre, la paridad (XOR) de su color respecto al padre. Dos vértices del
+    mismo conjunto tienen el mismo color si y solo si sus paridades hasta la
+    raíz coinciden, de modo que una arista (u, v) rompe la bipartición
+    exactamente cuando une dos vértices del mismo conjunto con igual paridad.
+    Cada inserción cuesta O(α(n)) amortizado.
+    """
+    __slots__ = ("n", "parent", "rank", "parity", "conflict", "edge_count")
+
+    def __init__(self, n):
+        # Se inicializa cada vértice como su propio padre con paridad 0
+        self.n = n
+        self.parent = array('i', range(n))
+        self.rank = array('B', bytes(n))
+        self.parity = array('B', bytes(n))
+        # Primera arista (u, v) que rompió la bipartición, o None si aún es bipartito
+        self.conflict = None
+        # Número de aristas insertadas hasta el momento
+        self.edge_count = 0
+
+    @classmethod
+    def from_graph(cls, graph, n):
+        """
+        Construye el verificador a partir de un grafo en listas de vecinos.
+
+        Args:
+            graph: Diccionario {vertice: [vecino1, vecino2, ...], ...}.
+            n: Número de vértices.
+
+        Returns:
+            IncrementalBipartite con todas las aristas del grafo insertadas.
+        """
+        checker = cls(n)
+        checker.add_edges((u, v) for u in range(n) for v in graph.get(u, []) if u <= v)
+        return checker
+
+    def _find(self, u):
+        # Se busca la raíz de u y la paridad de u respecto a ella
+        parent = self.parent
+        parity = self.parity
+
+        # Primera pasada: se sube hasta la raíz acumulando la paridad
+        root = u
+        total = 0
+        while parent[root] != root:
+            total ^= parity[root]
+            root = parent[root]
+
+        # Segunda pasada: compresión de caminos, cada nodo apunta a la raíz
+        # con su paridad directa hacia ella
+        x = u
+        remaining = total
+        while parent[x] != root and x != root:
+            next_x = parent[x]
+            next_remaining = remaining ^ parity[x]
+            parent[x] = root
+            parity[x] = remaining
+            x = next_x
+            remaining = next_remaining
+        return root, total
+
+    @property
+    def is_bipartite(self):
+        # El grafo es bipartito mientras ninguna arista haya generado un conflicto
+        return self.conflict is None
+
+    def add_edge(self, u, v):
+        """
+        Inserta la arista (u, v).
+
+        Returns:
+            True si el grafo sigue siendo bipartito después de la inserción.
+        """
+        self.edge_count += 1
+        root_u, parity_u = self._find(u)
+        root_v, parity_v = self._find(v)
+
+        if root_u == root_v:
+            # Ambos extremos ya están en el mismo conjunto: igual paridad implica ciclo impar
+            if parity_u == parity_v and self.conflict is None:
+                self.conflict = (u, v)
+            return self.conflict is None
+
+        # Se une el árbol de menor rango al de mayor rango, fijando la paridad
+        # de la raíz absorbida para que u y v queden con colores distintos
+        if self.rank[root_u] < self.rank[root_v]:
+            root_u, root_v = root_v, root_u
+        self.parent[root_v] = root_u
+        self.parity[root_v] = parity_u ^ parity_v ^ 1
+        if self.rank[root_u] == self.rank[root_v]:
+            self.rank[root_u] += 1
+        return self.conflict is None
+
+    def add_edges(self, edges):
+        """
+        Inserta un lote de aristas en orden.
+
+        Args:
+            edges: Iterable de pares (u, v).
+
+        Returns:
+            Posición, dentro del lote, de la primera arista que rompió la
+            bipartición, o -1 si ninguna arista del lote la rompió.
+        """
+        first = -1
+        add_edge = self.add_edge
+        was_bipartite = self.conflict is None
+        for k, (u, v) in enumerate(edges):
+            if not add_edge(u, v) and was_bipartite and first == -1:
+                first = k
+        return first
+
+    def colors(self):
+        """
+        Calcula el color actual de cada vértice.
+
+        Los colores se normalizan para que el menor vértice de cada componente
+        tenga color 0, igual que en `is_bipartite`.
+
+        Returns:
+            array('b') con el color (0 o 1) de cada vértice, o None si el
+            grafo no es bipartito.
+        """
+        if self.conflict is not None:
+            return None
+        colors = array('b', bytes(self.n))
+        flip = {}
+        for v in range(self.n):
+            root, parity = self._find(v)
+            if root not in flip:
+                flip[root] = parity
+            colors[v] = parity ^ flip[root]
+        return colors
+
+    def partitions(self):
+        """
+        Calcula las particiones actuales del grafo.
+
+        Returns:
+            Tupla (set, set) con los dos conjuntos de vértices, idéntica a la
+            que retorna `is_bipartite`, o None si el grafo no es bipartito.
+        """
+        colors = self.colors()
+        if colors is None:
+            return None
+        return partitions_from_colors(colors)
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    # Se insertan las aristas de un ciclo de longitud 4 y luego una diagonal
+    checker = IncrementalBipartite(4)
+    print("Ciclo par, conflicto en la posición:", checker.add_edges([(0, 1), (1, 2), (2, 3), (3, 0)]))
+    print("Particiones:", checker.partitions())
+
+    # La diagonal (0, 2) forma un triángulo y rompe la bipartición
+    print("¿Sigue siendo bipartito tras (0, 2)?", checker.add_edge(0, 2))
+    print("Primera arista en conflicto:", checker.conflict)
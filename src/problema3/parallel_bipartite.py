@@ -0,0 +1,312 @@
+import os
+from array import array
+
+from src.problema2.kruskal import UnionFind
+from src.problema3.bipartite import adjacency_to_csr, is_bipartite_csr, odd_cycle, partitions_from_colors
+from src.utils import instrumentation
+from src.utils.graph import Graph
+
+# NumPy es opcional: vectoriza el etiquetado de componentes
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Por debajo de este número de aristas no compensa repartir el trabajo entre procesos
+PARALLEL_MIN_EDGES = 200000
+
+# Número de lotes por proceso: más lotes equilibran mejor la carga y permiten
+# descartar antes el trabajo pendiente cuando se encuentra un ciclo impar
+SHARDS_PER_WORKER = 4
+
+# Estado de cada proceso trabajador: vistas sobre los arreglos compartidos
+_state = {}
+
+def label_components(offsets, targets):
+    """
+    Etiqueta las componentes conexas de un grafo en formato CSR.
+
+    Con NumPy se enganchan repetidamente las raíces de los extremos de cada
+    arista a la menor de las dos y se comprimen los caminos con saltos de
+    punteros, todo con operaciones vectorizadas sobre los arreglos de
+    aristas. Sin NumPy se usa Union-Find en una sola pasada.
+
+    Returns:
+        Tupla (etiquetas, número de componentes). Las etiquetas son un
+        array('i') numerado según el menor vértice de cada componente, el
+        mismo orden en que `is_bipartite` recorre las componentes.
+    """
+    n = len(offsets) - 1
+    if np is None:
+        uf = UnionFind(n)
+        for u in range(n):
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                if u < v:
+                    uf.union(u, v)
+        return uf.component_labels(), uf.component_count
+
+    rows = np.repeat(np.arange(n, dtype=np.int64), np.diff(np.asarray(offsets, dtype=np.int64)))
+    cols = np.asarray(targets, dtype=np.int64)
+    # Cada arista aparece en ambos extremos; basta con una copia
+    keep = rows < cols
+    rows, cols = rows[keep], cols[keep]
+    parent = np.arange(n, dtype=np.int64)
+    while True:
+        # Raíces de ambos extremos; las aristas internas a un árbol se descartan
+        ru = parent[rows]
+        rv = parent[cols]
+        crossing = ru != rv
+        if not crossing.any():
+            break
+        rows, cols = rows[crossing], cols[crossing]
+        ru, rv = ru[crossing], rv[crossing]
+
+        # Se engancha la raíz mayor a la menor y se comprimen los caminos. Si
+        # una raíz aparece en varias aristas queda enganchada a una cualquiera
+        # de ellas, todas menores que ella, así que no se forman ciclos
+        parent[np.maximum(ru, rv)] = np.minimum(ru, rv)
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+
+    # Cada raíz es el menor vértice de su componente, así que numerar las
+    # raíces en orden da las etiquetas en el orden de `is_bipartite`
+    is_root = parent == np.arange(n)
+    labels = (np.cumsum(is_root, dtype=np.int32) - 1)[parent]
+    column = array('i')
+    column.frombytes(labels.tobytes())
+    return column, int(np.count_nonzero(is_root))
+
+def _component_starts(labels, count):
+    # Se obtienen el menor vértice y el tamaño de cada componente
+    if np is not None:
+        _, starts, sizes = np.unique(np.asarray(labels), return_index=True, return_counts=True)
+        return starts.tolist(), sizes.tolist()
+    starts = array('i', [-1]) * count
+    sizes = array('i', [0]) * count
+    for v, label in enumerate(labels):
+        if starts[label] == -1:
+            starts[label] = v
+        sizes[label] += 1
+    return starts, sizes
+
+def _make_shards(starts, sizes, target):
+    """
+    Agrupa componentes consecutivas en lotes de aproximadamente `target` vértices.
+
+    Las componentes grandes quedan solas en su lote y las pequeñas se
+    acumulan, de modo que miles de componentes diminutas no se convierten en
+    miles de tareas. Los lotes conservan el orden de las componentes.
+
+    Returns:
+        Lista de listas con el vértice inicial de cada componente del lote.
+    """
+    shards = []
+    current = []
+    total = 0
+    for start, size in zip(starts, sizes):
+        current.append(start)
+        total += size
+        if total >= target:
+            shards.append(current)
+            current = []
+            total = 0
+    if current:
+        shards.append(current)
+    return shards
+
+def _attach(names, lengths, certificate):
+    """
+    Inicializa un proceso trabajador conectándolo a la memoria compartida.
+
+    Args:
+        names: Nombres de los bloques compartidos (offsets, targets, colores y,
+               si se pidió el certificado, padres).
+        lengths: Número de elementos de cada bloque.
+        certificate: Si es True se registran los padres del BFS.
+    """
+    from multiprocessing import shared_memory
+
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    _state["blocks"] = blocks
+    formats = ['i', 'i', 'b', 'i']
+    _state["columns"] = [block.buf.cast(code)[:length] for block, code, length in zip(blocks, formats, lengths)]
+    _state["certificate"] = certificate
+    # Cola del BFS: cada vértice entra una sola vez, así que basta con n posiciones
+    _state["queue"] = array('i', bytes(4 * lengths[2]))
+
+def _color_shard(index, shard):
+    """
+    Colorea con BFS las componentes de un lote, en orden.
+
+    El recorrido es el mismo que el de `is_bipartite_csr`, por lo que los
+    colores y el primer conflicto de cada componente coinciden con los de la
+    versión secuencial. Cada componente ocupa vértices distintos, así que
+    los procesos escriben en el arreglo compartido de colores sin conflictos.
+
+    Returns:
+        Tupla (índice del lote, conflicto), donde el conflicto es None si
+        todas las componentes son bipartitas, o el ciclo impar (o True si no
+        se pidió el certificado) de la primera componente que no lo es.
+    """
+    columns = _state["columns"]
+    offsets, targets, colors = columns[:3]
+    parent = columns[3] if _state["certificate"] else None
+    queue = _state["queue"]
+
+    for start in shard:
+        colors[start] = 0
+        if parent is not None:
+            parent[start] = -1
+        queue[0] = start
+        head, tail = 0, 1
+        while head < tail:
+            u = queue[head]
+            head += 1
+            opposite = 1 - colors[u]
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                color = colors[v]
+                if color == -1:
+                    colors[v] = opposite
+                    queue[tail] = v
+                    tail += 1
+                    if parent is not None:
+                        parent[v] = u
+                elif color != opposite:
+                    if parent is not None:
+                        return index, odd_cycle(parent, u, v)
+                    return index, True
+    return index, None
+
+def is_bipartite_parallel(graph, n, workers=None, certificate=False):
+    """
+    Determina si un grafo es bipartito coloreando sus componentes en paralelo.
+
+    Primero se etiquetan las componentes conexas (ver `label_components`) y
+    se agrupan en lotes de tamaño similar, que un grupo de procesos colorea
+    con BFS sobre los arreglos CSR en memoria compartida. En cuanto un
+    proceso encuentra un ciclo impar se descarta el trabajo pendiente: sin
+    certificado, todo; con certificado, solo los lotes posteriores, ya que
+    el ciclo debe ser el de la primera componente no bipartita.
+
+    El resultado es idéntico al de `is_bipartite`: cada componente se
+    recorre desde su menor vértice y en el mismo orden que la versión
+    secuencial.
+
+    Args:
+        graph: Graph o diccionario {vertice: [vecino1, vecino2, ...], ...}.
+        n: Número de vértices.
+        workers: Número de procesos; por defecto, el número de núcleos.
+                 Con 1, con grafos pequeños o con una sola componente se
+                 ejecuta la versión secuencial.
+        certificate: Si es True y el grafo no es bipartito, se retorna un
+                     ciclo impar en lugar de None.
+
+    Returns:
+        Tupla (es_bipartito: bool, particiones: (set, set) o None), o el
+        ciclo impar si se pidió el certificado, igual que `is_bipartite`.
+    """
+    if isinstance(graph, Graph):
+        offsets, targets = graph.offsets, graph.targets
+    else:
+        offsets, targets = adjacency_to_csr(graph, n)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1 or len(targets) // 2 < PARALLEL_MIN_EDGES:
+        return is_bipartite_csr(offsets, targets, as_sets=True, certificate=certificate)
+
+    with instrumentation.phase("bipartite.components"):
+        labels, count = label_components(offsets, targets)
+    if count == 1:
+        return is_bipartite_csr(offsets, targets, as_sets=True, certificate=certificate)
+
+    starts, sizes = _component_starts(labels, count)
+    shards = _make_shards(starts, sizes, -(-n // (workers * SHARDS_PER_WORKER)))
+
+    with instrumentation.phase("bipartite.parallel_bfs"):
+        return _color_shared(offsets, targets, n, shards, workers, certificate)
+
+def _color_shared(offsets, targets, n, shards, workers, certificate):
+    """
+    Colorea los lotes con un grupo de procesos y combina sus resultados.
+
+    Returns:
+        El resultado de `is_bipartite_parallel`.
+    """
+    from multiprocessing import Pool, shared_memory
+
+    columns = [_int_column(offsets), _int_column(targets), array('b', [-1]) * n]
+    if certificate:
+        columns.append(array('i', [-1]) * n)
+
+    lengths = [len(column) for column in columns]
+    blocks = []
+    colors = None
+    try:
+        for column in columns:
+            size = max(1, len(column) * column.itemsize)
+            block = shared_memory.SharedMemory(create=True, size=size)
+            blocks.append(block)
+            block.buf[:len(column) * column.itemsize] = column.tobytes()
+        del columns
+
+        conflict = None
+        conflict_shard = len(shards)
+        pending = set(range(len(shards)))
+        with Pool(workers, initializer=_attach, initargs=([block.name for block in blocks], lengths, certificate)) as pool:
+            for index, found in pool.imap_unordered(_color_shard_task, enumerate(shards)):
+                pending.discard(index)
+                if found is not None and index < conflict_shard:
+                    conflict, conflict_shard = found, index
+                    if not certificate:
+                        break
+                # Con certificado solo importan los lotes anteriores al conflicto
+                if conflict is not None and not any(i < conflict_shard for i in pending):
+                    break
+            # Al salir del bloque se terminan los procesos con trabajo pendiente
+
+        if conflict is not None:
+            return (False, conflict if certificate else None)
+        colors = blocks[2].buf.cast('b')[:n]
+        return (True, partitions_from_colors(colors))
+    finally:
+        if colors is not None:
+            colors.release()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+def _color_shard_task(task):
+    # Adaptador para `imap_unordered`, que pasa un solo argumento
+    return _color_shard(*task)
+
+def _int_column(column):
+    # Se obtiene una copia de la columna como array('i') para la memoria compartida
+    if isinstance(column, array) and column.typecode == 'i':
+        return column
+    if np is not None:
+        result = array('i')
+        result.frombytes(np.asarray(column, dtype=np.int32).tobytes())
+        return result
+    return array('i', column)
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    from src.problema3.bipartite import is_bipartite
+    from src.utils.test_generator import generate_bipartite_graph
+
+    # Bosque de 2000 componentes bipartitas independientes
+    graph = {}
+    size = 200
+    for k in range(2000):
+        component, _ = generate_bipartite_graph(size, edge_probability=0.05)
+        for u, neighbors in component.items():
+            graph[k * size + u] = [k * size + v for v in neighbors]
+    n = 2000 * size
+
+    result, parts = is_bipartite_parallel(graph, n)
+    print("Bipartito:", result)
+    print("Coincide con la versión secuencial:", (result, parts) == is_bipartite(graph, n))
@@ -0,0 +1,155 @@
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Algoritmos disponibles en modo de lote
+ALGORITHMS = ("kruskal", "prim", "bipartite", "boruvka")
+
+def collect_files(patterns):
+    """
+    Expande directorios y patrones glob a una lista ordenada de archivos.
+
+    Args:
+        patterns: Lista de directorios, patrones glob o rutas de archivos.
+                  Los directorios se recorren recursivamente buscando case_*.
+
+    Returns:
+        Lista ordenada y sin duplicados de rutas de archivos.
+    """
+    files = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            files.update(glob.glob(os.path.join(pattern, "**", "case_*"), recursive=True))
+        else:
+            files.update(glob.glob(pattern, recursive=True))
+    return sorted(path for path in files if os.path.isfile(path))
+
+def infer_algorithm(path):
+    """
+    Deduce el algoritmo a partir del directorio del caso de prueba.
+
+    Returns:
+        "kruskal", "prim" o "bipartite" según el nombre del directorio, o None.
+    """
+    parent = os.path.basename(os.path.dirname(os.path.abspath(path)))
+    return parent if parent in ("kruskal", "prim", "bipartite") else None
+
+def _count_matrix_edges(matrix):
+    # Número de aristas de una matriz simétrica (entradas no nulas / 2)
+    if hasattr(matrix, "nonzero"):
+        return int((matrix != 0).sum()) // 2
+    return sum(len(row) - list(row).count(0) for row in matrix) // 2
+
+def solve_file(path, algorithm):
+    """
+    Carga un archivo y ejecuta un algoritmo sobre él, midiendo ambos tiempos.
+
+    Args:
+        path: Ruta del caso de prueba.
+        algorithm: Uno de ALGORITHMS.
+
+    Returns:
+        Diccionario con el archivo, el algoritmo, n, m, los tiempos de carga y
+        de ejecución, y el resultado (peso del MST y número de componentes, o
+        veredicto de bipartición y si coincide con el esperado por el archivo).
+        Si ocurre un error, el diccionario contiene la clave "error".
+    """
+    # Se importan aquí para que cada proceso trabajador cargue solo lo necesario
+    from src import main
+    from src.problema2.boruvka import boruvka
+    from src.problema2.kruskal import kruskal
+    from src.problema2.prim import prim_auto, prim_dense
+    from src.problema3.bipartite import is_bipartite_csr
+
+    record = {"file": path, "algorithm": algorithm}
+    csr = None
+    try:
+        parse_start = time.perf_counter()
+        if algorithm in ("kruskal", "boruvka"):
+            edges, n = main.load_graph_adjacency_list(path)
+            m = len(edges)
+        elif algorithm == "prim":
+            if main.is_adjacency_list_file(path):
+                csr, n = main.load_graph_csr(path)
+                m = len(csr[1]) // 2
+            else:
+                matrix, n = main.load_graph_adjacency_matrix(path)
+                m = _count_matrix_edges(matrix)
+        elif algorithm == "bipartite":
+            (offsets, targets), n, expected = main.load_bipartite_case(path)
+            m = len(targets) // 2
+        else:
+            raise ValueError(f"Algoritmo desconocido: {algorithm}")
+        parse_time = time.perf_counter() - parse_start
+
+        solve_start = time.perf_counter()
+        if algorithm == "kruskal":
+            result = kruskal(edges, n)
+        elif algorithm == "boruvka":
+            result = boruvka(edges, n, 1)
+        elif algorithm == "prim":
+            result = prim_auto(*csr) if csr is not None else prim_dense(matrix)
+        else:
+            result = is_bipartite_csr(offsets, targets)
+        solve_time = time.perf_counter() - solve_start
+    except Exception as error:
+        record["error"] = f"{type(error).__name__}: {error}"
+        return record
+
+    record["n"] = n
+    record["m"] = m
+    if algorithm == "bipartite":
+        record["is_bipartite"] = result[0]
+        if expected is not None:
+            record["matches_expected"] = result[0] == expected[0]
+    else:
+        record["mst_edges"] = len(result)
+        record["mst_weight"] = sum(weight for _, _, weight in result)
+        # Un bosque de expansión con k componentes tiene n - k aristas
+        record["components"] = n - len(result)
+    record["parse_time"] = parse_time
+    record["solve_time"] = solve_time
+    return record
+
+def run_batch(patterns, algorithms=None, workers=None, ordered=False, output=None):
+    """
+    Ejecuta algoritmos sobre muchos archivos en paralelo y emite JSON lines.
+
+    Args:
+        patterns: Directorios, patrones glob o archivos a procesar.
+        algorithms: Algoritmos a ejecutar sobre cada archivo. Si es None, se
+                    deduce de cada archivo por el nombre de su directorio.
+        workers: Número de procesos; por defecto, el número de núcleos.
+        ordered: Si es True, los resultados se emiten en el orden de los
+                 archivos; si es False, a medida que terminan.
+        output: Archivo donde se escriben los resultados (por defecto, stdout).
+
+    Returns:
+        Número de tareas con error.
+    """
+    output = output or sys.stdout
+
+    # Se arma la lista de tareas (archivo, algoritmo)
+    tasks = []
+    for path in collect_files(patterns):
+        for algorithm in algorithms or [infer_algorithm(path)]:
+            if algorithm is not None:
+                tasks.append((path, algorithm))
+
+    errors = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(solve_file, path, algorithm) for path, algorithm in tasks]
+        for future in (futures if ordered else as_completed(futures)):
+            record = future.result()
+            errors += "error" in record
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+    return errors
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    # Se procesan todos los casos de prueba del repositorio en orden
+    run_batch(["tests"], ordered=True)
@@ -0,0 +1,333 @@
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from src.utils.test_generator import (
+    generate_bipartite_graph, generate_random_weighted_graph,
+    write_bipartite_case, write_kruskal_case, write_prim_case,
+)
+
+# Parámetros por defecto de la grilla de tamaños y densidades
+DEFAULT_SIZES = (100, 200, 400, 800)
+DEFAULT_DENSITIES = (0.05, 0.3)
+DEFAULT_REPEATS = 3
+
+# Factor de tolerancia al comparar contra una línea base
+DEFAULT_TOLERANCE = 1.25
+
+# Parámetros por defecto de la medición de consultas de cuello de botella
+DEFAULT_QUERIES = 10 ** 6
+DEFAULT_QUERY_VERTICES = 100000
+DEFAULT_QUERY_DEGREE = 4
+
+def _engines():
+    """
+    Define los motores a medir como tripletas (formato, carga, ejecución).
+
+    El formato indica qué archivo de la instancia se usa; la carga recibe su
+    ruta y retorna el grafo que recibe la función de ejecución.
+    """
+    from src import main
+    from src.problema2.kruskal import kruskal
+    from src.problema2.prim import prim_dense, prim_heap
+    from src.problema3.bipartite import is_bipartite_csr
+
+    return {
+        "kruskal": ("kruskal", main.load_graph_adjacency_list, lambda graph: kruskal(*graph)),
+        "prim": ("prim", main.load_graph_adjacency_matrix, lambda graph: prim_dense(graph[0])),
+        "prim_heap": ("kruskal", main.load_graph_csr, lambda graph: prim_heap(*graph[0])),
+        "bipartite": ("bipartite", main.load_bipartite_csr, lambda graph: is_bipartite_csr(*graph[0])),
+    }
+
+def _write_instance(directory, n, density, seed):
+    """
+    Genera una instancia de la grilla y la guarda en los tres formatos de texto.
+
+    Returns:
+        Diccionario {formato: ruta} y el número de aristas del grafo ponderado.
+    """
+    random.seed(seed)
+    adj_list, adj_matrix = generate_random_weighted_graph(n, edge_probability=density)
+    bipartite_adj_list, partitions = generate_bipartite_graph(n, edge_probability=density)
+
+    paths = {
+        "kruskal": os.path.join(directory, f"kruskal_{n}_{density}.txt"),
+        "prim": os.path.join(directory, f"prim_{n}_{density}.txt"),
+        "bipartite": os.path.join(directory, f"bipartite_{n}_{density}.txt"),
+    }
+    write_kruskal_case(paths["kruskal"], n, adj_list)
+    write_prim_case(paths["prim"], adj_matrix)
+    write_bipartite_case(paths["bipartite"], n, bipartite_adj_list, partitions)
+
+    m = sum(len(neighbors) for neighbors in adj_list.values()) // 2
+    return paths, m
+
+def _measure(load, solve, path, repeats):
+    """
+    Mide por separado los tiempos de carga y de ejecución, y la memoria pico.
+
+    Returns:
+        Diccionario con los tiempos (mínimo y mediana, en segundos) y la
+        memoria pico de cada fase (en bytes) según tracemalloc.
+    """
+    parse_times = []
+    solve_times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        graph = load(path)
+        parse_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        solve(graph)
+        solve_times.append(time.perf_counter() - start)
+
+    # La memoria se mide en una ejecución aparte para no alterar los tiempos;
+    # cada fase se rastrea por separado para que sus picos no se mezclen
+    tracemalloc.start()
+    graph = load(path)
+    parse_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    solve(graph)
+    solve_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "parse_min": min(parse_times),
+        "parse_median": statistics.median(parse_times),
+        "solve_min": min(solve_times),
+        "solve_median": statistics.median(solve_times),
+        "parse_peak_bytes": parse_peak,
+        "solve_peak_bytes": solve_peak,
+    }
+
+def fit_exponent(xs, ys):
+    """
+    Ajusta por mínimos cuadrados la pendiente de log(y) contra log(x).
+
+    Si y ≈ c·x^k, la pendiente estimada es el exponente k.
+
+    Returns:
+        El exponente estimado, o None si hay menos de dos puntos válidos.
+    """
+    points = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return covariance / variance
+
+def run_benchmark(sizes=DEFAULT_SIZES, densities=DEFAULT_DENSITIES, repeats=DEFAULT_REPEATS,
+                  engines=None, seed=0):
+    """
+    Ejecuta la grilla de mediciones y calcula los exponentes de crecimiento.
+
+    Args:
+        sizes: Números de vértices a medir.
+        densities: Probabilidades de arista a medir.
+        repeats: Repeticiones de cada medición de tiempo.
+        engines: Nombres de los motores a medir (por defecto, todos).
+        seed: Semilla base para generar las instancias.
+
+    Returns:
+        Diccionario con los metadatos, cada medición y los exponentes
+        ajustados de tiempo de ejecución contra n y contra n + m.
+    """
+    available = _engines()
+    engines = list(engines or available)
+    results = []
+
+    directory = tempfile.mkdtemp(prefix="benchmark_")
+    try:
+        for density in densities:
+            for n in sizes:
+                paths, m = _write_instance(directory, n, density, seed + n)
+                for name in engines:
+                    graph_format, load, solve = available[name]
+                    record = {"engine": name, "n": n, "m": m, "density": density}
+                    record.update(_measure(load, solve, paths[graph_format], repeats))
+                    results.append(record)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    # Se ajusta un exponente por motor y densidad
+    exponents = {}
+    for name in engines:
+        for density in densities:
+            rows = [r for r in results if r["engine"] == name and r["density"] == density]
+            exponents[f"{name}@{density}"] = {
+                "solve_vs_n": fit_exponent([r["n"] for r in rows], [r["solve_median"] for r in rows]),
+                "solve_vs_size": fit_exponent([r["n"] + r["m"] for r in rows], [r["solve_median"] for r in rows]),
+                "parse_vs_n": fit_exponent([r["n"] for r in rows], [r["parse_median"] for r in rows]),
+            }
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": repeats,
+            "seed": seed,
+        },
+        "results": results,
+        "exponents": exponents,
+    }
+
+def measure_bottleneck(n=DEFAULT_QUERY_VERTICES, queries=DEFAULT_QUERIES, degree=DEFAULT_QUERY_DEGREE,
+                       repeats=DEFAULT_REPEATS, seed=0):
+    """
+    Mide el rendimiento del índice de cuellos de botella sobre pares aleatorios.
+
+    Se genera un grafo disperso con n vértices y degree·n aristas de pesos
+    aleatorios, se construye el índice a partir de `kruskal` y se responden
+    todas las consultas en una sola llamada a `bottleneck_many`.
+
+    Returns:
+        Diccionario con n, m, el número de consultas, el tiempo de
+        construcción, la mediana del tiempo de las consultas y las consultas
+        por segundo.
+    """
+    from array import array
+    from src.problema2.bottleneck import BottleneckIndex
+    from src.problema2.kruskal import kruskal
+    from src.utils.edge_list import EdgeList
+
+    rng = random.Random(seed)
+    m = degree * n
+    edges = EdgeList(array('i', (rng.randrange(n) for _ in range(m))),
+                     array('i', (rng.randrange(n) for _ in range(m))),
+                     array('i', (rng.randrange(1, 1000000) for _ in range(m))))
+    us = array('i', (rng.randrange(n) for _ in range(queries)))
+    vs = array('i', (rng.randrange(n) for _ in range(queries)))
+
+    start = time.perf_counter()
+    index = BottleneckIndex(n, kruskal(edges, n))
+    build_time = time.perf_counter() - start
+
+    query_times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        index.bottleneck_many(us, vs)
+        query_times.append(time.perf_counter() - start)
+
+    query_median = statistics.median(query_times)
+    return {
+        "n": n, "m": m, "queries": queries,
+        "build_seconds": build_time,
+        "query_median": query_median,
+        "queries_per_second": queries / query_median if query_median > 0 else None,
+    }
+
+def compare_reports(report, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compara un reporte contra una línea base y detecta regresiones.
+
+    Una medición es una regresión si su mediana de carga o de ejecución supera
+    a la de la misma (motor, n, densidad) en la línea base por más del factor dado.
+
+    Returns:
+        Lista de diccionarios con las mediciones que empeoraron.
+    """
+    reference = {(r["engine"], r["n"], r["density"]): r for r in baseline["results"]}
+    regressions = []
+    for row in report["results"]:
+        base = reference.get((row["engine"], row["n"], row["density"]))
+        if base is None:
+            continue
+        for field in ("solve_median", "parse_median"):
+            if base[field] > 0 and row[field] > base[field] * tolerance:
+                regressions.append({
+                    "engine": row["engine"], "n": row["n"], "density": row["density"],
+                    "field": field, "baseline": base[field], "current": row[field],
+                    "ratio": row[field] / base[field],
+                })
+    return regressions
+
+def main(argv=None):
+    """
+    Punto de entrada de línea de comandos del benchmark.
+
+    Returns:
+        Código de salida: 1 si hubo regresiones respecto a la línea base, 0 en otro caso.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="main.py 8", description="Mide el escalamiento de los algoritmos.")
+    parser.add_argument("--tamanos", default=",".join(map(str, DEFAULT_SIZES)), help="Números de vértices separados por comas")
+    parser.add_argument("--densidades", default=",".join(map(str, DEFAULT_DENSITIES)), help="Densidades separadas por comas")
+    parser.add_argument("--repeticiones", type=int, default=DEFAULT_REPEATS, help="Repeticiones por medición")
+    parser.add_argument("--motores", default=None, help="Motores separados por comas (por defecto, todos)")
+    parser.add_argument("--salida", default=None, help="Archivo JSON donde se guarda el reporte")
+    parser.add_argument("--base", default=None, help="Reporte JSON de referencia para detectar regresiones")
+    parser.add_argument("--tolerancia", type=float, default=DEFAULT_TOLERANCE, help="Factor de tolerancia frente a la base")
+    parser.add_argument("--consultas", type=int, default=None,
+                        help="Medir en su lugar el índice de cuellos de botella con este número de consultas")
+    parser.add_argument("--vertices", type=int, default=DEFAULT_QUERY_VERTICES,
+                        help="Número de vértices del grafo de las consultas")
+    args = parser.parse_args(argv)
+
+    if args.consultas is not None:
+        result = measure_bottleneck(args.vertices, args.consultas, repeats=args.repeticiones)
+        print(f"Cuello de botella n={result['n']} m={result['m']}: construcción={result['build_seconds']:.3f}s "
+              f"{result['queries']} consultas={result['query_median']:.3f}s "
+              f"({result['queries_per_second']:.0f} consultas/s)")
+        if args.salida:
+            with open(args.salida, "w") as f:
+                json.dump({"bottleneck": result}, f, indent=2)
+            print(f"Reporte guardado en {args.salida}")
+        return 0
+
+    engines = args.motores.split(",") if args.motores else None
+    available = _engines()
+    if engines and any(e not in available for e in engines):
+        print(f"Los motores deben estar entre: {', '.join(available)}")
+        return 1
+
+    report = run_benchmark(
+        sizes=[int(x) for x in args.tamanos.split(",")],
+        densities=[float(x) for x in args.densidades.split(",")],
+        repeats=args.repeticiones,
+        engines=engines,
+    )
+
+    for row in report["results"]:
+        print(f"{row['engine']:>10} n={row['n']:<6} p={row['density']:<5} m={row['m']:<8} "
+              f"carga={row['parse_median']:.6f}s ejecución={row['solve_median']:.6f}s "
+              f"memoria={row['solve_peak_bytes'] / 1024:.0f}KiB")
+    for key, fitted in report["exponents"].items():
+        exponent = fitted["solve_vs_n"]
+        print(f"Exponente de {key} (ejecución contra n): {exponent:.2f}" if exponent is not None
+              else f"Exponente de {key}: no disponible")
+
+    if args.salida:
+        with open(args.salida, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Reporte guardado en {args.salida}")
+
+    if args.base:
+        with open(args.base) as f:
+            baseline = json.load(f)
+        regressions = compare_reports(report, baseline, args.tolerancia)
+        for r in regressions:
+            print(f"Regresión: {r['engine']} n={r['n']} p={r['density']} {r['field']} "
+                  f"{r['baseline']:.6f}s -> {r['current']:.6f}s (x{r['ratio']:.2f})")
+        if regressions:
+            return 1
+        print("Sin regresiones respecto a la línea base.")
+    return 0
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from src.utils.edge_list import EdgeList
+
+# NumPy es opcional: permite exponer la matriz densa como ndarray sin copias
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Encabezado: firma, tipo de contenido, indicador de pesos, n y número de entradas
+MAGIC = b"DALGOGR1"
+HEADER = struct.Struct("<8sIIqq")
+
+# Tipos de contenido del archivo
+KIND_EDGES = 1   # Columnas u, v, w (una copia por arista), para Kruskal y Borůvka
+KIND_DENSE = 2   # Matriz n x n, para Prim
+KIND_CSR = 3     # offsets, targets y opcionalmente weights, para BFS y Prim con montículo
+
+def _write_column(f, values):
+    # Se escribe una columna como enteros de 32 bits en orden little-endian
+    column = values if isinstance(values, array) and values.typecode == 'i' else array('i', values)
+    if sys.byteorder != "little":
+        column = array('i', column)
+        column.byteswap()
+    column.tofile(f)
+
+def write_edges(filename, edges, n):
+    """
+    Guarda un EdgeList en formato binario.
+
+    Args:
+        filename: Ruta del archivo de salida.
+        edges: EdgeList con una copia de cada arista.
+        n: Número de vértices.
+    """
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, KIND_EDGES, 1, n, len(edges)))
+        _write_column(f, edges.u)
+        _write_column(f, edges.v)
+        _write_column(f, edges.w)
+
+def write_dense(filename, matrix):
+    """
+    Guarda una matriz de adyacencias en formato binario (int32 fila por fila).
+
+    Args:
+        filename: Ruta del archivo de salida.
+        matrix: Matriz n x n (lista de listas o ndarray).
+    """
+    n = len(matrix)
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, KIND_DENSE, 1, n, n * n))
+        for row in matrix:
+            _write_column(f, row)
+
+def write_csr(filename, offsets, targets, weights=None):
+    """
+    Guarda un grafo en formato CSR binario.
+
+    Args:
+        filename: Ruta del archivo de salida.
+        offsets: Arreglo de tamaño n+1 con el inicio de cada fila.
+        targets: Arreglo con los vecinos de cada vértice.
+        weights: Arreglo opcional con el peso de cada entrada de targets.
+    """
+    n = len(offsets) - 1
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, KIND_CSR, int(weights is not None), n, len(targets)))
+        _write_column(f, offsets)
+        _write_column(f, targets)
+        if weights is not None:
+            _write_column(f, weights)
+
+def is_binary_graph_file(filename):
+    """
+    Indica si un archivo comienza con la firma del formato binario.
+    """
+    with open(filename, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+class CSRAdjacency:
+    """
+    Vista de solo lectura de un grafo CSR con la interfaz de un diccionario
+    de listas de adyacencias ({vertice: [vecinos]}), para `is_bipartite`.
+    """
+    __slots__ = ("offsets", "targets")
+
+    def __init__(self, offsets, targets):
+        self.offsets = offsets
+        self.targets = targets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        return iter(range(len(self)))
+
+    def __contains__(self, u):
+        return 0 <= u < len(self)
+
+    def __getitem__(self, u):
+        if u not in self:
+            raise KeyError(u)
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def get(self, u, default=None):
+        if u not in self:
+            return default
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+class BinaryGraph:
+    """
+    Grafo cargado desde un archivo binario mapeado en memoria.
+
+    Todas las columnas son vistas (`memoryview` de enteros de 32 bits) sobre
+    el archivo mapeado, por lo que la carga no copia ni interpreta los datos.
+    """
+    __slots__ = ("kind", "n", "columns", "_mmap")
+
+    def __init__(self, kind, n, columns, mapped):
+        self.kind = kind
+        self.n = n
+        self.columns = columns
+        self._mmap = mapped
+
+    def edges(self):
+        # Columnas u, v, w como EdgeList sin copias (para Kruskal y Borůvka)
+        if self.kind != KIND_EDGES:
+            raise ValueError("El archivo no contiene una lista de aristas")
+        return EdgeList(*self.columns)
+
+    def matrix(self):
+        # Matriz densa como ndarray (si NumPy está disponible) o lista de filas
+        if self.kind != KIND_DENSE:
+            raise ValueError("El archivo no contiene una matriz densa")
+        data = self.columns[0]
+        n = self.n
+        if np is not None:
+            return np.frombuffer(data, dtype="<i4").reshape(n, n)
+        return [data[i * n:(i + 1) * n] for i in range(n)]
+
+    def csr(self):
+        # Tupla (offsets, targets, weights); weights es None si no hay pesos
+        if self.kind != KIND_CSR:
+            raise ValueError("El archivo no contiene un grafo CSR")
+        offsets, targets = self.columns[:2]
+        weights = self.columns[2] if len(self.columns) > 2 else None
+        return offsets, targets, weights
+
+    def adjacency(self):
+        # Vista tipo diccionario de listas de vecinos (para is_bipartite)
+        offsets, targets, _ = self.csr()
+        return CSRAdjacency(offsets, targets)
+
+def load_binary_graph(filename):
+    """
+    Carga un grafo en formato binario mapeando el archivo en memoria.
+
+    Args:
+        filename: Ruta al archivo.
+
+    Returns:
+        BinaryGraph con vistas sin copia sobre las columnas del archivo.
+
+    Raises:
+        ValueError: si el archivo no tiene la firma del formato, su tipo de
+                    contenido es desconocido o es más corto de lo que indica
+                    el encabezado.
+    """
+    if sys.byteorder != "little":
+        raise ValueError("El formato binario solo puede mapearse en plataformas little-endian")
+
+    with open(filename, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(mapped) < HEADER.size:
+        mapped.close()
+        raise ValueError(f"Archivo binario truncado: {filename} no contiene el encabezado completo")
+
+    magic, kind, has_weights, n, m = HEADER.unpack_from(mapped)
+    if magic != MAGIC:
+        mapped.close()
+        raise ValueError(f"{filename} no es un archivo de grafo binario")
+
+    # Se calcula el tamaño de cada columna según el tipo de contenido
+    if kind == KIND_EDGES:
+        sizes = [m, m, m]
+    elif kind == KIND_DENSE:
+        sizes = [m]
+    elif kind == KIND_CSR:
+        sizes = [n + 1, m] + ([m] if has_weights else [])
+    else:
+        mapped.close()
+        raise ValueError(f"Tipo de contenido desconocido: {kind}")
+
+    # Se verifica que el archivo contenga todas las columnas que indica el encabezado
+    expected = HEADER.size + 4 * sum(sizes)
+    size = len(mapped)
+    if n < 0 or m < 0 or size < expected:
+        mapped.close()
+        raise ValueError(f"Archivo binario truncado: {filename} tiene {size} bytes "
+                         f"y el encabezado indica {expected}")
+
+    data = memoryview(mapped)
+    columns = []
+    position = HEADER.size
+    for size in sizes:
+        columns.append(data[position:position + 4 * size].cast('i'))
+        position += 4 * size
+
+    return BinaryGraph(kind, n, columns, mapped)
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    # Se guarda y se vuelve a cargar un grafo de ejemplo
+    edges = EdgeList()
+    for u, v, w in [(0, 1, 4), (0, 2, 3), (1, 2, 1), (1, 3, 2), (2, 3, 4)]:
+        edges.append(u, v, w)
+
+    path = os.path.join(tempfile.mkdtemp(), "grafo.bin")
+    write_edges(path, edges, 4)
+    graph = load_binary_graph(path)
+    print("Aristas cargadas:", list(graph.edges()))
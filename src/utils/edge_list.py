@@ -0,0 +1,242 @@
+from array import array
+
+# NumPy es opcional: habilita el ordenamiento por conteo/radix de los pesos
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Rango máximo de pesos enteros que se ordena con una sola pasada de radix (16 bits)
+RADIX_BITS = 16
+
+def integer_typecode(column):
+    """
+    Retorna el código de tipo de una columna de enteros tipada.
+    
+    Se aceptan arreglos `array` y vistas `memoryview` (por ejemplo, sobre un
+    archivo mapeado en memoria) de enteros.
+    
+    Returns:
+        El código de tipo ('i', 'q', ...) o None si la columna no es de enteros.
+    """
+    if isinstance(column, array):
+        code = column.typecode
+    elif isinstance(column, memoryview):
+        code = column.format
+    else:
+        return None
+    return code if code in "bBhHiIlLqQ" else None
+
+class EdgeList:
+    """
+    Almacén compacto de aristas no dirigidas en columnas tipadas.
+
+    Cada arista (u, v, peso) se guarda en tres arreglos `array('i')`
+    paralelos, de modo que un grafo con millones de aristas ocupa 12 bytes
+    por arista en lugar de una tupla de Python por arista.
+    """
+    __slots__ = ("u", "v", "w")
+
+    def __init__(self, u=None, v=None, w=None):
+        # Se inicializan las columnas vacías si no se reciben arreglos existentes
+        self.u = u if u is not None else array('i')
+        self.v = v if v is not None else array('i')
+        self.w = w if w is not None else array('i')
+
+    def append(self, u, v, weight):
+        # Se agrega una arista al final de las tres columnas
+        self.u.append(u)
+        self.v.append(v)
+        self.w.append(weight)
+
+    def __len__(self):
+        return len(self.w)
+
+    def __iter__(self):
+        # Se recorren las aristas como tuplas (u, v, peso) sin materializarlas
+        return zip(self.u, self.v, self.w)
+
+    def to_csr(self, n):
+        """
+        Construye la representación CSR (no dirigida) de las aristas.
+
+        Args:
+            n: Número de vértices.
+
+        Returns:
+            Tupla (offsets, targets, weights) donde los vecinos del vértice u
+            son targets[offsets[u]:offsets[u+1]] con pesos en las mismas posiciones.
+        """
+        us, vs, ws = self.u, self.v, self.w
+
+        # Se cuenta el grado de cada vértice (cada arista aparece en ambos extremos)
+        offsets = array('i', bytes(4 * (n + 1)))
+        for u in us:
+            offsets[u + 1] += 1
+        for v in vs:
+            offsets[v + 1] += 1
+
+        # Se acumulan los grados para obtener el inicio de cada fila
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        # Se colocan las aristas en su fila utilizando un cursor por vértice
+        total = offsets[n]
+        targets = array('i', bytes(4 * total))
+        if integer_typecode(ws):
+            weights = array(integer_typecode(ws), bytes(ws.itemsize * total))
+        else:
+            weights = [0] * total
+        cursor = array('i', offsets[:n])
+        for u, v, weight in zip(us, vs, ws):
+            i = cursor[u]
+            targets[i] = v
+            weights[i] = weight
+            cursor[u] = i + 1
+            j = cursor[v]
+            targets[j] = u
+            weights[j] = weight
+            cursor[v] = j + 1
+
+        return offsets, targets, weights
+
+    def sorted_by_weight(self):
+        """
+        Retorna una copia de las aristas ordenada de forma estable por peso.
+        
+        Si los pesos son enteros acotados y NumPy está disponible, se usa un
+        ordenamiento radix sobre la columna de pesos: una pasada de 16 bits
+        cuando el rango max - min cabe en 16 bits y dos pasadas cuando cabe en
+        32. Para pesos flotantes o rangos mayores se usa un ordenamiento por
+        comparación con la columna como clave, sin funciones lambda por arista.
+        
+        Returns:
+            EdgeList ordenado; las aristas de igual peso conservan su orden.
+        """
+        us, vs, ws = self.u, self.v, self.w
+        m = len(ws)
+        
+        code = integer_typecode(ws)
+        if np is not None and m and code:
+            weights = np.asarray(ws)
+            order = _radix_argsort(weights)
+            if order is not None:
+                return EdgeList(
+                    _take(us, order),
+                    _take(vs, order),
+                    _take(ws, order),
+                )
+        
+        # Ordenamiento por comparación (estable) con la columna de pesos como clave
+        order = sorted(range(m), key=ws.__getitem__)
+        sorted_w = [ws[i] for i in order]
+        return EdgeList(
+            array('i', map(us.__getitem__, order)),
+            array('i', map(vs.__getitem__, order)),
+            array(code, sorted_w) if code else sorted_w,
+        )
+
+    @classmethod
+    def from_adjacency_list(cls, graph):
+        """
+        Construye el almacén a partir de un diccionario de listas de adyacencias.
+
+        Args:
+            graph: Diccionario {vertice: [(vecino, peso), ...], ...}.
+
+        Returns:
+            EdgeList con una única copia (u < v) de cada arista.
+        """
+        us, vs, ws = array('i'), array('i'), []
+        for u in graph:
+            for v, weight in graph[u]:
+                # Solo se agrega una vez cada arista para grafos no dirigidos
+                if u < v:
+                    us.append(u)
+                    vs.append(v)
+                    ws.append(weight)
+        return cls(us, vs, _compact_weights(ws))
+
+def _compact_weights(weights):
+    """
+    Convierte una lista de pesos al arreglo tipado más compacto posible.
+
+    Los pesos enteros que caben en 32 bits se guardan como `array('i')`;
+    cualquier otro caso (flotantes, enteros enormes) conserva la lista.
+    """
+    try:
+        return array('i', weights)
+    except (TypeError, OverflowError):
+        return weights
+
+def _radix_argsort(weights):
+    """
+    Calcula la permutación estable que ordena un arreglo de enteros acotados.
+    
+    NumPy ordena de forma estable los enteros de 16 bits o menos con radix
+    sort, por lo que se normalizan los pesos a partir del mínimo y se ordena
+    por dígitos de 16 bits, del menos al más significativo.
+    
+    Returns:
+        Arreglo de índices, o None si el rango de pesos supera 32 bits.
+    """
+    low = int(weights.min())
+    span = int(weights.max()) - low
+    if span >= 1 << (2 * RADIX_BITS):
+        return None
+    
+    shifted = weights.astype(np.int64) - low
+    digit_mask = (1 << RADIX_BITS) - 1
+    
+    # Primera pasada: dígito menos significativo
+    order = np.argsort((shifted & digit_mask).astype(np.uint16), kind="stable")
+    
+    # Segunda pasada (solo si el rango lo requiere): dígito más significativo
+    if span >> RADIX_BITS:
+        high = (shifted[order] >> RADIX_BITS).astype(np.uint16)
+        order = order[np.argsort(high, kind="stable")]
+    return order
+
+def _take(column, order):
+    # Se reordena una columna tipada y se retorna como arreglo del mismo tipo
+    result = array(integer_typecode(column))
+    result.frombytes(np.asarray(column)[order].tobytes())
+    return result
+
+def read_adjacency_list(f):
+    """
+    Lee en streaming un grafo en formato "v: vecino-peso, vecino-peso".
+
+    El archivo se procesa línea por línea y las aristas se escriben
+    directamente en un EdgeList, conservando solo las que cumplen u < v.
+
+    Args:
+        f: Archivo de texto abierto, posicionado al inicio.
+
+    Returns:
+        Tupla (EdgeList, número de vértices)
+    """
+    # La primera línea contiene el número de vértices
+    n = int(f.readline())
+
+    edges = EdgeList()
+    us, vs, ws = edges.u, edges.v, edges.w
+
+    # Se procesan las n líneas siguientes, una por vértice
+    for line in f:
+        vertex, sep, rest = line.partition(":")
+        if not sep:
+            continue
+        u = int(vertex)
+
+        for edge in rest.split(","):
+            neighbor, sep, weight = edge.partition("-")
+            if not sep:
+                continue
+            v = int(neighbor)
+            if u < v:
+                us.append(u)
+                vs.append(v)
+                ws.append(int(weight))
+
+    return edges, n
@@ -0,0 +1,295 @@
+from array import array
+
+from src.utils.binary_format import KIND_CSR, KIND_DENSE, KIND_EDGES, CSRAdjacency
+from src.utils.edge_list import EdgeList, _compact_weights, integer_typecode
+
+# NumPy es opcional: acelera la construcción de la matriz densa y de las aristas
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def csr_to_matrix(offsets, targets, weights):
+    """
+    Construye la matriz de adyacencias densa equivalente a un grafo CSR.
+
+    Returns:
+        Matriz n x n (ndarray si NumPy está disponible, lista de listas en
+        otro caso), con 0 donde no hay arista. Las aristas de peso 0 no se
+        distinguen de la ausencia de arista (ver `Graph.has_zero_weights`).
+    """
+    n = len(offsets) - 1
+    if np is not None:
+        # Se llena la matriz con una sola asignación vectorizada
+        matrix = np.zeros((n, n), dtype=np.asarray(weights).dtype)
+        rows = np.repeat(np.arange(n), np.diff(np.asarray(offsets)))
+        matrix[rows, np.asarray(targets)] = weights
+        return matrix
+
+    matrix = [[0] * n for _ in range(n)]
+    for u in range(n):
+        row = matrix[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            row[targets[i]] = weights[i]
+    return matrix
+
+class Graph:
+    """
+    Grafo no dirigido inmutable en formato CSR, compartido por todos los algoritmos.
+
+    Los vecinos de u son targets[offsets[u]:offsets[u+1]] y sus pesos están
+    en las mismas posiciones de weights (None si el grafo no es ponderado,
+    en cuyo caso cada arista pesa 1). Cada arista aparece en ambos extremos.
+
+    A partir de la misma instancia se obtienen, sin volver a leer el archivo:
+    la lista de aristas para Kruskal y Borůvka (`edges`), los vecinos para
+    BFS y Prim con montículo (`neighbors`, `csr`), una vista tipo diccionario
+    para `is_bipartite` (`adjacency`) y la matriz densa para Prim (`matrix`).
+    La lista de aristas y la matriz se construyen la primera vez que se piden.
+    """
+    __slots__ = ("n", "offsets", "targets", "weights", "_edges", "_matrix")
+
+    def __init__(self, offsets, targets, weights=None, edges=None):
+        """
+        Args:
+            offsets: Arreglo de tamaño n+1 con el inicio de cada fila.
+            targets: Arreglo con los vecinos de cada vértice.
+            weights: Arreglo con el peso de cada entrada de targets, o None.
+            edges: EdgeList con una copia de cada arista, si ya se tiene;
+                   se reutiliza en lugar de reconstruirlo desde el CSR.
+        """
+        set_field = object.__setattr__
+        set_field(self, "n", len(offsets) - 1)
+        set_field(self, "offsets", offsets)
+        set_field(self, "targets", targets)
+        set_field(self, "weights", weights)
+        set_field(self, "_edges", edges)
+        set_field(self, "_matrix", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Graph es inmutable")
+
+    def __reduce__(self):
+        # Se serializan solo las columnas CSR, para enviar el grafo a otros
+        # procesos; las vistas sobre archivos mapeados se copian
+        return (Graph, tuple(_picklable(column) for column in (self.offsets, self.targets, self.weights)))
+
+    @classmethod
+    def from_edges(cls, edges, n):
+        """
+        Construye el grafo a partir de un EdgeList (una copia de cada arista).
+        """
+        return cls(*edges.to_csr(n), edges=edges)
+
+    @classmethod
+    def from_adjacency_list(cls, graph, n):
+        """
+        Construye el grafo a partir de un diccionario {vertice: [(vecino, peso), ...], ...}.
+
+        Se conserva el orden de los vecinos de cada vértice, de modo que
+        `edges()` produce las aristas en el mismo orden que
+        `EdgeList.from_adjacency_list`.
+        """
+        offsets = array('i', [0])
+        targets = array('i')
+        weights = []
+        for u in range(n):
+            for v, weight in graph.get(u, []):
+                targets.append(v)
+                weights.append(weight)
+            offsets.append(len(targets))
+        return cls(offsets, targets, _compact_weights(weights))
+
+    @classmethod
+    def from_neighbor_lists(cls, graph, n):
+        """
+        Construye un grafo no ponderado a partir de {vertice: [vecino1, vecino2, ...], ...}.
+        """
+        offsets = array('i', [0])
+        targets = array('i')
+        for u in range(n):
+            targets.extend(graph.get(u, []))
+            offsets.append(len(targets))
+        return cls(offsets, targets)
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """
+        Construye el grafo a partir de una matriz de adyacencias (0 indica que no hay arista).
+
+        La matriz recibida se conserva como la matriz densa del grafo.
+        """
+        n = len(matrix)
+        if np is not None:
+            dense = np.asarray(matrix)
+            rows, cols = np.nonzero(dense)
+            offsets = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(rows, minlength=n), out=offsets[1:])
+            graph = cls(_int_column(offsets), _int_column(cols), _compact_weights(dense[rows, cols].tolist()))
+        else:
+            offsets = array('i', [0])
+            targets = array('i')
+            weights = []
+            for row in matrix:
+                for v, weight in enumerate(row):
+                    if weight != 0:
+                        targets.append(v)
+                        weights.append(weight)
+                offsets.append(len(targets))
+            graph = cls(offsets, targets, _compact_weights(weights))
+        object.__setattr__(graph, "_matrix", matrix)
+        return graph
+
+    @classmethod
+    def from_binary(cls, binary):
+        """
+        Construye el grafo a partir de un BinaryGraph (ver `load_binary_graph`).
+
+        Las columnas CSR del archivo se usan directamente, sin copias.
+        """
+        if binary.kind == KIND_EDGES:
+            return cls.from_edges(binary.edges(), binary.n)
+        if binary.kind == KIND_DENSE:
+            return cls.from_matrix(binary.matrix())
+        if binary.kind == KIND_CSR:
+            return cls(*binary.csr())
+        raise ValueError(f"Tipo de contenido desconocido: {binary.kind}")
+
+    def __len__(self):
+        # Número de vértices
+        return self.n
+
+    @property
+    def m(self):
+        # Número de aristas (cada arista aparece dos veces en targets)
+        return len(self.targets) // 2
+
+    @property
+    def density(self):
+        # Fracción de entradas no nulas de la matriz de adyacencias simétrica; cada
+        # arista ocupa dos entradas, así que vale 2m/n²
+        return len(self.targets) / (self.n * self.n) if self.n else 0.0
+
+    @property
+    def has_zero_weights(self):
+        # Indica si alguna arista pesa 0; la matriz densa no la distingue de
+        # la ausencia de arista
+        if self.weights is None:
+            return False
+        if np is not None:
+            return not np.all(np.asarray(self.weights))
+        return 0 in self.weights
+
+    def neighbors(self, u):
+        # Vecinos de u como rebanada del arreglo targets
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def neighbor_weights(self, u):
+        # Pesos de las aristas de u, en el mismo orden que neighbors(u)
+        start, stop = self.offsets[u], self.offsets[u + 1]
+        if self.weights is None:
+            return [1] * (stop - start)
+        return self.weights[start:stop]
+
+    def csr(self):
+        """
+        Retorna la tupla (offsets, targets, weights) para Prim con montículo.
+
+        Si el grafo no es ponderado, todas las aristas pesan 1.
+        """
+        weights = self.weights
+        if weights is None:
+            weights = array('i', [1]) * len(self.targets)
+        return self.offsets, self.targets, weights
+
+    def adjacency(self):
+        # Vista tipo diccionario {vertice: vecinos} para `is_bipartite`
+        return CSRAdjacency(self.offsets, self.targets)
+
+    def edges(self):
+        """
+        Retorna un EdgeList con una copia (u < v) de cada arista, para Kruskal y Borůvka.
+
+        Las aristas quedan ordenadas por u y, dentro de cada u, en el orden de
+        sus vecinos. El resultado se construye una sola vez y se reutiliza.
+        """
+        if self._edges is None:
+            object.__setattr__(self, "_edges", self._build_edges())
+        return self._edges
+
+    def _build_edges(self):
+        offsets, targets, weights = self.csr()
+        if np is not None and integer_typecode(weights):
+            # Se toma la entrada (u, v) de cada arista con u < v en una sola pasada vectorizada
+            columns = np.asarray(targets)
+            rows = np.repeat(np.arange(self.n), np.diff(np.asarray(offsets)))
+            keep = rows < columns
+            return EdgeList(_int_column(rows[keep]), _int_column(columns[keep]),
+                            _int_column(np.asarray(weights)[keep], integer_typecode(weights)))
+
+        edges = EdgeList()
+        if not integer_typecode(weights):
+            edges.w = []
+        for u in range(self.n):
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if u < v:
+                    edges.append(u, v, weights[i])
+        return edges
+
+    def matrix(self):
+        """
+        Retorna la matriz de adyacencias densa, para Prim en su versión O(n²).
+
+        Se construye la primera vez que se pide (ndarray si NumPy está
+        disponible, lista de listas en otro caso) y se reutiliza.
+        """
+        if self._matrix is None:
+            object.__setattr__(self, "_matrix", csr_to_matrix(*self.csr()))
+        return self._matrix
+
+def _int_column(values, typecode='i'):
+    # Se convierte un ndarray de enteros a un arreglo tipado sin pasar por objetos de Python
+    column = array(typecode)
+    column.frombytes(np.asarray(values, dtype=np.dtype(typecode)).tobytes())
+    return column
+
+def _picklable(column):
+    # Se copia una vista de memoria a un arreglo tipado, que sí puede serializarse
+    if isinstance(column, memoryview):
+        copy = array(column.format)
+        copy.frombytes(column.cast('B'))
+        return copy
+    return column
+
+def as_edge_list(graph):
+    """
+    Obtiene la lista de aristas de un grafo en cualquiera de los formatos aceptados.
+
+    Args:
+        graph: Graph, EdgeList o diccionario {vertice: [(vecino, peso), ...], ...}.
+
+    Returns:
+        EdgeList con una copia (u < v) de cada arista.
+    """
+    if isinstance(graph, EdgeList):
+        return graph
+    if isinstance(graph, Graph):
+        return graph.edges()
+    return EdgeList.from_adjacency_list(graph)
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    # Se construye el grafo una sola vez a partir de su lista de adyacencias
+    adjacency = {
+        0: [(1, 4), (2, 3)],
+        1: [(0, 4), (2, 1), (3, 2)],
+        2: [(0, 3), (1, 1), (3, 4)],
+        3: [(1, 2), (2, 4)]
+    }
+    graph = Graph.from_adjacency_list(adjacency, 4)
+
+    # Se obtienen las vistas que usan los distintos algoritmos
+    print("Aristas (Kruskal):", list(graph.edges()))
+    print("Vecinos de 1 (BFS y Prim con montículo):", list(graph.neighbors(1)), list(graph.neighbor_weights(1)))
+    print("Matriz densa (Prim):", graph.matrix())
@@ -0,0 +1,175 @@
+import json
+import time
+from contextlib import contextmanager
+
+# Registro activo, o None si la instrumentación está desactivada. Los
+# algoritmos lo consultan una vez por llamada, de modo que desactivada solo
+# cuesta una comparación con None fuera de los ciclos internos.
+_active = None
+
+class Recorder:
+    """
+    Acumula tiempos por fase y contadores de los algoritmos instrumentados.
+
+    Las fases y los contadores se nombran como "algoritmo.nombre" (por
+    ejemplo "kruskal.sort" o "unionfind.find_steps") y se acumulan entre
+    llamadas hasta que se reinicia el registro.
+    """
+    __slots__ = ("phases", "counters")
+
+    def __init__(self):
+        # {fase: [segundos, llamadas]}
+        self.phases = {}
+        # {contador: valor}
+        self.counters = {}
+
+    def add_time(self, name, seconds):
+        # Se acumula el tiempo de una fase
+        entry = self.phases.get(name)
+        if entry is None:
+            self.phases[name] = [seconds, 1]
+        else:
+            entry[0] += seconds
+            entry[1] += 1
+
+    def count(self, name, amount=1):
+        # Se incrementa un contador
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def maximum(self, name, value):
+        # Se conserva el mayor valor observado (por ejemplo, un máximo de ocupación)
+        if value > self.counters.get(name, value - 1):
+            self.counters[name] = value
+
+    @contextmanager
+    def phase(self, name):
+        # Se mide el tiempo del bloque y se acumula en la fase
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def reset(self):
+        self.phases.clear()
+        self.counters.clear()
+
+    def to_dict(self):
+        """
+        Retorna las mediciones como un diccionario serializable.
+        """
+        return {
+            "phases": {name: {"seconds": seconds, "calls": calls}
+                       for name, (seconds, calls) in sorted(self.phases.items())},
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def to_json(self, filename=None):
+        """
+        Exporta las mediciones en JSON.
+
+        Args:
+            filename: Archivo de salida; si es None solo se retorna el texto.
+
+        Returns:
+            El texto JSON.
+        """
+        text = json.dumps(self.to_dict(), indent=2)
+        if filename is not None:
+            with open(filename, "w") as f:
+                f.write(text + "\n")
+        return text
+
+class _NullPhase:
+    # Contexto vacío que se usa cuando la instrumentación está desactivada
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_PHASE = _NullPhase()
+
+def active():
+    """
+    Retorna el Recorder activo, o None si la instrumentación está desactivada.
+    """
+    return _active
+
+def enable(recorder=None):
+    """
+    Activa la instrumentación.
+
+    Args:
+        recorder: Recorder donde se acumulan las mediciones; si es None se crea uno nuevo.
+
+    Returns:
+        El Recorder activo.
+    """
+    global _active
+    _active = recorder if recorder is not None else Recorder()
+    return _active
+
+def disable():
+    """
+    Desactiva la instrumentación.
+
+    Returns:
+        El Recorder que estaba activo (o None), con sus mediciones.
+    """
+    global _active
+    recorder, _active = _active, None
+    return recorder
+
+@contextmanager
+def recording(recorder=None):
+    """
+    Activa la instrumentación dentro de un bloque `with` y la desactiva al salir.
+
+    Returns:
+        El Recorder activo durante el bloque.
+    """
+    previous = _active
+    current = enable(recorder)
+    try:
+        yield current
+    finally:
+        if previous is not None:
+            enable(previous)
+        else:
+            disable()
+
+def phase(name):
+    """
+    Contexto que mide una fase si la instrumentación está activa.
+
+    Desactivada, retorna un contexto vacío compartido, sin medir el tiempo.
+    """
+    if _active is None:
+        return _NULL_PHASE
+    return _active.phase(name)
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    from src.problema2.kruskal import kruskal
+    from src.problema2.prim import prim
+    from src.problema3.bipartite import is_bipartite
+    # Se usa el módulo que importan los algoritmos, no la copia que se ejecuta como __main__
+    from src.utils.instrumentation import recording
+
+    graph = {
+        0: [(1, 4), (2, 3)],
+        1: [(0, 4), (2, 1), (3, 2)],
+        2: [(0, 3), (1, 1), (3, 4)],
+        3: [(1, 2), (2, 4)]
+    }
+    matrix = [[0, 4, 3, 0], [4, 0, 1, 2], [3, 1, 0, 4], [0, 2, 4, 0]]
+
+    # Se ejecutan los algoritmos con la instrumentación activa y se exporta el resultado
+    with recording() as recorder:
+        kruskal(graph, 4)
+        prim(matrix)
+        is_bipartite({0: [1], 1: [0, 2], 2: [1]}, 3)
+    print(recorder.to_json())
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import tempfile
+
+# Versión de cada algoritmo: se incrementa cuando cambia su resultado, de modo
+# que las entradas calculadas con la versión anterior dejan de usarse
+ALGORITHM_VERSIONS = {
+    "kruskal": 2,
+    "boruvka": 2,
+    "prim": 2,
+    "bipartite": 1,
+}
+
+# Directorio y tamaño máximo (en bytes) por defecto de la caché
+DEFAULT_DIRECTORY = ".resultados_cache"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Tamaño de cada bloque leído al calcular el hash de un archivo
+HASH_BLOCK = 1 << 20
+
+def file_digest(filename):
+    """
+    Calcula el hash BLAKE2b (128 bits) del contenido de un archivo.
+
+    El archivo se lee en bloques sobre un único búfer reutilizado, sin
+    interpretar su contenido ni cargarlo completo en memoria.
+
+    Returns:
+        El hash en hexadecimal.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    buffer = bytearray(HASH_BLOCK)
+    view = memoryview(buffer)
+    with open(filename, "rb", buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+def _plain(value):
+    # Se convierten los escalares de NumPy a números de Python para JSON
+    return value.item() if hasattr(value, "item") else value
+
+def mst_entry(mst, n):
+    """
+    Construye la entrada de caché de un MST (o bosque de expansión mínima).
+
+    Args:
+        mst: Aristas (u, v, peso) del árbol o bosque.
+        n: Número de vértices del grafo.
+
+    Returns:
+        Diccionario con las aristas, el peso total y el número de componentes.
+    """
+    edges = [[_plain(u), _plain(v), _plain(weight)] for u, v, weight in mst]
+    return {"edges": edges, "weight": sum(weight for _, _, weight in edges), "components": n - len(edges)}
+
+def bipartite_entry(result, partitions):
+    """
+    Construye la entrada de caché de una verificación de bipartición.
+
+    Returns:
+        Diccionario con el veredicto y las particiones ordenadas (o None).
+    """
+    if not result:
+        return {"is_bipartite": False, "partitions": None}
+    return {"is_bipartite": True, "partitions": [sorted(partitions[0]), sorted(partitions[1])]}
+
+class ResultCache:
+    """
+    Caché en disco de resultados, indexada por el contenido del archivo de entrada.
+
+    La clave combina el algoritmo, su versión y el hash BLAKE2b del archivo,
+    así que un acierto cuesta un hash y la lectura de un JSON pequeño, sin
+    importar el tamaño del grafo. Cada entrada es un archivo JSON; al leerla
+    se actualiza su fecha de modificación, y cuando el tamaño total supera el
+    máximo se eliminan las entradas usadas hace más tiempo (LRU).
+    """
+    def __init__(self, directory=DEFAULT_DIRECTORY, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            directory: Directorio donde se guardan las entradas.
+            max_bytes: Tamaño total máximo de las entradas.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, filename, algorithm):
+        """
+        Calcula la clave de un archivo para un algoritmo.
+
+        Raises:
+            ValueError: si el algoritmo no tiene una versión registrada.
+        """
+        if algorithm not in ALGORITHM_VERSIONS:
+            raise ValueError(f"Algoritmo desconocido: {algorithm}")
+        return f"{algorithm}-v{ALGORITHM_VERSIONS[algorithm]}-{file_digest(filename)}"
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, key):
+        """
+        Busca un resultado en la caché.
+
+        Returns:
+            El diccionario guardado, o None si no hay una entrada válida.
+        """
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Se marca la entrada como usada recientemente
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key, entry):
+        """
+        Guarda un resultado y aplica la política de desalojo LRU.
+
+        La entrada se escribe en un archivo temporal y luego se renombra, de
+        modo que otro proceso nunca lee una entrada a medio escribir.
+        """
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w") as f:
+                json.dump(entry, f, separators=(",", ":"))
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        self._evict()
+
+    def _evict(self):
+        # Se eliminan las entradas menos recientes hasta respetar el tamaño máximo
+        entries = []
+        total = 0
+        for item in os.scandir(self.directory):
+            if item.name.endswith(".json"):
+                stat = item.stat()
+                entries.append((stat.st_mtime, stat.st_size, item.path))
+                total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        """
+        Elimina todas las entradas de la caché.
+        """
+        for item in os.scandir(self.directory):
+            if item.name.endswith(".json"):
+                os.unlink(item.path)
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    from src.main import load_graph_adjacency_list
+    from src.problema2.kruskal import kruskal
+
+    cache = ResultCache(tempfile.mkdtemp())
+    test_file = "tests/problema2/kruskal/case_1.txt"
+
+    # La primera consulta falla; se resuelve el grafo y se guarda el resultado
+    key = cache.key(test_file, "kruskal")
+    if cache.get(key) is None:
+        edges, n = load_graph_adjacency_list(test_file)
+        cache.put(key, mst_entry(kruskal(edges, n), n))
+
+    # La segunda consulta se responde sin leer el grafo
+    print("Peso total del MST (desde la caché):", cache.get(key)["weight"])
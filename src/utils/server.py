@@ -0,0 +1,499 @@
+import asyncio
+import hashlib
+import json
+import os
+import socket
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from src.utils.edge_list import EdgeList
+from src.utils.graph import Graph
+
+# Algoritmos que atiende el servidor
+ALGORITHMS = ("kruskal", "boruvka", "prim", "bipartite")
+
+# Memoria máxima (en bytes, aproximada) de los grafos y resultados guardados en el LRU
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Memoria aproximada de cada arista ([u, v, peso]) y de cada vértice de una
+# partición en las entradas de resultado
+EDGE_BYTES = 160
+VERTEX_BYTES = 36
+
+# Máximo de solicitudes y de trabajo (vértices + entradas CSR) por lote
+DEFAULT_BATCH_SIZE = 64
+BATCH_WORK = 1 << 16
+
+# Puerto TCP local por defecto
+DEFAULT_PORT = 8765
+
+# Tamaño máximo de una línea de solicitud (los grafos pueden enviarse en ella)
+LINE_LIMIT = 64 * 1024 * 1024
+
+def _solve(algorithm, graph):
+    """
+    Resuelve un grafo con un algoritmo y retorna la entrada con el resultado.
+
+    Las entradas tienen el mismo formato que las de la caché de resultados
+    (ver `mst_entry` y `bipartite_entry`).
+    """
+    # Se importan aquí para que el proceso del servidor no cargue los algoritmos
+    from src.problema2.boruvka import boruvka
+    from src.problema2.kruskal import kruskal
+    from src.problema2.prim import prim_graph
+    from src.problema3.bipartite import is_bipartite
+    from src.utils.result_cache import bipartite_entry, mst_entry
+
+    if algorithm == "kruskal":
+        return mst_entry(kruskal(graph, graph.n), graph.n)
+    if algorithm == "boruvka":
+        return mst_entry(boruvka(graph, graph.n, 1), graph.n)
+    if algorithm == "prim":
+        return mst_entry(prim_graph(graph), graph.n)
+    if algorithm == "bipartite":
+        return bipartite_entry(*is_bipartite(graph, graph.n))
+    raise ValueError(f"Algoritmo desconocido: {algorithm}")
+
+def _warm_up():
+    # Se importan los algoritmos en el proceso trabajador antes de la primera solicitud
+    _solve("bipartite", Graph.from_neighbor_lists({}, 0))
+
+def solve_batch(tasks):
+    """
+    Resuelve en un proceso trabajador un lote de tareas (algoritmo, grafo).
+
+    Returns:
+        Lista de pares (correcto, entrada o mensaje de error), en el orden de las tareas.
+    """
+    results = []
+    for algorithm, graph in tasks:
+        try:
+            results.append((True, _solve(algorithm, graph)))
+        except Exception as error:
+            results.append((False, f"{type(error).__name__}: {error}"))
+    return results
+
+def graph_from_payload(payload):
+    """
+    Construye un Graph a partir de un grafo enviado en la solicitud.
+
+    Args:
+        payload: Diccionario {"n": n, "edges": [[u, v, peso], ...]}; el peso
+                 puede omitirse (vale 1), por ejemplo para bipartición.
+
+    Raises:
+        ValueError: si el grafo no tiene el formato esperado.
+    """
+    try:
+        n = int(payload["n"])
+        edges = EdgeList()
+        for edge in payload["edges"]:
+            u, v = int(edge[0]), int(edge[1])
+            if not (0 <= u < n and 0 <= v < n):
+                raise ValueError(f"Arista fuera de rango: {edge}")
+            edges.append(u, v, edge[2] if len(edge) > 2 else 1)
+    except (KeyError, TypeError, IndexError) as error:
+        raise ValueError(f"Grafo inválido: {error}") from None
+    return Graph.from_edges(edges, n)
+
+def _graph_bytes(graph):
+    # Memoria aproximada de las columnas del grafo
+    return sum(len(column) * getattr(column, "itemsize", 8)
+               for column in (graph.offsets, graph.targets, graph.weights) if column is not None)
+
+def _result_bytes(result):
+    # Memoria aproximada de una entrada de resultado (ver `mst_entry` y `bipartite_entry`)
+    if "edges" in result:
+        return EDGE_BYTES * len(result["edges"])
+    partitions = result.get("partitions") or ()
+    return VERTEX_BYTES * sum(len(part) for part in partitions)
+
+class _Entry:
+    # Grafo guardado en el LRU y resultados ya calculados sobre él
+    __slots__ = ("graph", "results", "size", "stored")
+
+    def __init__(self, graph):
+        # Futuro con el Graph mientras se carga
+        self.graph = graph
+        # {algoritmo: futuro con la entrada del resultado}
+        self.results = {}
+        # Memoria del grafo y de sus resultados; solo cuenta en el total del
+        # LRU mientras la entrada está guardada en él
+        self.size = 0
+        self.stored = False
+
+class _Task:
+    # Solicitud a la espera de un lote
+    __slots__ = ("algorithm", "graph", "future", "work")
+
+    def __init__(self, algorithm, graph, future):
+        self.algorithm = algorithm
+        self.graph = graph
+        self.future = future
+        self.work = graph.n + len(graph.targets)
+
+class GraphService:
+    """
+    Servicio asíncrono que resuelve grafos con los algoritmos del proyecto.
+
+    Las solicitudes llegan como JSON lines por un socket Unix o TCP local:
+
+        {"id": 1, "algorithm": "kruskal", "file": "tests/problema2/kruskal/case_1.txt"}
+        {"id": 2, "algorithm": "bipartite", "graph": {"n": 3, "edges": [[0, 1], [1, 2]]}}
+
+    y cada respuesta se envía en cuanto está lista (no necesariamente en el
+    orden de llegada), con el mismo "id":
+
+        {"id": 1, "ok": true, "result": {"edges": [...], "weight": ..., "components": 1}}
+
+    Los grafos leídos de archivos o recibidos en la solicitud se guardan ya
+    interpretados en un LRU acotado en memoria, junto con los resultados
+    calculados sobre ellos, así que repetir una consulta no vuelve a leer ni
+    a resolver el grafo. Las resoluciones se hacen en un grupo de procesos:
+    mientras todos están ocupados, las solicitudes que llegan se acumulan y
+    se envían juntas en un solo lote, de modo que miles de consultas
+    pequeñas no pagan cada una el costo de comunicación entre procesos.
+    """
+    def __init__(self, workers=None, max_bytes=DEFAULT_MAX_BYTES, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Args:
+            workers: Número de procesos; por defecto, el número de núcleos.
+            max_bytes: Memoria máxima aproximada de los grafos y resultados guardados.
+            batch_size: Número máximo de solicitudes por lote.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+        self._graphs = OrderedDict()
+        self._bytes = 0
+        self._pool = None
+        self._queue = None
+        self._slots = None
+        self._dispatcher = None
+
+    async def start(self):
+        """
+        Crea el grupo de procesos y la tarea que reparte los lotes.
+
+        Los procesos se inician aquí, antes de aceptar conexiones: si se
+        crearan durante una conexión heredarían su socket y el cliente no
+        vería el cierre de la conexión.
+        """
+        loop = asyncio.get_running_loop()
+        self._pool = ProcessPoolExecutor(self.workers)
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _warm_up) for _ in range(self.workers)))
+        self._queue = asyncio.Queue()
+        # Un lote en curso por proceso: el resto de las solicitudes espera en la cola
+        self._slots = asyncio.Semaphore(self.workers)
+        self._dispatcher = loop.create_task(self._dispatch())
+
+    async def close(self):
+        """
+        Detiene el reparto de lotes y el grupo de procesos.
+        """
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+    async def solve(self, request):
+        """
+        Atiende una solicitud ya decodificada.
+
+        Returns:
+            Diccionario de respuesta con "id", "ok" y "result" o "error".
+        """
+        response = {"id": request.get("id") if isinstance(request, dict) else None}
+        try:
+            if not isinstance(request, dict):
+                raise ValueError("La solicitud debe ser un objeto JSON")
+            algorithm = request.get("algorithm")
+            if algorithm not in ALGORITHMS:
+                raise ValueError(f"El algoritmo debe estar entre: {', '.join(ALGORITHMS)}")
+
+            entry = await self._entry(request, algorithm)
+            pending = entry.results.get(algorithm)
+            owner = pending is None
+            if owner:
+                # La primera solicitud calcula el resultado y las siguientes lo esperan
+                pending = entry.results[algorithm] = asyncio.get_running_loop().create_future()
+                graph = await entry.graph
+                self._queue.put_nowait(_Task(algorithm, graph, pending))
+            try:
+                response["result"] = await asyncio.shield(pending)
+            except Exception:
+                entry.results.pop(algorithm, None)
+                raise
+            if owner:
+                self._grow(entry, _result_bytes(response["result"]))
+            response["ok"] = True
+        except Exception as error:
+            response["ok"] = False
+            response["error"] = f"{type(error).__name__}: {error}" if not isinstance(error, ValueError) else str(error)
+        return response
+
+    async def _entry(self, request, algorithm):
+        """
+        Busca el grafo de la solicitud en el LRU o lo carga.
+
+        Los archivos se identifican por su ruta, fecha de modificación y
+        tamaño, de modo que un archivo modificado se vuelve a leer; los grafos
+        enviados en la solicitud, por el hash de su contenido.
+        """
+        if "file" in request:
+            path = os.path.realpath(request["file"])
+            graph_format = request.get("format") or _default_format(algorithm, path)
+            stat = os.stat(path)
+            key = ("file", path, stat.st_mtime_ns, stat.st_size, graph_format)
+            load = _load_file
+            args = (path, graph_format)
+        elif "graph" in request:
+            text = json.dumps(request["graph"], sort_keys=True, separators=(",", ":"))
+            key = ("graph", hashlib.blake2b(text.encode(), digest_size=16).hexdigest())
+            load = graph_from_payload
+            args = (request["graph"],)
+        else:
+            raise ValueError('La solicitud debe incluir "file" o "graph"')
+
+        entry = self._graphs.get(key)
+        if entry is not None:
+            self._graphs.move_to_end(key)
+            return entry
+
+        # Se registra la entrada antes de cargar el grafo, para que las
+        # solicitudes simultáneas sobre el mismo grafo no lo lean dos veces
+        loop = asyncio.get_running_loop()
+        entry = _Entry(loop.run_in_executor(None, load, *args))
+        self._graphs[key] = entry
+        try:
+            graph = await entry.graph
+        except Exception:
+            if self._graphs.get(key) is entry:
+                del self._graphs[key]
+            raise
+        # Mientras se cargaba, la entrada pudo ser desalojada; en ese caso se
+        # entrega a las solicitudes que la esperan, pero no cuenta en el total
+        if self._graphs.get(key) is entry:
+            entry.stored = True
+            self._grow(entry, _graph_bytes(graph))
+        return entry
+
+    def _grow(self, entry, size):
+        # Se suma memoria a una entrada guardada y se aplica el máximo
+        if not entry.stored:
+            return
+        entry.size += size
+        self._bytes += size
+        self._evict()
+
+    def _evict(self):
+        # Se descartan los grafos usados hace más tiempo hasta respetar el máximo
+        while self._bytes > self.max_bytes and len(self._graphs) > 1:
+            _, entry = self._graphs.popitem(last=False)
+            self._bytes -= entry.size
+            entry.stored = False
+
+    async def _dispatch(self):
+        """
+        Reparte las solicitudes pendientes en lotes entre los procesos.
+
+        Se espera a que haya un proceso libre y se toman todas las
+        solicitudes acumuladas hasta completar un lote: con poca carga cada
+        solicitud sale sola y de inmediato, y con mucha carga se agrupan.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await self._queue.get()
+            await self._slots.acquire()
+            batch = [first]
+            work = first.work
+            while not self._queue.empty() and len(batch) < self.batch_size and work < BATCH_WORK:
+                task = self._queue.get_nowait()
+                batch.append(task)
+                work += task.work
+            loop.create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch):
+        # Se resuelve un lote en el grupo de procesos y se entregan sus resultados
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self._pool, solve_batch, [(task.algorithm, task.graph) for task in batch])
+        except Exception as error:
+            results = [(False, f"{type(error).__name__}: {error}")] * len(batch)
+        finally:
+            self._slots.release()
+        for task, (ok, value) in zip(batch, results):
+            if task.future.done():
+                continue
+            if ok:
+                task.future.set_result(value)
+            else:
+                task.future.set_exception(RuntimeError(value))
+
+    async def handle_connection(self, reader, writer):
+        """
+        Atiende una conexión: cada línea es una solicitud y cada respuesta se
+        escribe en cuanto está lista.
+        """
+        pending = set()
+
+        async def respond(line):
+            try:
+                request = json.loads(line)
+            except ValueError as error:
+                response = {"id": None, "ok": False, "error": f"JSON inválido: {error}"}
+            else:
+                response = await self.solve(request)
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    task = asyncio.get_running_loop().create_task(respond(line))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            writer.close()
+
+    async def serve(self, path=None, host="127.0.0.1", port=0, ready=None):
+        """
+        Atiende conexiones hasta que se cancele la tarea.
+
+        Args:
+            path: Ruta del socket Unix; si es None se usa TCP.
+            host, port: Dirección TCP local (con port=0 se elige un puerto libre).
+            ready: Función opcional que recibe la dirección una vez que el
+                   servidor está escuchando.
+        """
+        await self.start()
+        try:
+            if path is not None:
+                server = await asyncio.start_unix_server(self.handle_connection, path, limit=LINE_LIMIT)
+                address = path
+            else:
+                server = await asyncio.start_server(self.handle_connection, host, port, limit=LINE_LIMIT)
+                address = server.sockets[0].getsockname()[:2]
+            if ready is not None:
+                ready(address)
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
+
+def _default_format(algorithm, path):
+    # Formato de texto según el algoritmo; los archivos de Prim pueden ser matrices
+    if algorithm == "bipartite":
+        return "bipartito"
+    if algorithm == "prim":
+        from src.main import is_adjacency_list_file
+        return "kruskal" if is_adjacency_list_file(path) else "prim"
+    return "kruskal"
+
+def _load_file(path, graph_format):
+    # Se carga un archivo como Graph con los lectores de main.py
+    from src.main import load_graph
+    return load_graph(path, graph_format)
+
+def request_lines(requests, path=None, host="127.0.0.1", port=None):
+    """
+    Cliente síncrono: envía solicitudes al servidor y retorna sus respuestas.
+
+    Args:
+        requests: Lista de diccionarios de solicitud; si no tienen "id" se
+                  numeran según su posición.
+        path: Ruta del socket Unix, o None para usar TCP.
+        host, port: Dirección TCP del servidor.
+
+    Returns:
+        Lista de respuestas en el orden de las solicitudes.
+    """
+    if path is not None:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(path)
+    else:
+        connection = socket.create_connection((host, port))
+
+    with connection:
+        payload = []
+        for i, request in enumerate(requests):
+            request = dict(request)
+            request.setdefault("id", i)
+            payload.append(json.dumps(request))
+        connection.sendall(("\n".join(payload) + "\n").encode())
+        connection.shutdown(socket.SHUT_WR)
+
+        responses = {}
+        with connection.makefile("rb") as stream:
+            for line in stream:
+                response = json.loads(line)
+                responses[response["id"]] = response
+    return [responses.get(request.get("id", i)) for i, request in enumerate(requests)]
+
+def serve(path=None, host="127.0.0.1", port=DEFAULT_PORT, workers=None, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Inicia el servidor y lo mantiene activo hasta que se interrumpa (Ctrl+C).
+    """
+    service = GraphService(workers, max_bytes)
+
+    def announce(address):
+        print(f"Servidor escuchando en {address}", flush=True)
+
+    try:
+        asyncio.run(service.serve(path, host, port, ready=announce))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if path is not None and os.path.exists(path):
+            os.unlink(path)
+
+def main(argv=None):
+    """
+    Punto de entrada de línea de comandos del servidor.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="main.py 9", description="Atiende solicitudes JSON lines con los algoritmos.")
+    parser.add_argument("--socket", default=None, help="Ruta de un socket Unix (por defecto, TCP local)")
+    parser.add_argument("--puerto", type=int, default=DEFAULT_PORT, help="Puerto TCP en 127.0.0.1")
+    parser.add_argument("--procesos", type=int, default=None, help="Número de procesos para resolver")
+    parser.add_argument("--memoria", type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help="Memoria máxima (MiB) de los grafos y resultados guardados")
+    args = parser.parse_args(argv)
+    serve(args.socket, port=args.puerto, workers=args.procesos, max_bytes=args.memoria * 1024 * 1024)
+    return 0
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    import tempfile
+    import threading
+    import time
+
+    # Se inicia el servidor en un hilo sobre un socket Unix temporal
+    socket_path = os.path.join(tempfile.mkdtemp(), "grafos.sock")
+    started = threading.Event()
+    thread = threading.Thread(
+        target=lambda: asyncio.run(GraphService().serve(socket_path, ready=lambda _: started.set())),
+        daemon=True)
+    thread.start()
+    started.wait()
+
+    # Se envían mil consultas pequeñas sobre el mismo archivo y un grafo en la solicitud
+    requests = [{"algorithm": "kruskal", "file": "tests/problema2/kruskal/case_1.txt"}] * 1000
+    requests.append({"algorithm": "bipartite", "graph": {"n": 4, "edges": [[0, 1], [1, 2], [2, 3], [3, 0]]}})
+    start = time.perf_counter()
+    responses = request_lines(requests, socket_path)
+    elapsed = time.perf_counter() - start
+    print(f"{len(responses)} respuestas en {elapsed:.3f} s")
+    print("Peso del MST:", responses[0]["result"]["weight"])
+    print("Ciclo de 4 vértices bipartito:", responses[-1]["result"]["is_bipartite"])
@@ -0,0 +1,177 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Directorio raíz del repositorio, desde donde se ejecutan los subprocesos
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Presupuestos por defecto (en milisegundos): importaciones propias del arranque
+# de la línea de comandos, y tiempo total de un caso pequeño por subcomando
+DEFAULT_IMPORT_BUDGET_MS = 40
+DEFAULT_CASE_BUDGET_MS = 800
+DEFAULT_REPEATS = 5
+
+# Código que reproduce el arranque de la línea de comandos, sin ejecutar ningún subcomando
+CLI_STARTUP = "from src.main import build_parser; build_parser()"
+
+# Módulos que el arranque no debe cargar: pertenecen a algún subcomando
+STARTUP_FORBIDDEN = ("numpy", "multiprocessing", "concurrent", "asyncio", "src.problema2", "src.problema3", "src.utils")
+
+# Casos pequeños: (subcomando, argumentos, módulos que no debe cargar)
+SMALL_CASES = (
+    ("kruskal", ["1", "tests/problema2/kruskal/case_1.txt"],
+     ("src.problema2.prim", "src.problema3", "multiprocessing", "asyncio")),
+    ("prim", ["2", "tests/problema2/prim/case_1.txt"],
+     ("src.problema2.boruvka", "src.problema3", "multiprocessing", "asyncio")),
+    ("bipartito", ["3", "tests/problema3/bipartite/case_1.txt"],
+     ("src.problema2.prim", "src.problema2.boruvka", "multiprocessing", "asyncio")),
+)
+
+def parse_importtime(text):
+    """
+    Interpreta la salida de `python -X importtime`.
+
+    Args:
+        text: Salida de error del intérprete.
+
+    Returns:
+        Diccionario {módulo: (microsegundos propios, microsegundos acumulados)}.
+    """
+    modules = {}
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Encabezado de la tabla
+            continue
+        modules[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return modules
+
+def _python(arguments, importtime=False):
+    # Se ejecuta un intérprete nuevo desde la raíz del repositorio
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + arguments
+    return subprocess.run(command, cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+
+def _loaded(modules, prefixes):
+    # Módulos cargados que coinciden con alguno de los prefijos
+    return sorted(name for name in modules
+                  if any(name == prefix or name.startswith(prefix + ".") for prefix in prefixes))
+
+def measure_startup(repeats=DEFAULT_REPEATS):
+    """
+    Mide las importaciones propias del arranque de la línea de comandos.
+
+    Se ejecuta `CLI_STARTUP` con `-X importtime` en intérpretes nuevos y se
+    suman los tiempos propios de los módulos que no carga un intérprete vacío,
+    de modo que el resultado no incluye el arranque de Python.
+
+    Returns:
+        Diccionario con la mediana en milisegundos, los módulos más costosos y
+        los módulos prohibidos (`STARTUP_FORBIDDEN`) que se cargaron.
+    """
+    baseline = set(parse_importtime(_python(["-c", "pass"], importtime=True).stderr.decode()))
+    samples = []
+    for _ in range(repeats):
+        modules = parse_importtime(_python(["-c", CLI_STARTUP], importtime=True).stderr.decode())
+        own = {name: times for name, times in modules.items() if name not in baseline}
+        samples.append(sum(self_time for self_time, _ in own.values()) / 1000)
+
+    heaviest = sorted(own.items(), key=lambda item: item[1][1], reverse=True)[:5]
+    return {
+        "milliseconds": statistics.median(samples),
+        "heaviest": [{"module": name, "cumulative_ms": cumulative / 1000} for name, (_, cumulative) in heaviest],
+        "forbidden": _loaded(own, STARTUP_FORBIDDEN),
+    }
+
+def measure_case(arguments, unexpected=(), repeats=DEFAULT_REPEATS):
+    """
+    Mide el tiempo total de un subcomando sobre un caso pequeño.
+
+    Args:
+        arguments: Argumentos de `python -m src.main`.
+        unexpected: Prefijos de módulos que el subcomando no debe cargar.
+        repeats: Número de ejecuciones; se reporta la mediana.
+
+    Returns:
+        Diccionario con la mediana en milisegundos (incluido el arranque del
+        intérprete) y los módulos inesperados que se cargaron.
+    """
+    modules = parse_importtime(_python(["-m", "src.main"] + arguments, importtime=True).stderr.decode())
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        _python(["-m", "src.main"] + arguments)
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"milliseconds": statistics.median(samples), "unexpected": _loaded(modules, unexpected)}
+
+def check_budgets(report, import_budget=DEFAULT_IMPORT_BUDGET_MS, case_budget=DEFAULT_CASE_BUDGET_MS):
+    """
+    Compara un reporte contra los presupuestos.
+
+    Returns:
+        Lista de mensajes, uno por presupuesto excedido o módulo cargado de más.
+    """
+    problems = []
+    startup = report["startup"]
+    if startup["milliseconds"] > import_budget:
+        problems.append(f"El arranque importa durante {startup['milliseconds']:.1f} ms (presupuesto: {import_budget} ms)")
+    if startup["forbidden"]:
+        problems.append(f"El arranque carga {', '.join(startup['forbidden'])}")
+    for name, case in report["cases"].items():
+        if case["milliseconds"] > case_budget:
+            problems.append(f"{name} tarda {case['milliseconds']:.1f} ms (presupuesto: {case_budget} ms)")
+        if case["unexpected"]:
+            problems.append(f"{name} carga {', '.join(case['unexpected'])}")
+    return problems
+
+def main(argv=None):
+    """
+    Punto de entrada de línea de comandos de la medición de arranque.
+
+    Returns:
+        Código de salida: 1 si se excedió algún presupuesto, 0 en otro caso.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="main.py 10", description="Mide el tiempo de arranque de la línea de comandos.")
+    parser.add_argument("--repeticiones", type=int, default=DEFAULT_REPEATS, help="Repeticiones por medición")
+    parser.add_argument("--presupuesto", type=float, default=DEFAULT_IMPORT_BUDGET_MS,
+                        help="Tiempo máximo (ms) de las importaciones del arranque")
+    parser.add_argument("--presupuesto-caso", type=float, default=DEFAULT_CASE_BUDGET_MS,
+                        help="Tiempo máximo (ms) de un caso pequeño, incluido el intérprete")
+    parser.add_argument("--salida", default=None, help="Archivo JSON donde se guarda el reporte")
+    args = parser.parse_args(argv)
+
+    report = {"startup": measure_startup(args.repeticiones), "cases": {}}
+    print(f"Importaciones del arranque: {report['startup']['milliseconds']:.1f} ms")
+    for module in report["startup"]["heaviest"]:
+        print(f"  {module['module']}: {module['cumulative_ms']:.1f} ms")
+    for name, arguments, unexpected in SMALL_CASES:
+        case = measure_case(arguments, unexpected, args.repeticiones)
+        report["cases"][name] = case
+        print(f"{name}: {case['milliseconds']:.1f} ms")
+
+    if args.salida:
+        with open(args.salida, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Reporte guardado en {args.salida}")
+
+    problems = check_budgets(report, args.presupuesto, args.presupuesto_caso)
+    for problem in problems:
+        print(f"Presupuesto excedido: {problem}")
+    if problems:
+        return 1
+    print("Dentro del presupuesto.")
+    return 0
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    # Se mide solo el arranque y se muestran los módulos que más tardan en cargarse
+    startup = measure_startup(repeats=3)
+    print(f"Importaciones del arranque: {startup['milliseconds']:.1f} ms")
+    for module in startup["heaviest"]:
+        print(f"  {module['module']}: {module['cumulative_ms']:.1f} ms")
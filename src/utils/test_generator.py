@@ -1,105 +1,233 @@
+import math
 import random
 import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 
-def generate_random_weighted_graph(n, edge_probability=0.5, min_weight=1, max_weight=100):
+from src.utils.binary_format import write_csr, write_edges
+from src.utils.edge_list import EdgeList
+
+# NumPy es opcional: permite muestrear las aristas en lotes vectorizados
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Número máximo de saltos geométricos que se generan por lote con NumPy
+SAMPLE_BATCH = 1 << 20
+
+# Tamaño (en caracteres) de cada bloque escrito a disco
+WRITE_BUFFER = 1 << 20
+
+def _resolve_seed(seed):
+    # Sin semilla explícita se toma una del módulo random, de modo que
+    # random.seed() sigue haciendo reproducible la generación
+    return seed if seed is not None else random.getrandbits(63)
+
+def _sample_indices(total, probability, seed):
     """
-    Genera un grafo aleatorio con pesos.
+    Muestrea cada índice de range(total) de forma independiente con la probabilidad dada.
+    
+    En lugar de lanzar una moneda por índice, se generan los saltos entre
+    índices elegidos, que siguen una distribución geométrica, por lo que el
+    costo es proporcional al número de índices elegidos y no a `total`.
+    
+    Returns:
+        Secuencia creciente de índices elegidos (ndarray con NumPy, array('q') sin él).
+    """
+    if probability <= 0 or total <= 0:
+        return array('q')
+    if probability >= 1:
+        return np.arange(total, dtype=np.int64) if np is not None else array('q', range(total))
+    
+    if np is not None:
+        # Se generan los saltos en lotes y se acumulan hasta superar el total
+        rng = np.random.default_rng(seed)
+        # El lote se ajusta al número esperado de índices (más un margen de
+        # seis desviaciones), así que casi siempre basta con un solo lote
+        expected = total * probability
+        batch = min(SAMPLE_BATCH, int(expected + 6 * math.sqrt(expected)) + 16)
+        chunks = []
+        position = -1
+        while position < total:
+            gaps = rng.geometric(probability, size=batch)
+            positions = position + np.cumsum(gaps)
+            position = int(positions[-1])
+            chunks.append(positions[positions < total])
+        return np.concatenate(chunks)
+    
+    # Versión pura: salto geométrico (Batagelj y Brandes) con una variable aleatoria por índice elegido
+    rng = random.Random(seed)
+    log_q = math.log(1.0 - probability)
+    indices = array('q')
+    position = -1
+    while True:
+        position += 1 + int(math.log(1.0 - rng.random()) / log_q)
+        if position >= total:
+            return indices
+        indices.append(position)
+
+def _random_weights(count, min_weight, max_weight, seed):
+    # Se generan `count` pesos enteros uniformes en [min_weight, max_weight]
+    if np is not None:
+        weights = np.random.default_rng(seed).integers(min_weight, max_weight + 1, size=count)
+        return _int_array(weights)
+    rng = random.Random(seed)
+    return array('i', (rng.randint(min_weight, max_weight) for _ in range(count)))
+
+def _int_array(values):
+    # Se convierte un ndarray a array('i') sin pasar por objetos de Python
+    result = array('i')
+    result.frombytes(np.asarray(values, dtype=np.int32).tobytes())
+    return result
+
+def generate_gnp_edges(n, edge_probability=0.5, min_weight=1, max_weight=100, seed=None):
+    """
+    Genera las aristas de un grafo aleatorio G(n, p) con pesos.
+    
+    Cada uno de los n(n-1)/2 pares se incluye con probabilidad p, pero el
+    costo es O(n + m) gracias al muestreo por saltos geométricos.
     
     Args:
         n: Número de vértices.
         edge_probability: Probabilidad de que exista una arista entre dos vértices.
         min_weight: Peso mínimo de una arista.
         max_weight: Peso máximo de una arista.
+        seed: Semilla para reproducir el grafo; si es None se toma del módulo random.
         
     Returns:
-        Tupla (lista_adyacencias, matriz_adyacencias)
+        EdgeList con una copia (u < v) de cada arista.
     """
-    # Se inicializa la lista de adyacencias
-    adj_list = {i: [] for i in range(n)}
+    seed = _resolve_seed(seed)
+    indices = _sample_indices(n * (n - 1) // 2, edge_probability, seed)
+    weights = _random_weights(len(indices), min_weight, max_weight, seed + 1)
+    
+    # El índice k corresponde al par (u, v) con v(v-1)/2 <= k < v(v+1)/2 y u = k - v(v-1)/2
+    if np is not None:
+        k = np.asarray(indices, dtype=np.int64)
+        v = ((1 + np.sqrt(1 + 8 * k.astype(np.float64))) // 2).astype(np.int64)
+        # Se corrigen los errores de redondeo de la raíz cuadrada
+        v -= v * (v - 1) // 2 > k
+        v += (v + 1) * v // 2 <= k
+        u = k - v * (v - 1) // 2
+        return EdgeList(_int_array(u), _int_array(v), weights)
     
-    # Se inicializa la matriz de adyacencias con ceros
-    adj_matrix = [[0 for _ in range(n)] for _ in range(n)]
-    
-    # Se generan las aristas aleatorias
-    for i in range(n):
-        for j in range(i+1, n):  # Solo se consideran pares (i,j) donde i < j
-            # Se decide aleatoriamente si existirá una arista entre i y j
-            if random.random() < edge_probability:
-                # Se genera un peso aleatorio para la arista
-                weight = random.randint(min_weight, max_weight)
-                
-                # Se agrega la arista a la lista de adyacencias (en ambas direcciones para grafo no dirigido)
-                adj_list[i].append((j, weight))
-                adj_list[j].append((i, weight))
-                
-                # Se agrega la arista a la matriz de adyacencias (en ambas direcciones para grafo no dirigido)
-                adj_matrix[i][j] = weight
-                adj_matrix[j][i] = weight
-    
-    return adj_list, adj_matrix
-
-def generate_connected_graph(n, min_weight=1, max_weight=100):
+    us, vs = array('i'), array('i')
+    v, first = 1, 0
+    for k in indices:
+        while k >= first + v:
+            first += v
+            v += 1
+        us.append(k - first)
+        vs.append(v)
+    return EdgeList(us, vs, weights)
+
+def generate_random_spanning_tree(n, min_weight=1, max_weight=100, seed=None):
     """
-    Genera un grafo conexo aleatorio.
+    Genera un árbol de expansión aleatorio en O(n).
+    
+    Los vértices se recorren en un orden aleatorio y cada uno se conecta con
+    un vértice elegido al azar entre los anteriores.
+    
+    Returns:
+        EdgeList con las n-1 aristas del árbol (u < v en cada arista).
+    """
+    seed = _resolve_seed(seed)
+    rng = random.Random(seed)
+    order = list(range(n))
+    rng.shuffle(order)
+    
+    us, vs = array('i'), array('i')
+    for i in range(1, n):
+        a, b = order[rng.randrange(i)], order[i]
+        us.append(min(a, b))
+        vs.append(max(a, b))
+    return EdgeList(us, vs, _random_weights(len(us), min_weight, max_weight, seed + 1))
+
+def generate_connected_edges(n, edge_probability=None, min_weight=1, max_weight=100, seed=None):
+    """
+    Genera las aristas de un grafo conexo: un árbol aleatorio más aristas G(n, p).
     
     Args:
         n: Número de vértices.
+        edge_probability: Probabilidad de las aristas adicionales; si es None
+                          se elige al azar entre 0.1 y 0.3.
         min_weight: Peso mínimo de una arista.
         max_weight: Peso máximo de una arista.
+        seed: Semilla para reproducir el grafo.
         
     Returns:
-        Tupla (lista_adyacencias, matriz_adyacencias)
+        EdgeList con una copia (u < v) de cada arista, sin aristas repetidas.
     """
-    # Se inicializa la lista de adyacencias
-    adj_list = {i: [] for i in range(n)}
-    
-    # Se inicializa la matriz de adyacencias con ceros
-    adj_matrix = [[0 for _ in range(n)] for _ in range(n)]
+    seed = _resolve_seed(seed)
+    if edge_probability is None:
+        edge_probability = random.Random(seed).uniform(0.1, 0.3)
     
-    # Se asegura la conexión generando un árbol aleatorio
-    vertices = list(range(n))
-    random.shuffle(vertices)
+    edges = generate_random_spanning_tree(n, min_weight, max_weight, seed)
+    extra = generate_gnp_edges(n, edge_probability, min_weight, max_weight, seed + 2)
     
-    # El primer vértice estará solo inicialmente
-    connected = {vertices[0]}
-    not_connected = set(vertices[1:])
-    
-    # Se conecta cada vértice con al menos un vértice ya conectado
-    while not_connected:
-        v = not_connected.pop()
-        u = random.choice(list(connected))
-        
-        # Se genera un peso aleatorio para la arista
-        weight = random.randint(min_weight, max_weight)
-        
-        # Se agrega la arista a la lista de adyacencias
+    # Se descartan las aristas adicionales que ya están en el árbol
+    tree = {u * n + v for u, v in zip(edges.u, edges.v)}
+    for u, v, weight in extra:
+        if u * n + v not in tree:
+            edges.append(u, v, weight)
+    return edges
+
+def edges_to_adjacency_list(edges, n):
+    """
+    Convierte un EdgeList a un diccionario {vertice: [(vecino, peso), ...], ...}.
+    """
+    adj_list = {i: [] for i in range(n)}
+    for u, v, weight in edges:
         adj_list[u].append((v, weight))
         adj_list[v].append((u, weight))
-        
-        # Se agrega la arista a la matriz de adyacencias
+    return adj_list
+
+def edges_to_matrix(edges, n):
+    """
+    Convierte un EdgeList a una matriz de adyacencias n x n (lista de listas).
+    """
+    adj_matrix = [[0] * n for _ in range(n)]
+    for u, v, weight in edges:
         adj_matrix[u][v] = weight
         adj_matrix[v][u] = weight
-        
-        connected.add(v)
-    
-    # Se agregan aristas adicionales aleatoriamente
-    edge_probability = random.uniform(0.1, 0.3)  # Probabilidad de agregar aristas adicionales
+    return adj_matrix
+
+def generate_random_weighted_graph(n, edge_probability=0.5, min_weight=1, max_weight=100, seed=None):
+    """
+    Genera un grafo aleatorio con pesos.
     
-    for i in range(n):
-        for j in range(i+1, n):
-            # No se consideran las aristas ya existentes
-            if adj_matrix[i][j] == 0 and random.random() < edge_probability:
-                weight = random.randint(min_weight, max_weight)
-                
-                adj_list[i].append((j, weight))
-                adj_list[j].append((i, weight))
-                
-                adj_matrix[i][j] = weight
-                adj_matrix[j][i] = weight
+    Args:
+        n: Número de vértices.
+        edge_probability: Probabilidad de que exista una arista entre dos vértices.
+        min_weight: Peso mínimo de una arista.
+        max_weight: Peso máximo de una arista.
+        seed: Semilla para reproducir el grafo.
+        
+    Returns:
+        Tupla (lista_adyacencias, matriz_adyacencias)
+    """
+    edges = generate_gnp_edges(n, edge_probability, min_weight, max_weight, seed)
+    return edges_to_adjacency_list(edges, n), edges_to_matrix(edges, n)
+
+def generate_connected_graph(n, min_weight=1, max_weight=100, seed=None):
+    """
+    Genera un grafo conexo aleatorio.
     
-    return adj_list, adj_matrix
+    Args:
+        n: Número de vértices.
+        min_weight: Peso mínimo de una arista.
+        max_weight: Peso máximo de una arista.
+        seed: Semilla para reproducir el grafo.
+        
+    Returns:
+        Tupla (lista_adyacencias, matriz_adyacencias)
+    """
+    edges = generate_connected_edges(n, None, min_weight, max_weight, seed)
+    return edges_to_adjacency_list(edges, n), edges_to_matrix(edges, n)
 
-def generate_bipartite_graph(n, edge_probability=0.5, min_weight=1, max_weight=100):
+def generate_bipartite_graph(n, edge_probability=0.5, min_weight=1, max_weight=100, seed=None):
     """
     Genera un grafo bipartito aleatorio.
     
@@ -108,34 +236,39 @@ def generate_bipartite_graph(n, edge_probability=0.5, min_weight=1, max_weight=1
         edge_probability: Probabilidad de que exista una arista entre dos vértices de diferentes conjuntos.
         min_weight: Peso mínimo de una arista.
         max_weight: Peso máximo de una arista.
+        seed: Semilla para reproducir el grafo.
         
     Returns:
         Tupla (lista_adyacencias, particiones)
     """
     # Se dividen los vértices en dos conjuntos
-    part_a = set(range(0, n // 2))
-    part_b = set(range(n // 2, n))
+    half = n // 2
+    part_a = set(range(0, half))
+    part_b = set(range(half, n))
     
     # Se inicializa la lista de adyacencias
     adj_list = {i: [] for i in range(n)}
     
-    # Se generan aristas solo entre vértices de diferentes conjuntos
-    for i in part_a:
-        for j in part_b:
-            if random.random() < edge_probability:
-                # Para grafos no ponderados en el problema de bipartición
-                adj_list[i].append(j)
-                adj_list[j].append(i)
+    # Se muestrean los pares (i, j) con i en A y j en B; el índice k codifica
+    # el par i = k // |B|, j = |A| + k % |B|
+    size_b = n - half
+    for k in _sample_indices(half * size_b, edge_probability, _resolve_seed(seed)):
+        i, j = divmod(int(k), size_b)
+        j += half
+        # Para grafos no ponderados en el problema de bipartición
+        adj_list[i].append(j)
+        adj_list[j].append(i)
     
     return adj_list, (part_a, part_b)
 
-def generate_non_bipartite_graph(n, edge_probability=0.5):
+def generate_non_bipartite_graph(n, edge_probability=0.5, seed=None):
     """
     Genera un grafo que definitivamente no es bipartito.
     
     Args:
         n: Número de vértices (debe ser al menos 3).
         edge_probability: Probabilidad de aristas adicionales.
+        seed: Semilla para reproducir el grafo.
         
     Returns:
         Lista de adyacencias del grafo.
@@ -151,87 +284,228 @@ def generate_non_bipartite_graph(n, edge_probability=0.5):
         adj_list[i].append((i + 1) % 3)
         adj_list[(i + 1) % 3].append(i)
     
-    # Se agregan aristas adicionales aleatoriamente
-    for i in range(n):
-        for j in range(i + 1, n):
-            if j not in adj_list[i] and random.random() < edge_probability:
-                adj_list[i].append(j)
-                adj_list[j].append(i)
+    # Se agregan aristas adicionales aleatoriamente, sin repetir las del triángulo
+    edges = generate_gnp_edges(n, edge_probability, seed=seed)
+    for i, j in zip(edges.u, edges.v):
+        if j >= 3:
+            adj_list[i].append(j)
+            adj_list[j].append(i)
     
     return adj_list
 
-def save_test_cases(test_dir, n_cases=100):
+def _write_lines(filename, lines):
+    # Se agrupan las líneas en bloques grandes para hacer pocas escrituras
+    with open(filename, "w", buffering=WRITE_BUFFER) as f:
+        chunk = []
+        size = 0
+        for line in lines:
+            chunk.append(line)
+            size += len(line)
+            if size >= WRITE_BUFFER:
+                f.write("".join(chunk))
+                chunk = []
+                size = 0
+        f.write("".join(chunk))
+
+def _csr_rows(offsets, targets, weights=None):
+    # Se generan las filas de un grafo CSR como listas de vecinos o de pares (vecino, peso)
+    for u in range(len(offsets) - 1):
+        start, stop = offsets[u], offsets[u + 1]
+        if weights is None:
+            yield targets[start:stop]
+        else:
+            yield zip(targets[start:stop], weights[start:stop])
+
+def _rows_to_csr(rows):
+    # Se construyen los arreglos offsets y targets a partir de filas de vecinos
+    offsets = array('i', [0])
+    targets = array('i')
+    for neighbors in rows:
+        targets.extend(neighbors)
+        offsets.append(len(targets))
+    return offsets, targets
+
+def iter_kruskal_lines(n, rows):
+    """
+    Genera las líneas del formato de lista de adyacencias ("v: vecino-peso, ...").
+    
+    Args:
+        n: Número de vértices.
+        rows: Iterable con los pares (vecino, peso) de cada vértice, en orden.
+    """
+    yield f"{n}\n"
+    pair = "{}-{}".format
+    for v, neighbors in enumerate(rows):
+        yield f"{v}: " + ", ".join(pair(neighbor, weight) for neighbor, weight in neighbors) + "\n"
+
+def iter_prim_lines(n, rows):
+    """
+    Genera las líneas del formato de matriz de adyacencias sin construir la matriz.
+    
+    Cada fila parte de una plantilla de ceros y solo se reemplazan las
+    posiciones de los vecinos, por lo que no se convierte cada cero a texto.
+    
+    Args:
+        n: Número de vértices.
+        rows: Iterable con los pares (vecino, peso) de cada vértice, en orden.
+    """
+    yield f"{n}\n"
+    zeros = ["0"] * n
+    for neighbors in rows:
+        row = zeros[:]
+        for neighbor, weight in neighbors:
+            row[neighbor] = str(weight)
+        yield " ".join(row) + "\n"
+
+def iter_bipartite_lines(n, rows, partitions=None):
+    """
+    Genera las líneas del formato de listas de vecinos con las líneas de verificación.
+    
+    Args:
+        n: Número de vértices.
+        rows: Iterable con los vecinos de cada vértice, en orden.
+        partitions: Particiones esperadas si el grafo es bipartito, o None.
+    """
+    yield f"{n}\n"
+    for neighbors in rows:
+        yield " ".join(map(str, neighbors)) + "\n"
+    
+    # Se escribe si el grafo es bipartito o no (para verificación)
+    is_bipartite = partitions is not None
+    yield f"IS_BIPARTITE: {is_bipartite}\n"
+    if is_bipartite:
+        yield f"PARTITION_A: {sorted(partitions[0])}\n"
+        yield f"PARTITION_B: {sorted(partitions[1])}\n"
+
+def write_kruskal_case(filename, n, adj_list):
+    """
+    Guarda un grafo en formato de lista de adyacencias ("v: vecino-peso, ...").
+    
+    Args:
+        filename: Ruta del archivo de salida.
+        n: Número de vértices.
+        adj_list: Diccionario {vertice: [(vecino, peso), ...], ...}.
+    """
+    _write_lines(filename, iter_kruskal_lines(n, (adj_list.get(v, []) for v in range(n))))
+
+def write_prim_case(filename, adj_matrix):
+    """
+    Guarda un grafo en formato de matriz de adyacencias.
+    
+    Args:
+        filename: Ruta del archivo de salida.
+        adj_matrix: Matriz de adyacencias n x n.
+    """
+    lines = (" ".join(map(str, row)) + "\n" for row in adj_matrix)
+    _write_lines(filename, chain([f"{len(adj_matrix)}\n"], lines))
+
+def write_bipartite_case(filename, n, adj_list, partitions=None):
+    """
+    Guarda un grafo en formato de listas de vecinos, con las líneas de verificación.
+    
+    Args:
+        filename: Ruta del archivo de salida.
+        n: Número de vértices.
+        adj_list: Diccionario {vertice: [vecino1, vecino2, ...], ...}.
+        partitions: Particiones esperadas si el grafo es bipartito, o None.
+    """
+    _write_lines(filename, iter_bipartite_lines(n, (adj_list.get(v, []) for v in range(n)), partitions))
+
+def write_edge_cases(kruskal_file, prim_file, edges, n):
+    """
+    Guarda un EdgeList en los formatos de Kruskal y de Prim sin pasar por
+    diccionarios ni por la matriz densa.
+    
+    Args:
+        kruskal_file: Ruta del archivo de lista de adyacencias (o None para omitirlo).
+        prim_file: Ruta del archivo de matriz de adyacencias (o None para omitirlo).
+        edges: EdgeList con una copia de cada arista.
+        n: Número de vértices.
+        
+    Returns:
+        Tupla (offsets, targets, weights) con el CSR usado para escribir.
+    """
+    csr = edges.to_csr(n)
+    if kruskal_file is not None:
+        _write_lines(kruskal_file, iter_kruskal_lines(n, _csr_rows(*csr)))
+    if prim_file is not None:
+        _write_lines(prim_file, iter_prim_lines(n, _csr_rows(*csr)))
+    return csr
+
+def _write_case(task):
+    """
+    Genera y guarda un caso de prueba completo (Kruskal, Prim y bipartición).
+    
+    Se ejecuta en un proceso trabajador; todo lo aleatorio del caso depende
+    solo de su semilla, por lo que el resultado no cambia con el número de procesos.
+    
+    Args:
+        task: Tupla (directorios, número de caso, n, semilla, bipartito, binario).
+    """
+    (kruskal_dir, prim_dir, bipartite_dir), case, n, seed, is_bipartite, binary = task
+    name = f"case_{case}"
+    
+    # Se genera el grafo ponderado y se escribe en ambos formatos de texto
+    edges = generate_gnp_edges(n, edge_probability=0.3, seed=seed)
+    csr = write_edge_cases(os.path.join(kruskal_dir, f"{name}.txt"), os.path.join(prim_dir, f"{name}.txt"), edges, n)
+    
+    # Se decide según el caso si generar un grafo bipartito o no
+    if is_bipartite:
+        bipartite_adj_list, partitions = generate_bipartite_graph(n, edge_probability=0.3, seed=seed + 3)
+    else:
+        bipartite_adj_list = generate_non_bipartite_graph(n, edge_probability=0.2, seed=seed + 3)
+        partitions = None
+    rows = [bipartite_adj_list[v] for v in range(n)]
+    _write_lines(os.path.join(bipartite_dir, f"{name}.txt"), iter_bipartite_lines(n, rows, partitions))
+    
+    # Formato binario: aristas para Kruskal y CSR para Prim y bipartición
+    if binary:
+        write_edges(os.path.join(kruskal_dir, f"{name}.bin"), edges, n)
+        write_csr(os.path.join(prim_dir, f"{name}.bin"), *csr)
+        write_csr(os.path.join(bipartite_dir, f"{name}.bin"), *_rows_to_csr(rows))
+
+def save_test_cases(test_dir, n_cases=100, workers=1, seed=None, binary=False):
     """
     Genera y guarda casos de prueba para los algoritmos implementados.
     
     Args:
         test_dir: Directorio donde se guardarán los casos de prueba.
         n_cases: Número de casos a generar.
+        workers: Número de procesos; con 1 los casos se generan en este proceso
+                 y con None se usa el número de núcleos.
+        seed: Semilla de la suite; si es None se toma del módulo random.
+        binary: Si es True, cada caso se guarda también en formato binario (case_i.bin).
     """
     # Se crean directorios si no existen
-    os.makedirs(os.path.join(test_dir, "problema2"), exist_ok=True)
-    os.makedirs(os.path.join(test_dir, "problema3"), exist_ok=True)
-    
-    # Se generan casos para Kruskal
     kruskal_dir = os.path.join(test_dir, "problema2", "kruskal")
-    os.makedirs(kruskal_dir, exist_ok=True)
-    
-    # Se generan casos para Prim
     prim_dir = os.path.join(test_dir, "problema2", "prim")
-    os.makedirs(prim_dir, exist_ok=True)
-    
-    # Se generan casos para verificación de grafo bipartito
     bipartite_dir = os.path.join(test_dir, "problema3", "bipartite")
-    os.makedirs(bipartite_dir, exist_ok=True)
+    for directory in (kruskal_dir, prim_dir, bipartite_dir):
+        os.makedirs(directory, exist_ok=True)
     
     # Se generan casos de diferentes tamaños
     sizes = [10, 20, 50, 100, 200, 500, 1000]
     
+    # Se sortean de antemano el tamaño, el tipo y la semilla de cada caso
+    rng = random.Random(_resolve_seed(seed))
+    tasks = []
     for i in range(n_cases):
-        # Se selecciona un tamaño aleatorio
-        n = random.choice(sizes)
-        
-        # Se generan grafos aleatorios
-        adj_list, adj_matrix = generate_random_weighted_graph(n, edge_probability=0.3)
-        
-        # Se guarda caso para Kruskal (lista de adyacencias)
-        with open(os.path.join(kruskal_dir, f"case_{i+1}.txt"), "w") as f:
-            f.write(f"{n}\n")
-            for v in range(n):
-                edges = []
-                for neighbor, weight in adj_list.get(v, []):
-                    edges.append(f"{neighbor}-{weight}")
-                f.write(f"{v}: {', '.join(edges)}\n")
-        
-        # Se guarda caso para Prim (matriz de adyacencias)
-        with open(os.path.join(prim_dir, f"case_{i+1}.txt"), "w") as f:
-            f.write(f"{n}\n")
-            for row in adj_matrix:
-                f.write(" ".join(map(str, row)) + "\n")
-        
-        # Se decide aleatoriamente si generar un grafo bipartito o no
-        is_bipartite = random.choice([True, False])
-        
-        if is_bipartite:
-            bipartite_adj_list, partitions = generate_bipartite_graph(n, edge_probability=0.3)
-        else:
-            bipartite_adj_list = generate_non_bipartite_graph(n, edge_probability=0.2)
-            partitions = None
-        
-        # Se guarda caso para verificación de grafo bipartito
-        with open(os.path.join(bipartite_dir, f"case_{i+1}.txt"), "w") as f:
-            f.write(f"{n}\n")
-            for v in range(n):
-                neighbors = bipartite_adj_list.get(v, [])
-                f.write(" ".join(map(str, neighbors)) + "\n")
-            
-            # Se escribe si el grafo es bipartito o no (para verificación)
-            f.write(f"IS_BIPARTITE: {is_bipartite}\n")
-            if is_bipartite:
-                f.write(f"PARTITION_A: {sorted(list(partitions[0]))}\n")
-                f.write(f"PARTITION_B: {sorted(list(partitions[1]))}\n")
+        n = rng.choice(sizes)
+        is_bipartite = rng.random() < 0.5
+        tasks.append(((kruskal_dir, prim_dir, bipartite_dir), i + 1, n, rng.getrandbits(62), is_bipartite, binary))
+    
+    if workers == 1:
+        for task in tasks:
+            _write_case(task)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Los casos grandes se reparten primero para equilibrar la carga
+        tasks.sort(key=lambda task: -task[2])
+        for _ in executor.map(_write_case, tasks):
+            pass
 
 if __name__ == "__main__":
     # Ejemplo de uso
     save_test_cases("tests", n_cases=10)
-    print("Se han generado 10 casos de prueba para cada problema.") 
\ No newline at end of file
+    print("Se han generado 10 casos de prueba para cada problema.")
@@ -0,0 +1,235 @@
+import mmap
+from array import array
+
+# NumPy es opcional: permite convertir cada bloque de texto con operaciones vectorizadas
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Tamaño aproximado (en bytes) de cada bloque de texto convertido
+TEXT_CHUNK = 1 << 18
+
+def _map_file(f):
+    # Se mapea el archivo en memoria como arreglo de bytes; el mapeo se libera
+    # junto con la última vista que lo referencia
+    return np.frombuffer(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), dtype=np.uint8)
+
+def _chunks(data, start):
+    """
+    Divide el texto en bloques de aproximadamente TEXT_CHUNK bytes.
+
+    Cada bloque termina en un espacio o salto de línea, de modo que ningún
+    número queda partido entre dos bloques.
+    """
+    size = len(data)
+    while start < size:
+        stop = min(size, start + TEXT_CHUNK)
+        while stop < size and data[stop] > 32:
+            stop += 1
+        yield start, data[start:stop]
+        start = stop
+
+def _token_spans(chunk):
+    # Se ubican el inicio y la longitud de cada número del bloque
+    filled = (chunk > 32).view(np.int8)
+    changes = np.diff(filled, prepend=0, append=0)
+    starts = np.flatnonzero(changes == 1)
+    return starts, np.flatnonzero(changes == -1) - starts
+
+def _token_values(chunk, starts, lengths):
+    """
+    Convierte los números de un bloque en enteros de 64 bits.
+
+    Los dígitos se acumulan por posición: en la pasada p se suma el p-ésimo
+    dígito de todos los números que lo tienen, de modo que el número de
+    pasadas es la longitud del número más largo y no la cantidad de números.
+
+    Raises:
+        ValueError: si algún número contiene un carácter que no es un dígito.
+    """
+    negative = chunk[starts] == 45
+    if negative.any():
+        starts = starts + negative
+        lengths = lengths - negative
+
+    values = np.zeros(len(starts), dtype=np.int64)
+    active = np.flatnonzero(lengths > 0)
+    if len(active) < len(starts):
+        raise ValueError("Número inválido en el archivo")
+    position = 0
+    while len(active):
+        digits = chunk[starts[active] + position] - 48
+        if (digits > 9).any():
+            raise ValueError("Número inválido en el archivo")
+        values[active] = values[active] * 10 + digits
+        position += 1
+        active = active[lengths[active] > position]
+
+    np.negative(values, out=values, where=negative)
+    return values
+
+def _read_matrix_values(data, start, count):
+    # Se convierten los primeros `count` números del texto sobre un solo arreglo
+    values = np.empty(count, dtype=np.int64)
+    filled = 0
+    for _, chunk in _chunks(data, start):
+        if filled == count:
+            break
+        starts, lengths = _token_spans(chunk)
+        # Se ignora lo que siga a los pesos de la matriz
+        size = min(len(starts), count - filled)
+        values[filled:filled + size] = _token_values(chunk, starts[:size], lengths[:size])
+        filled += size
+    if filled != count:
+        raise ValueError(f"Se esperaban {count} pesos y se leyeron {filled}")
+    return values
+
+def _read_rows(data, start, n):
+    """
+    Convierte las n filas de vecinos del texto en arreglos CSR.
+
+    Cada salto de línea cierra una fila, cuyo offset es la cantidad de
+    números leídos antes de él; lo que sigue a la n-ésima fila no se convierte.
+
+    Returns:
+        Tupla (offsets, targets, posición donde terminan las n filas).
+    """
+    offsets = np.zeros(n + 1, dtype=np.int32)
+    targets = array('i')
+    rows = 0
+    end = start if n == 0 else len(data)
+    for chunk_start, chunk in _chunks(data, start):
+        if rows == n:
+            break
+        starts, lengths = _token_spans(chunk)
+
+        newlines = np.flatnonzero(chunk == 10)[:n - rows]
+        counts = np.searchsorted(starts, newlines)
+        offsets[rows + 1:rows + 1 + len(newlines)] = counts + len(targets)
+        rows += len(newlines)
+        if rows == n:
+            end = chunk_start + int(newlines[-1]) + 1
+            starts, lengths = starts[:counts[-1]], lengths[:counts[-1]]
+
+        values = _token_values(chunk, starts, lengths)
+        if len(values) and (values.min() < 0 or values.max() >= n):
+            raise ValueError("Vértice fuera de rango en las filas de vecinos")
+        targets.frombytes(values.astype(np.int32).tobytes())
+
+    # Si el archivo termina antes, la última fila no tiene salto de línea y las
+    # filas restantes quedan vacías
+    offsets[rows + 1:] = len(targets)
+    column = array('i')
+    column.frombytes(offsets.tobytes())
+    return column, targets, end
+
+def read_adjacency_matrix(f):
+    """
+    Lee un grafo en formato de matriz de adyacencias (n y luego n filas de n pesos).
+
+    Con NumPy, el archivo se mapea en memoria y se convierte por bloques,
+    con operaciones vectorizadas, directamente sobre el arreglo final: no se
+    crea un objeto de Python por cada número ni una copia del texto.
+
+    Args:
+        f: Archivo abierto en modo binario, posicionado al inicio.
+
+    Returns:
+        Tupla (matriz, número de vértices). La matriz es un ndarray n x n de
+        enteros de 64 bits si NumPy está disponible, o una lista de listas.
+
+    Raises:
+        ValueError: si el archivo tiene menos de n x n pesos.
+    """
+    n = int(f.readline())
+
+    if np is None:
+        matrix = [list(map(int, f.readline().split())) for _ in range(n)]
+        return matrix, n
+
+    start = f.tell()
+    values = _read_matrix_values(_map_file(f), start, n * n)
+    return values.reshape(n, n), n
+
+def read_neighbor_lists(f):
+    """
+    Lee un grafo en formato de listas de vecinos, con sus líneas de verificación.
+
+    El formato tiene una línea con n, una fila de vecinos por vértice y, al
+    final, las líneas IS_BIPARTITE, PARTITION_A y PARTITION_B que escribe
+    `save_test_cases`. Con NumPy, el archivo se mapea en memoria y se
+    recorre una sola vez por bloques, convirtiendo todos los números de cada
+    bloque con operaciones vectorizadas. Las líneas de verificación, que
+    empiezan después de la n-ésima fila, se interpretan aparte.
+
+    Args:
+        f: Archivo abierto en modo binario, posicionado al inicio.
+
+    Returns:
+        Tupla ((offsets, targets), número de vértices, resultado esperado).
+        El resultado esperado es (es_bipartito, (particion_A, particion_B) o
+        None), o None si el archivo no tiene líneas de verificación.
+
+    Raises:
+        ValueError: si una fila contiene un vértice fuera de rango.
+    """
+    n = int(f.readline())
+
+    if np is None:
+        offsets = array('i', [0])
+        targets = array('i')
+        for _ in range(n):
+            targets.extend(map(int, f.readline().split()))
+            offsets.append(len(targets))
+        return (offsets, targets), n, parse_verification(f.read().splitlines())
+
+    start = f.tell()
+    data = _map_file(f)
+    offsets, targets, end = _read_rows(data, start, n)
+    return (offsets, targets), n, parse_verification(data[end:].tobytes().splitlines())
+
+def parse_verification(lines):
+    """
+    Interpreta las líneas de verificación de un caso de bipartición.
+
+    Args:
+        lines: Líneas (str o bytes) posteriores a las filas de vecinos.
+
+    Returns:
+        Tupla (es_bipartito, (particion_A, particion_B) o None), o None si no
+        hay una línea IS_BIPARTITE.
+    """
+    verdict = None
+    partitions = {}
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("ascii")
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        key = key.strip()
+        if key == "IS_BIPARTITE":
+            verdict = value.strip() == "True"
+        elif key in ("PARTITION_A", "PARTITION_B"):
+            partitions[key] = set(map(int, value.replace(",", " ").strip(" []\r\n").split()))
+
+    if verdict is None:
+        return None
+    if verdict and len(partitions) == 2:
+        return True, (partitions["PARTITION_A"], partitions["PARTITION_B"])
+    return verdict, None
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    test_file = "tests/problema3/bipartite/case_1.txt"
+
+    # Se leen las filas de vecinos y el resultado esperado en una sola pasada
+    with open(test_file, "rb") as f:
+        (offsets, targets), n, expected = read_neighbor_lists(f)
+    print(f"{n} vértices, {len(targets) // 2} aristas")
+    print("Resultado esperado:", "bipartito" if expected and expected[0] else "no bipartito")
+
+    with open("tests/problema2/prim/case_1.txt", "rb") as f:
+        matrix, n = read_adjacency_matrix(f)
+    print(f"Matriz de {n}x{n} leída")